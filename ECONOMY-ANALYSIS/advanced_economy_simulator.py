@@ -13,21 +13,33 @@ Key Features:
 - Multi-objective optimization support
 """
 
-import random
-import math
+import os
 import json
+import hashlib
 import csv
 import numpy as np
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple, Optional, Any
+from enum import IntEnum
+from typing import List, Dict, Tuple, Optional, Any, Callable, Union
 from datetime import datetime, timedelta
-import statistics
-from collections import defaultdict, Counter
 import itertools
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import multiprocessing as mp
 
-@dataclass
+try:
+    from numba import njit, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is not installed: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@dataclass(slots=True)
 class AdvancedGameConfig:
     """Advanced configuration parameters for comprehensive economy testing"""
     
@@ -126,7 +138,193 @@ class AdvancedGameConfig:
                 'casual': 0.70    # 70% casual
             }
 
-@dataclass
+    def scan_lookup_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Level multipliers and per-tier diminishing rates as gather-ready arrays"""
+        level_multipliers = np.asarray(self.level_multipliers, dtype=np.float64)
+        rates = list(self.diminishing_rates)
+        # Pad to the three tiers the scan kernel indexes
+        diminishing_rates = np.asarray(rates + rates[-1:] * (3 - len(rates)), dtype=np.float64)
+        return level_multipliers, diminishing_rates
+
+# === ENCODINGS FOR STRUCTURE-OF-ARRAYS STORAGE ===
+class PlayerType(IntEnum):
+    """Player type codes, as stored in the int8 type_code column"""
+    WHALE = 0
+    GRINDER = 1
+    CASUAL = 2
+
+WHALE, GRINDER, CASUAL = PlayerType
+PLAYER_TYPES = tuple(player_type.name.lower() for player_type in PlayerType)  # Names for JSON/export only
+PLAYER_TYPE_CODES = {name: PlayerType(code) for code, name in enumerate(PLAYER_TYPES)}
+
+# Behaviour constants per player type, indexed by type code. Each purchase places
+# min(packs * stickers_per_pack, cap) new stickers.
+TYPE_PARAMS = np.array([
+    # scans/day  reinvest  ----- occasional pack purchase -----  --- weekly $ top-up ---  before  organic
+    #  min  max   cap      period  prob  packs  points  per  cap    min    max   cap      scans
+    (5, 12, 0, 7, 0.8, 1, 3, False, 2, 6, 6.0, 12.0, 8, True, False),     # whale
+    (15, 25, 6, 21, 0.2, 1, 1, True, 3, 3, 0.0, 0.0, 0, False, True),     # grinder
+    (3, 8, 4, 28, 0.3, 1, 1, False, 2, 2, 0.0, 0.0, 0, False, True),      # casual
+], dtype=[
+    ('scans_min', np.int32), ('scans_max', np.int32),
+    ('reinvest_sticker_cap', np.int32),  # Weekly 10%-of-points reinvestment; 0 = never
+    ('pack_period', np.int32), ('pack_probability', np.float64),
+    ('packs_min', np.int32), ('packs_max', np.int32),
+    ('pack_with_points', np.bool_),  # Pay pack_price_points instead of dollars
+    ('stickers_per_pack', np.int32), ('pack_sticker_cap', np.int32),
+    ('topup_min', np.float64), ('topup_max', np.float64), ('topup_sticker_cap', np.int32),
+    ('buys_before_scans', np.bool_),
+    ('organic', np.bool_),  # Counts towards organic_purchases
+])
+
+VENUE_CATEGORIES = ("campus", "coffee", "library", "park", "restaurant", "general")
+VENUE_CODES = {name: code for code, name in enumerate(VENUE_CATEGORIES)}
+PLACEMENT_VENUES = VENUE_CATEGORIES[:5]  # Venues players place new stickers at
+
+METERS_PER_DEGREE = 111000  # Flat-earth conversion used for geo diversity distances
+
+# Bonus type reported for a scan, in precedence order
+BONUS_TYPES = ("base", "unique", "geo_diversity", "venue_variety", "new_player", "streak", "comeback", "event")
+
+@njit(cache=True, fastmath=True)
+def scan_points_kernel(sticker_level, sticker_value, sticker_scans_today, sticker_unique_scans_today,
+                       new_player_active, streak_active, comeback_active,
+                       geo_eligible, venue_code, venues_mask, event_active, scan_params):
+    """Scalar scan scoring kernel; returns (scanner_points, owner_points, bonus type code)
+
+    `scan_params` is the tuple built by AdvancedFYNDRSimulator.build_scan_params; bonus
+    entries are the extra fraction each bonus adds (multiplier - 1.0).
+    """
+    (scanner_base_points, owner_base_points, level_multipliers, max_level_index,
+     diminishing_threshold, diminishing_rates, unique_scanner_bonus, geo_diversity_bonus, venue_variety_bonus,
+     new_player_bonus, streak_bonus, comeback_bonus, event_bonus) = scan_params
+
+    # Level multiplier and sticker value (lookup clamped to the top level)
+    level_mult = level_multipliers[min(sticker_level - 1, max_level_index)]
+    base_scanner_points = scanner_base_points * level_mult * sticker_value
+    base_owner_points = owner_base_points * level_mult * sticker_value
+
+    # Diminishing returns for sticker: tier = completed thresholds today, capped at the last rate
+    tier = min(sticker_scans_today // diminishing_threshold, 2) if diminishing_threshold > 0 else 2
+    owner_multiplier = diminishing_rates[tier]
+
+    unique = unique_scanner_bonus if sticker_unique_scans_today == 0 else 0.0
+    geo = geo_diversity_bonus if geo_eligible else 0.0
+    venue = venue_variety_bonus if (venues_mask >> venue_code) & 1 == 0 else 0.0
+    new_player = new_player_bonus if new_player_active else 0.0
+    streak = streak_bonus if streak_active else 0.0
+    comeback = comeback_bonus if comeback_active else 0.0
+    event = event_bonus if event_active else 0.0
+
+    total_bonus = unique + geo + venue + new_player + streak + comeback + event
+    scanner_points = base_scanner_points * (1 + total_bonus)
+    owner_points = base_owner_points * owner_multiplier * (1 + total_bonus)
+
+    if unique > 0:
+        bonus_code = 1
+    elif geo > 0:
+        bonus_code = 2
+    elif venue > 0:
+        bonus_code = 3
+    elif new_player > 0:
+        bonus_code = 4
+    elif streak > 0:
+        bonus_code = 5
+    elif comeback > 0:
+        bonus_code = 6
+    elif event > 0:
+        bonus_code = 7
+    else:
+        bonus_code = 0
+    return scanner_points, owner_points, bonus_code
+
+@njit(cache=True)
+def score_scans_kernel(scanner_ids, sticker_ids, geo_eligible, event_active,
+                       sticker_level, sticker_value, sticker_scans_today, sticker_unique_scans_today,
+                       sticker_venue, player_new_active, player_streak_active, player_comeback_active,
+                       player_venues_mask, scan_params,
+                       scanner_points_out, owner_points_out):
+    """Score a day's scans in order, updating the per-sticker daily counters and venue masks in place"""
+    for i in range(len(scanner_ids)):
+        scanner_id = scanner_ids[i]
+        sticker_id = sticker_ids[i]
+        venue_code = sticker_venue[sticker_id]
+        scanner_points, owner_points, _ = scan_points_kernel(
+            sticker_level[sticker_id], sticker_value[sticker_id],
+            sticker_scans_today[sticker_id], sticker_unique_scans_today[sticker_id],
+            player_new_active[scanner_id], player_streak_active[scanner_id],
+            player_comeback_active[scanner_id],
+            geo_eligible[i], venue_code, player_venues_mask[scanner_id], event_active,
+            scan_params
+        )
+        scanner_points_out[i] = scanner_points
+        owner_points_out[i] = owner_points
+
+        sticker_scans_today[sticker_id] += 1
+        sticker_unique_scans_today[sticker_id] = 1
+        player_venues_mask[scanner_id] |= np.uint32(1 << venue_code)
+
+@njit(cache=True)
+def first_pair_scan_kernel(scanner_ids, sticker_ids, n_stickers):
+    """Mask of each (scanner, sticker) pair's first scan, for scans grouped contiguously by scanner
+
+    Tracks the last scanner seen per sticker, so it is O(scans + stickers) with no sort.
+    """
+    last_scanner = np.full(n_stickers, -1, dtype=np.int64)
+    first = np.empty(len(scanner_ids), dtype=np.bool_)
+    for i in range(len(scanner_ids)):
+        sticker_id = sticker_ids[i]
+        first[i] = last_scanner[sticker_id] != scanner_ids[i]
+        last_scanner[sticker_id] = scanner_ids[i]
+    return first
+
+@njit(cache=True)
+def player_day_kernel(is_active, churn_draws, churn_probability, type_code, churned_by_type,
+                      total_days_active, consecutive_days_active, max_consecutive_days,
+                      days_since_last_activity, is_new_player, new_player_bonus_remaining):
+    """Apply one day of churn and activity tracking to every player in place
+
+    Returns the net change in the active players' summed consecutive_days_active.
+    """
+    consecutive_delta = 0
+    for i in range(len(churn_draws)):
+        if not is_active[i]:
+            continue
+        if churn_draws[i] < churn_probability[i]:
+            is_active[i] = False
+            churned_by_type[type_code[i]] += 1
+            consecutive_delta -= consecutive_days_active[i]
+            continue
+
+        total_days_active[i] += 1
+        consecutive_days_active[i] += 1
+        if consecutive_days_active[i] > max_consecutive_days[i]:
+            max_consecutive_days[i] = consecutive_days_active[i]
+        days_since_last_activity[i] = 0
+
+        if is_new_player[i] and new_player_bonus_remaining[i] > 0:
+            new_player_bonus_remaining[i] -= 1
+            if new_player_bonus_remaining[i] == 0:
+                is_new_player[i] = False
+        consecutive_delta += 1
+    return consecutive_delta
+
+@njit(cache=True)
+def economy_totals_kernel(is_active, type_code, money_spent, total_points, level, type_counts, type_revenue):
+    """One pass over the active players: fills per-type counts/revenue, returns (total_points, level_sum)"""
+    points_sum = 0.0
+    level_sum = 0
+    for i in range(len(type_code)):
+        if not is_active[i]:
+            continue
+        code = type_code[i]
+        type_counts[code] += 1
+        type_revenue[code] += money_spent[i]
+        points_sum += total_points[i]
+        level_sum += level[i]
+    return points_sum, level_sum
+
+@dataclass(slots=True)
 class AdvancedPlayer:
     """Enhanced player model with retention and engagement tracking"""
     id: int
@@ -143,7 +341,7 @@ class AdvancedPlayer:
     venues_visited_this_week: set = None
     last_scan_locations: Dict[int, Tuple[float, float]] = None
     last_scan_times: Dict[int, int] = None  # sticker_id -> last_scan_day
-    
+
     # === RETENTION TRACKING ===
     days_since_last_activity: int = 0
     total_days_active: int = 0
@@ -151,18 +349,18 @@ class AdvancedPlayer:
     max_consecutive_days: int = 0
     is_active: bool = True
     churn_probability: float = 0.001
-    
+
     # === ENGAGEMENT METRICS ===
     total_scans: int = 0
     total_unique_scans: int = 0
     total_revenue_generated: float = 0.0  # Revenue from their stickers being scanned
     last_scan_day: int = 0
     last_purchase_day: int = 0
-    
+
     # === NEW PLAYER TRACKING ===
     is_new_player: bool = True
     new_player_bonus_remaining: int = 7
-    
+
     def __post_init__(self):
         if self.venues_visited_this_week is None:
             self.venues_visited_this_week = set()
@@ -171,7 +369,7 @@ class AdvancedPlayer:
         if self.last_scan_times is None:
             self.last_scan_times = {}
 
-@dataclass
+@dataclass(slots=True)
 class AdvancedSticker:
     """Enhanced sticker model with decay and value tracking"""
     id: int
@@ -184,612 +382,1060 @@ class AdvancedSticker:
     total_scans: int = 0
     daily_earnings: float = 0.0
     is_active: bool = True
-    
+
     # === VALUE TRACKING ===
     base_value: float = 1.0
     current_value: float = 1.0
     total_earnings: float = 0.0
 
+class ColumnTable:
+    """Growable structure-of-arrays table; every column is a NumPy array indexed by row id"""
+
+    # (column name, dtype, default value) triples, defined by subclasses
+    COLUMNS: Tuple[Tuple[str, Any, Any], ...] = ()
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.capacity = max(int(capacity), 1)
+        for name, dtype, default in self.COLUMNS:
+            setattr(self, name, np.full(self.capacity, default, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, min_capacity: int):
+        """Reallocate every column with doubled capacity (amortized O(1) appends)"""
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+        for name, dtype, default in self.COLUMNS:
+            column = np.full(new_capacity, default, dtype=dtype)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+        self.capacity = new_capacity
+
+    def reserve(self, capacity: int):
+        """Ensure room for at least `capacity` rows without further reallocation"""
+        if capacity > self.capacity:
+            self._grow(capacity)
+
+    def allocate(self, count: int = 1) -> slice:
+        """Reserve `count` rows initialised to the column defaults and return their slice"""
+        start = self.size
+        if start + count > self.capacity:
+            self._grow(start + count)
+        self.size += count
+        return slice(start, start + count)
+
+    def clear(self):
+        """Drop every row, keeping the allocated capacity for reuse"""
+        for name, _, default in self.COLUMNS:
+            getattr(self, name)[:self.size] = default
+        self.size = 0
+
+    def row(self, row_id: int) -> Dict[str, Any]:
+        """Return one row as a dict of plain Python values"""
+        return {name: getattr(self, name)[row_id].item() for name, _, _ in self.COLUMNS}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """All rows as a list of dicts (for JSON export)"""
+        return [self.row(row_id) for row_id in range(self.size)]
+
+class PlayerTable(ColumnTable):
+    """Player state stored as parallel arrays indexed by player id"""
+
+    COLUMNS = (
+        ('type_code', np.int8, WHALE),
+        ('level', np.int32, 1),
+        ('total_points', np.float64, 0.0),
+        ('daily_points', np.float64, 0.0),
+        ('weekly_points', np.float64, 0.0),
+        ('stickers_owned', np.int32, 0),
+        ('stickers_placed', np.int32, 0),
+        ('money_spent', np.float64, 0.0),
+        ('scans_today', np.int32, 0),
+        ('unique_scans_today', np.int32, 0),
+        ('venues_visited_mask', np.uint32, 0),  # Bit i set = VENUE_CATEGORIES[i] visited (cleared daily for active players)
+
+        # === RETENTION TRACKING ===
+        ('days_since_last_activity', np.int32, 0),
+        ('total_days_active', np.int32, 0),
+        ('consecutive_days_active', np.int32, 0),
+        ('max_consecutive_days', np.int32, 0),
+        ('is_active', np.bool_, True),
+        ('churn_probability', np.float64, 0.001),
+
+        # === ENGAGEMENT METRICS ===
+        ('total_scans', np.int64, 0),
+        ('total_unique_scans', np.int64, 0),
+        ('total_revenue_generated', np.float64, 0.0),
+        ('last_scan_day', np.int32, 0),
+        ('last_purchase_day', np.int32, 0),
+        ('last_scan_lat', np.float32, np.nan),  # Location of the most recent scan (NaN = none yet)
+        ('last_scan_lon', np.float32, np.nan),
+
+        # === NEW PLAYER TRACKING ===
+        ('is_new_player', np.bool_, True),
+        ('new_player_bonus_remaining', np.int32, 7),
+    )
+
+    @property
+    def active_mask(self) -> np.ndarray:
+        """Boolean view over the active flag of all allocated players"""
+        return self.is_active[:self.size]
+
+    def type_mask(self, type_code: int) -> np.ndarray:
+        """Boolean mask of allocated players with the given type code"""
+        return self.type_code[:self.size] == type_code
+
+class StickerTable(ColumnTable):
+    """Sticker state stored as parallel arrays indexed by sticker id"""
+
+    COLUMNS = (
+        ('owner_id', np.int32, 0),
+        ('level', np.int32, 1),
+        ('lat', np.float64, 0.0),
+        ('lon', np.float64, 0.0),
+        ('venue_code', np.int8, VENUE_CODES['general']),
+        ('scans_today', np.int32, 0),
+        ('unique_scans_today', np.int32, 0),
+        ('total_scans', np.int64, 0),
+        ('daily_earnings', np.float64, 0.0),
+        ('is_active', np.bool_, True),
+
+        # === VALUE TRACKING ===
+        ('base_value', np.float64, 1.0),
+        ('current_value', np.float64, 1.0),
+        ('total_earnings', np.float64, 0.0),
+    )
+
+    @property
+    def active_mask(self) -> np.ndarray:
+        """Boolean view over the active flag of all allocated stickers"""
+        return self.is_active[:self.size]
+
+class DailyStatsTable(ColumnTable):
+    """One row of telemetry per simulated day, written by collect_daily_stats"""
+
+    COLUMNS = (
+        ('day', np.int32, 0),
+        ('total_players', np.int64, 0),
+        ('total_players_ever', np.int64, 0),
+        ('churned_players', np.int64, 0),
+        ('retained_players', np.int64, 0),
+        ('retention_rate', np.float64, 0.0),
+        ('new_players_today', np.int64, 0),
+        ('returning_players_today', np.int64, 0),
+        ('total_stickers', np.int64, 0),
+        ('total_scans', np.int64, 0),
+        ('total_points_earned', np.float64, 0.0),
+        ('total_revenue', np.float64, 0.0),
+        ('organic_purchases', np.int64, 0),
+        ('whale_purchases', np.int64, 0),
+        ('grinder_purchases', np.int64, 0),
+        ('casual_purchases', np.int64, 0),
+        ('whale_count', np.int64, 0),
+        ('grinder_count', np.int64, 0),
+        ('casual_count', np.int64, 0),
+        ('avg_points_per_player', np.float64, 0.0),
+        ('avg_scans_per_player', np.float64, 0.0),
+        ('avg_consecutive_days', np.float64, 0.0),
+        ('event_active', np.bool_, False),
+
+        # === POPULATION & SPREAD METRICS ===
+        ('total_population', np.int64, 0),
+        ('population_density', np.float64, 0.0),
+        ('max_possible_players', np.int64, 0),
+        ('population_penetration_rate', np.float64, 0.0),
+        ('viral_recruits_today', np.int64, 0),
+        ('organic_new_players_today', np.int64, 0),
+        ('population_cap_reached', np.bool_, False),
+    )
+
+# Simulator seed: an int/SeedSequence seeds a fresh stream, a Generator is used as-is, None = fresh entropy
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
 class AdvancedFYNDRSimulator:
     """Advanced simulator for long-term economy analysis"""
-    
-    def __init__(self, config: AdvancedGameConfig):
+
+    def __init__(self, config: AdvancedGameConfig, seed: Seed = 0):
+        """Create a simulator; runs with the same config and seed reproduce exactly (None = fresh entropy)
+
+        Every random draw comes from one NumPy Generator in per-day batches; pass a Generator
+        as `seed` to share a caller's stream.
+        """
+        self.players = PlayerTable()
+        self.stickers = StickerTable()
+        self.daily_stats = DailyStatsTable(capacity=366)
+        self.reset(config, seed)
+
+    def reset(self, config: AdvancedGameConfig, seed: Seed = 0):
+        """Return to a fresh state for `config`, reusing the table allocations of earlier runs
+
+        A reset simulator behaves exactly like AdvancedFYNDRSimulator(config, seed).
+        """
         self.config = config
-        self.players: Dict[int, AdvancedPlayer] = {}
-        self.stickers: Dict[int, AdvancedSticker] = {}
-        self.scan_events: List = []
+        self.rng = np.random.default_rng(seed)
+        self.players.clear()
+        self.stickers.clear()
+        self.daily_stats.clear()
+        self.scans_today_counter = 0
+        self.total_scans = 0
         self.current_day = 0
         self.current_week = 0
-        self.daily_stats = []
+        self._event_active_today = False
         self.weekly_stats = []
-        
+
+        # Per-type churn probabilities, indexed by type code
+        self._churn_by_type = np.array([self.config.churn_probability_whale,
+                                        self.config.churn_probability_grinder,
+                                        self.config.churn_probability_casual])
+
+        # Config constants for the scan kernels
+        self.scan_params = self.build_scan_params()
+        self._geo_radius_deg_sq = (self.config.geo_diversity_radius / METERS_PER_DEGREE) ** 2
+
+        # day -> sorted (player_id << 32 | sticker_id) keys scanned that day, kept only while
+        # the day is still inside the per-sticker cooldown window
+        self.recent_scan_keys: Dict[int, np.ndarray] = {}
+
+        # Cached ids of active players; invalidated whenever players are added or churn
+        self._active_player_ids = np.empty(0, dtype=np.intp)
+        self._active_player_ids_dirty = True
+
+        # Cached ids of active stickers; invalidated whenever a sticker is created or deactivated
+        self._active_sticker_ids = np.empty(0, dtype=np.intp)
+        self._active_sticker_ids_dirty = True
+        self._active_sticker_count = 0
+
+        # Last get_economy_summary result; invalidated by anything that changes player/sticker state
+        self._summary_cache: Optional[Dict] = None
+        self._summary_dirty = True
+
         # === RETENTION TRACKING ===
         self.total_players_ever = 0
+        self._n_active = 0  # Running active-player counts, kept in step with players.is_active
+        self._n_active_by_type = np.zeros(len(PLAYER_TYPES), dtype=np.int64)
+
+        # Running totals over active players behind the daily-stats averages, updated as state changes
+        self._consecutive_days_total = 0
+        self._active_scans_today = 0
+        self._active_points_today = 0.0
         self.churned_players = 0
         self.retained_players = 0
-        
+
         # === GROWTH TRACKING ===
         self.new_players_today = 0
         self.returning_players_today = 0
-        
+
         # === ECONOMY TRACKING ===
         self.total_revenue = 0.0
         self.organic_purchases = 0
         self.whale_purchases = 0
         self.grinder_purchases = 0
         self.casual_purchases = 0
-        
+
         # === POPULATION & SPREAD TRACKING ===
         self.viral_recruits_today = 0
         self.organic_new_players_today = 0
         self.max_possible_players = int(self.config.total_population * self.config.viral_spread_cap_percentage)
-    
+
+        # Size the tables for the population cap up front so viral growth rarely reallocates
+        self.players.reserve(self.max_possible_players)
+        self.stickers.reserve(2 * self.max_possible_players)
+
     def add_player(self, player_type: str, level: int = 1, is_new: bool = True) -> int:
         """Add a new player to the simulation"""
-        player_id = len(self.players) + 1
-        self.total_players_ever += 1
-        
-        player = AdvancedPlayer(
+        type_code = PLAYER_TYPE_CODES.get(player_type, CASUAL)
+        return int(self.add_players_bulk(np.array([type_code]), level=level, is_new=is_new)[0])
+
+    def add_players_bulk(self, type_codes: np.ndarray, level: int = 1, is_new: bool = True) -> np.ndarray:
+        """Add one player per entry of `type_codes` in a single insert; returns their ids"""
+        type_codes = np.asarray(type_codes, dtype=np.int8)
+        count = len(type_codes)
+        rows = self.players.allocate(count)
+        self.total_players_ever += count
+        self._n_active += count
+        self._n_active_by_type += np.bincount(type_codes, minlength=len(PLAYER_TYPES))
+        self._active_player_ids_dirty = True
+        self._summary_dirty = True
+
+        players = self.players
+        players.type_code[rows] = type_codes
+        players.level[rows] = level
+        players.is_new_player[rows] = is_new
+        players.new_player_bonus_remaining[rows] = 7 if is_new else 0
+
+        # Churn probability by player type, as one table lookup
+        players.churn_probability[rows] = self._churn_by_type[type_codes]
+
+        return np.arange(rows.start, rows.stop)
+
+    def add_sticker(self, owner_id: int, location: Tuple[float, float],
+                   venue_category: str = "general", level: int = 1) -> int:
+        """Add a new sticker to the simulation"""
+        sticker_id = self.stickers.allocate(1).start
+        stickers = self.stickers
+        stickers.owner_id[sticker_id] = owner_id
+        stickers.level[sticker_id] = level
+        stickers.lat[sticker_id], stickers.lon[sticker_id] = location
+        stickers.venue_code[sticker_id] = VENUE_CODES[venue_category]
+        self.players.stickers_owned[owner_id] += 1
+        self._active_sticker_count += 1
+        self._active_sticker_ids_dirty = True
+        self._summary_dirty = True
+        return sticker_id
+
+    def add_stickers_bulk(self, owner_id: int, count: int, level: Optional[int] = None) -> np.ndarray:
+        """Place `count` new stickers for a player at random locations and venues; returns their ids"""
+        if level is None:
+            level = int(self.players.level[owner_id])
+        return self.place_stickers(np.array([owner_id]), np.array([count]), np.array([level]))
+
+    def place_stickers(self, owner_ids: np.ndarray, counts: np.ndarray,
+                       levels: Optional[np.ndarray] = None) -> np.ndarray:
+        """Place counts[i] random stickers for each owner_ids[i] in one insert; returns the new ids"""
+        owners = np.repeat(owner_ids, counts)
+        total = len(owners)
+        if total == 0:
+            return np.empty(0, dtype=np.intp)
+        if levels is None:
+            levels = self.players.level[owner_ids]
+        rows = self.stickers.allocate(total)
+        locations = self.rng.uniform((40.0, -74.0), (41.0, -73.0), size=(total, 2))
+        stickers = self.stickers
+        stickers.owner_id[rows] = owners
+        stickers.level[rows] = np.repeat(levels, counts)
+        stickers.lat[rows] = locations[:, 0]
+        stickers.lon[rows] = locations[:, 1]
+        stickers.venue_code[rows] = self.rng.integers(0, len(PLACEMENT_VENUES), total)
+        np.add.at(self.players.stickers_owned, owner_ids, counts)
+        self._active_sticker_count += total
+        self._active_sticker_ids_dirty = True
+        self._summary_dirty = True
+        return np.arange(rows.start, rows.stop)
+
+    def deactivate_sticker(self, sticker_id: int):
+        """Take a sticker out of play"""
+        if self.stickers.is_active[sticker_id]:
+            self.stickers.is_active[sticker_id] = False
+            self._active_sticker_count -= 1
+            self._active_sticker_ids_dirty = True
+            self._summary_dirty = True
+
+    @property
+    def active_player_ids(self) -> np.ndarray:
+        """Ids of all active players, rebuilt only after players join or churn"""
+        if self._active_player_ids_dirty:
+            self._active_player_ids = np.flatnonzero(self.players.active_mask)
+            self._active_player_ids_dirty = False
+        return self._active_player_ids
+
+    @property
+    def active_sticker_ids(self) -> np.ndarray:
+        """Ids of all active stickers, rebuilt only after the sticker set changes"""
+        if self._active_sticker_ids_dirty:
+            self._active_sticker_ids = np.flatnonzero(self.stickers.active_mask)
+            self._active_sticker_ids_dirty = False
+        return self._active_sticker_ids
+
+    def get_player(self, player_id: int) -> AdvancedPlayer:
+        """Materialize one player's state as an AdvancedPlayer record (for inspection/export)"""
+        row = self.players.row(player_id)
+        player_type = PLAYER_TYPES[row.pop('type_code')]
+        venues_mask = row.pop('venues_visited_mask')
+        row.pop('last_scan_lat')
+        row.pop('last_scan_lon')
+        # Only scans still inside the cooldown window are retained
+        last_scan_times = {}
+        for day, keys in sorted(self.recent_scan_keys.items()):
+            for key in keys[(keys >> 32) == player_id].tolist():
+                last_scan_times[key & 0xFFFFFFFF] = day
+        return AdvancedPlayer(
             id=player_id,
             player_type=player_type,
-            level=level,
-            is_new_player=is_new,
-            new_player_bonus_remaining=7 if is_new else 0
+            venues_visited_this_week={venue for code, venue in enumerate(VENUE_CATEGORIES) if venues_mask >> code & 1},
+            last_scan_times=last_scan_times,
+            **row
         )
-        
-        # Set churn probability based on player type
-        if player_type == "whale":
-            player.churn_probability = self.config.churn_probability_whale
-        elif player_type == "grinder":
-            player.churn_probability = self.config.churn_probability_grinder
-        else:
-            player.churn_probability = self.config.churn_probability_casual
-        
-        self.players[player_id] = player
-        return player_id
-    
-    def add_sticker(self, owner_id: int, location: Tuple[float, float], 
-                   venue_category: str = "general", level: int = 1) -> int:
-        """Add a new sticker to the simulation"""
-        sticker_id = len(self.stickers) + 1
-        sticker = AdvancedSticker(
-            id=sticker_id,
-            owner_id=owner_id,
-            level=level,
-            location=location,
-            venue_category=venue_category
+
+    def get_sticker(self, sticker_id: int) -> AdvancedSticker:
+        """Materialize one sticker's state as an AdvancedSticker record (for inspection/export)"""
+        row = self.stickers.row(sticker_id)
+        location = (row.pop('lat'), row.pop('lon'))
+        venue_category = VENUE_CATEGORIES[row.pop('venue_code')]
+        return AdvancedSticker(id=sticker_id, location=location, venue_category=venue_category, **row)
+
+    def calculate_distance(self, loc1, loc2):
+        """Calculate distance between two locations (or arrays of locations) in meters"""
+        return np.hypot(np.subtract(loc1[0], loc2[0]), np.subtract(loc1[1], loc2[1])) * METERS_PER_DEGREE
+
+    def build_scan_params(self) -> tuple:
+        """Pack the scoring constants from the config into the tuple the scan kernels take"""
+        config = self.config
+        level_multipliers, diminishing_rates = config.scan_lookup_tables()
+        return (
+            float(config.scanner_base_points), float(config.owner_base_points),
+            level_multipliers, len(level_multipliers) - 1,
+            int(config.diminishing_threshold), diminishing_rates,
+            float(config.unique_scanner_bonus), float(config.geo_diversity_bonus),
+            float(config.venue_variety_bonus), float(config.new_player_bonus_multiplier - 1.0),
+            float(config.streak_bonus_multiplier - 1.0), float(config.comeback_bonus_multiplier - 1.0),
+            float(config.event_bonus_multiplier - 1.0),
         )
-        self.stickers[sticker_id] = sticker
-        self.players[owner_id].stickers_owned += 1
-        return sticker_id
-    
-    def calculate_distance(self, loc1: Tuple[float, float], loc2: Tuple[float, float]) -> float:
-        """Calculate distance between two locations in meters"""
-        return math.sqrt((loc1[0] - loc2[0])**2 + (loc1[1] - loc2[1])**2) * 111000
-    
-    def calculate_scan_points(self, scanner: AdvancedPlayer, sticker: AdvancedSticker, 
-                            scan_location: Tuple[float, float]) -> Tuple[float, str, float]:
-        """Calculate points earned from a scan with advanced mechanics"""
-        base_scanner_points = self.config.scanner_base_points
-        base_owner_points = self.config.owner_base_points
-        
-        # Apply level multiplier
-        level_mult = self.config.level_multipliers[min(sticker.level - 1, len(self.config.level_multipliers) - 1)]
-        base_scanner_points *= level_mult
-        base_owner_points *= level_mult
-        
-        # Apply sticker decay
-        sticker_value_mult = sticker.current_value
-        base_scanner_points *= sticker_value_mult
-        base_owner_points *= sticker_value_mult
-        
-        # Diminishing returns for sticker
-        if sticker.scans_today < self.config.diminishing_threshold:
-            owner_multiplier = self.config.diminishing_rates[0]
-        elif sticker.scans_today < self.config.diminishing_threshold * 2:
-            owner_multiplier = self.config.diminishing_rates[1]
-        else:
-            owner_multiplier = self.config.diminishing_rates[2]
-        
-        # Unique scanner bonus
-        unique_bonus = 0.0
-        if sticker.unique_scans_today == 0:
-            unique_bonus = self.config.unique_scanner_bonus
-        
-        # Geo diversity bonus
-        geo_bonus = 0.0
-        if sticker.id in scanner.last_scan_locations:
-            last_location = scanner.last_scan_locations[sticker.id]
-            distance = self.calculate_distance(last_location, scan_location)
-            if distance > self.config.geo_diversity_radius:
-                geo_bonus = self.config.geo_diversity_bonus
-        
-        # Venue variety bonus
-        venue_bonus = 0.0
-        if sticker.venue_category not in scanner.venues_visited_this_week:
-            venue_bonus = self.config.venue_variety_bonus
-        
-        # New player bonus
-        new_player_bonus = 0.0
-        if scanner.is_new_player and scanner.new_player_bonus_remaining > 0:
-            new_player_bonus = self.config.new_player_bonus_multiplier - 1.0
-        
-        # Streak bonus
-        streak_bonus = 0.0
-        if scanner.consecutive_days_active >= self.config.streak_bonus_days:
-            streak_bonus = self.config.streak_bonus_multiplier - 1.0
-        
-        # Comeback bonus
-        comeback_bonus = 0.0
-        if scanner.days_since_last_activity >= self.config.comeback_bonus_days:
-            comeback_bonus = self.config.comeback_bonus_multiplier - 1.0
-        
-        # Event bonus
-        event_bonus = 0.0
-        if self.is_event_active():
-            event_bonus = self.config.event_bonus_multiplier - 1.0
-        
-        # Calculate total points
-        total_bonus = unique_bonus + geo_bonus + venue_bonus + new_player_bonus + streak_bonus + comeback_bonus + event_bonus
-        scanner_points = base_scanner_points * (1 + total_bonus)
-        owner_points = base_owner_points * owner_multiplier * (1 + total_bonus)
-        
-        bonus_type = "base"
-        if unique_bonus > 0:
-            bonus_type = "unique"
-        elif geo_bonus > 0:
-            bonus_type = "geo_diversity"
-        elif venue_bonus > 0:
-            bonus_type = "venue_variety"
-        elif new_player_bonus > 0:
-            bonus_type = "new_player"
-        elif streak_bonus > 0:
-            bonus_type = "streak"
-        elif comeback_bonus > 0:
-            bonus_type = "comeback"
-        elif event_bonus > 0:
-            bonus_type = "event"
-        
+
+    @staticmethod
+    def scan_pair_keys(scanner_ids: np.ndarray, sticker_ids: np.ndarray) -> np.ndarray:
+        """Pack (player_id, sticker_id) pairs into single int64 keys"""
+        return (np.asarray(scanner_ids, dtype=np.int64) << 32) | np.asarray(sticker_ids, dtype=np.int64)
+
+    def in_scan_cooldown(self, pair_keys: np.ndarray) -> np.ndarray:
+        """Flag pairs scanned on an earlier day that is still within the per-sticker cooldown"""
+        cooldown_days = self.config.sticker_scan_cooldown_hours / 24.0
+        blocked = np.zeros(len(pair_keys), dtype=bool)
+        for day, keys in self.recent_scan_keys.items():
+            if day < self.current_day and self.current_day - day < cooldown_days:
+                blocked |= np.isin(pair_keys, keys, assume_unique=False)
+        return blocked
+
+    def record_scan_keys(self, pair_keys: np.ndarray):
+        """Remember today's scanned pairs and evict days that can no longer block a scan
+
+        Today's pairs are always kept, since simulate_scan checks them for same-day repeats; with
+        a cooldown of a day or less every earlier day is evicted, as none can reach today's scans.
+        """
+        cooldown_days = self.config.sticker_scan_cooldown_hours / 24.0
+        today = self.recent_scan_keys.get(self.current_day)
+        if today is not None:
+            pair_keys = np.concatenate([today, pair_keys])
+        pair_keys = np.sort(pair_keys)
+        self.recent_scan_keys[self.current_day] = pair_keys[np.r_[True, pair_keys[1:] != pair_keys[:-1]]]
+        for day in [d for d in self.recent_scan_keys if self.current_day + 1 - d >= cooldown_days and d != self.current_day]:
+            del self.recent_scan_keys[day]
+
+    def geo_diversity_mask(self, last_lats: np.ndarray, last_lons: np.ndarray,
+                           scan_lats: np.ndarray, scan_lons: np.ndarray) -> np.ndarray:
+        """Flag which of a batch of scans are far enough from the scanner's previous scan location"""
+        # Compare squared distances in degrees against the squared radius to skip the sqrt;
+        # NaN (never scanned before) compares False
+        dlat = last_lats - scan_lats
+        dlon = last_lons - scan_lons
+        return dlat * dlat + dlon * dlon > self._geo_radius_deg_sq
+
+    def _geo_bonus_applies(self, loc1: Tuple[float, float], loc2: Tuple[float, float]) -> bool:
+        """Scalar geo diversity check: are two locations further apart than the bonus radius?"""
+        dx = loc1[0] - loc2[0]
+        dy = loc1[1] - loc2[1]
+        return bool(dx * dx + dy * dy > self._geo_radius_deg_sq)
+
+    def calculate_scan_points(self, scanner_id: int, sticker_id: int,
+                            scan_location: Tuple[float, float],
+                            geo_eligible: Optional[bool] = None) -> Tuple[float, str, float]:
+        """Calculate points earned from a scan with advanced mechanics
+
+        `geo_eligible` takes a precomputed geo diversity check (see geo_diversity_mask);
+        when omitted it is evaluated for this single scan.
+        """
+        players = self.players
+        stickers = self.stickers
+
+        if geo_eligible is None:
+            last_location = (players.last_scan_lat[scanner_id], players.last_scan_lon[scanner_id])
+            geo_eligible = self._geo_bonus_applies(last_location, scan_location)
+
+        scanner_points, owner_points, bonus_code = scan_points_kernel(
+            stickers.level[sticker_id], stickers.current_value[sticker_id],
+            stickers.scans_today[sticker_id], stickers.unique_scans_today[sticker_id],
+            bool(players.is_new_player[scanner_id] and players.new_player_bonus_remaining[scanner_id] > 0),
+            bool(players.consecutive_days_active[scanner_id] >= self.config.streak_bonus_days),
+            bool(players.days_since_last_activity[scanner_id] >= self.config.comeback_bonus_days),
+            bool(geo_eligible), stickers.venue_code[sticker_id], players.venues_visited_mask[scanner_id],
+            self._event_active_today, self.scan_params
+        )
+        scanner_points = float(scanner_points)
+        owner_points = float(owner_points)
+        bonus_type = BONUS_TYPES[bonus_code]
+
         return scanner_points, bonus_type, owner_points
-    
+
     def is_event_active(self) -> bool:
         """Check if a seasonal event is currently active"""
         if self.current_day % self.config.event_frequency_days == 0:
             return True
         event_start = (self.current_day // self.config.event_frequency_days) * self.config.event_frequency_days
         return self.current_day - event_start < self.config.event_duration_days
-    
-    def simulate_scan(self, scanner_id: int, sticker_id: int, 
-                     scan_location: Tuple[float, float]) -> bool:
+
+    def simulate_scan(self, scanner_id: int, sticker_id: int,
+                     scan_location: Tuple[float, float], geo_eligible: Optional[bool] = None) -> bool:
         """Simulate a scan event with advanced mechanics"""
-        if scanner_id not in self.players or sticker_id not in self.stickers:
+        if not (0 <= scanner_id < len(self.players) and 0 <= sticker_id < len(self.stickers)):
             return False
-        
-        scanner = self.players[scanner_id]
-        sticker = self.stickers[sticker_id]
-        
+
+        players = self.players
+        stickers = self.stickers
+
         # Check per-sticker cooldown (11 hours = ~0.46 days)
-        cooldown_days = self.config.sticker_scan_cooldown_hours / 24.0
-        if sticker_id in scanner.last_scan_times:
-            days_since_last_scan = self.current_day - scanner.last_scan_times[sticker_id]
-            if days_since_last_scan < cooldown_days:
-                return False
-        
+        pair_key = self.scan_pair_keys([scanner_id], [sticker_id])
+        today = self.recent_scan_keys.get(self.current_day)
+        if self.in_scan_cooldown(pair_key)[0] or (
+                today is not None and self.config.sticker_scan_cooldown_hours > 0 and np.isin(pair_key, today)[0]):
+            return False
+
         # Calculate points
         scanner_points, bonus_type, owner_points = self.calculate_scan_points(
-            scanner, sticker, scan_location
+            scanner_id, sticker_id, scan_location, geo_eligible
         )
-        
+
         # Update sticker stats
-        sticker.scans_today += 1
-        sticker.total_scans += 1
-        sticker.days_since_last_scan = 0
-        if sticker.unique_scans_today == 0:
-            sticker.unique_scans_today = 1
-        sticker.daily_earnings += owner_points
-        sticker.total_earnings += owner_points
-        
+        stickers.scans_today[sticker_id] += 1
+        stickers.total_scans[sticker_id] += 1
+        stickers.unique_scans_today[sticker_id] = 1
+        stickers.daily_earnings[sticker_id] += owner_points
+        stickers.total_earnings[sticker_id] += owner_points
+
         # Update scanner stats
-        scanner.scans_today += 1
-        scanner.unique_scans_today += 1
-        scanner.daily_points += scanner_points
-        scanner.total_points += scanner_points
-        scanner.total_scans += 1
-        scanner.last_scan_locations[sticker.id] = scan_location
-        scanner.last_scan_times[sticker.id] = self.current_day
-        scanner.venues_visited_this_week.add(sticker.venue_category)
-        scanner.last_scan_day = self.current_day
-        scanner.days_since_last_activity = 0
-        
+        self._summary_dirty = True
+        players.scans_today[scanner_id] += 1
+        players.unique_scans_today[scanner_id] += 1
+        players.daily_points[scanner_id] += scanner_points
+        players.total_points[scanner_id] += scanner_points
+        players.total_scans[scanner_id] += 1
+        players.last_scan_lat[scanner_id], players.last_scan_lon[scanner_id] = scan_location
+        self.record_scan_keys(pair_key)
+        players.venues_visited_mask[scanner_id] |= np.uint32(1 << int(stickers.venue_code[sticker_id]))
+        self.scans_today_counter += 1
+        self.total_scans += 1
+        if players.is_active[scanner_id]:
+            self._active_scans_today += 1
+            self._active_points_today += scanner_points
+        players.last_scan_day[scanner_id] = self.current_day
+        players.days_since_last_activity[scanner_id] = 0
+
         # Update owner stats
-        owner = self.players[sticker.owner_id]
-        owner.daily_points += owner_points
-        owner.total_points += owner_points
-        owner.total_revenue_generated += owner_points
-        
+        owner_id = stickers.owner_id[sticker_id]
+        players.daily_points[owner_id] += owner_points
+        players.total_points[owner_id] += owner_points
+        players.total_revenue_generated[owner_id] += owner_points
+        if players.is_active[owner_id]:
+            self._active_points_today += owner_points
+
         return True
-    
-    def simulate_player_behavior(self, player_id: int, day: int):
-        """Simulate a player's behavior for a day with retention mechanics"""
-        player = self.players[player_id]
-        
-        # Check for churn
-        if random.random() < player.churn_probability:
-            player.is_active = False
-            self.churned_players += 1
+
+    def simulate_player_behavior(self, day: int) -> np.ndarray:
+        """Apply the day's churn and activity tracking to all players; returns ids still active"""
+        players = self.players
+        n = len(players)
+
+        self._summary_dirty = True
+
+        # Churn is one Bernoulli draw per player, drawn in bulk so the kernel is pure array-in/array-out
+        churn_draws = self.rng.random(n)
+        churned_by_type = np.zeros(len(PLAYER_TYPES), dtype=np.int64)
+        self._consecutive_days_total += int(player_day_kernel(
+            players.is_active, churn_draws, players.churn_probability, players.type_code, churned_by_type,
+            players.total_days_active, players.consecutive_days_active, players.max_consecutive_days,
+            players.days_since_last_activity, players.is_new_player, players.new_player_bonus_remaining
+        ))
+        churned = int(churned_by_type.sum())
+        if churned:
+            self._n_active_by_type -= churned_by_type
+            self._n_active -= churned
+            self.churned_players += churned
+            self._active_player_ids_dirty = True
+
+        return self.active_player_ids
+
+    def simulate_daily_scans(self, scanner_pool: Optional[np.ndarray] = None):
+        """Draw and score the day's scans for `scanner_pool` (default: all active players) as one batch"""
+        players = self.players
+        stickers = self.stickers
+        available_stickers = self.active_sticker_ids
+        if scanner_pool is None:
+            scanner_pool = self.active_player_ids
+        if not len(available_stickers) or not len(scanner_pool):
             return
-        
-        # Reset daily counters
-        player.scans_today = 0
-        player.unique_scans_today = 0
-        player.daily_points = 0
-        
-        # Update activity tracking
-        player.total_days_active += 1
-        player.consecutive_days_active += 1
-        player.max_consecutive_days = max(player.max_consecutive_days, player.consecutive_days_active)
-        player.days_since_last_activity = 0
-        
-        # Update new player status
-        if player.is_new_player and player.new_player_bonus_remaining > 0:
-            player.new_player_bonus_remaining -= 1
-            if player.new_player_bonus_remaining == 0:
-                player.is_new_player = False
-        
-        # Player behavior based on type
-        if player.player_type == "whale":
-            self.simulate_whale_behavior(player, day)
-        elif player.player_type == "grinder":
-            self.simulate_grinder_behavior(player, day)
-        else:  # casual
-            self.simulate_casual_behavior(player, day)
-    
-    def simulate_whale_behavior(self, player: AdvancedPlayer, day: int):
-        """Simulate whale player behavior with enhanced mechanics"""
-        # Whales buy packs regularly
-        if day % 7 == 0:  # Weekly purchase
-            if random.random() < 0.8:  # 80% chance to buy
-                packs_bought = random.randint(1, 3)
-                cost = packs_bought * self.config.pack_price_dollars
-                player.money_spent += cost
-                player.total_revenue_generated += cost
-                self.total_revenue += cost
-                self.whale_purchases += 1
-                player.stickers_owned += packs_bought * 6
-                player.last_purchase_day = day
-                
-                # Place some new stickers
-                for _ in range(min(packs_bought * 2, 6)):
-                    location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                    venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                    self.add_sticker(player.id, location, venue, player.level)
-            
-            # Weekly reinvestment
-            reinvestment_amount = random.uniform(6.0, 12.0)
-            player.money_spent += reinvestment_amount
-            self.total_revenue += reinvestment_amount
-            self.whale_purchases += 1
-            reinvestment_points = reinvestment_amount * self.config.points_per_dollar
-            packs_from_reinvestment = int(reinvestment_points // self.config.pack_price_points)
-            if packs_from_reinvestment > 0:
-                player.stickers_owned += packs_from_reinvestment * 6
-                for _ in range(min(packs_from_reinvestment * 2, 8)):
-                    location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                    venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                    self.add_sticker(player.id, location, venue, player.level)
-        
-        # Moderate scanning activity
-        scans_today = random.randint(5, 12)
-        for _ in range(scans_today):
-            
-            available_stickers = [s for s in self.stickers.values() if s.is_active]
-            if available_stickers:
-                sticker = random.choice(available_stickers)
-                scan_location = (
-                    sticker.location[0] + random.uniform(-0.01, 0.01),
-                    sticker.location[1] + random.uniform(-0.01, 0.01)
-                )
-                self.simulate_scan(player.id, sticker.id, scan_location)
-    
-    def simulate_grinder_behavior(self, player: AdvancedPlayer, day: int):
-        """Simulate grinder player behavior with enhanced mechanics"""
-        # Grinders scan heavily
-        scans_today = random.randint(15, 25)
-        for _ in range(scans_today):
-            
-            available_stickers = [s for s in self.stickers.values() if s.is_active]
-            if available_stickers:
-                sticker = random.choice(available_stickers)
-                scan_location = (
-                    sticker.location[0] + random.uniform(-0.01, 0.01),
-                    sticker.location[1] + random.uniform(-0.01, 0.01)
-                )
-                self.simulate_scan(player.id, sticker.id, scan_location)
-        
-        # Weekly reinvestment
+        self._summary_dirty = True
+
+        # Scans per player by type, flattened into one array of scans in player order
+        type_params = TYPE_PARAMS[players.type_code[scanner_pool]]
+        scans_per_player = self.rng.integers(type_params['scans_min'], type_params['scans_max'], endpoint=True)
+        scanner_ids = np.repeat(scanner_pool, scans_per_player)
+        sticker_ids = available_stickers[self.rng.integers(0, len(available_stickers), len(scanner_ids))]
+        jitter = self.rng.uniform(-0.01, 0.01, (len(scanner_ids), 2))
+        scan_lats = stickers.lat[sticker_ids] + jitter[:, 0]
+        scan_lons = stickers.lon[sticker_ids] + jitter[:, 1]
+
+        # Per-sticker cooldown against earlier scans of the same pair, including repeats today
+        pair_keys = self.scan_pair_keys(scanner_ids, sticker_ids)
+        allowed = ~self.in_scan_cooldown(pair_keys)
+        if self.config.sticker_scan_cooldown_hours > 0:
+            allowed &= first_pair_scan_kernel(scanner_ids, sticker_ids, len(stickers))
+        scanner_ids, sticker_ids, pair_keys = scanner_ids[allowed], sticker_ids[allowed], pair_keys[allowed]
+        scan_lats, scan_lons = scan_lats[allowed], scan_lons[allowed]
+        if not len(scanner_ids):
+            return
+
+        # Geo diversity compares each scan with the same player's previous scan: the prior scan
+        # in this batch, or the stored location from an earlier day for the player's first scan
+        first_of_player = np.r_[True, scanner_ids[1:] != scanner_ids[:-1]]
+        last_of_player = np.r_[first_of_player[1:], True]
+        prev_lats = np.r_[np.nan, scan_lats[:-1]]
+        prev_lons = np.r_[np.nan, scan_lons[:-1]]
+        prev_lats[first_of_player] = players.last_scan_lat[scanner_ids[first_of_player]]
+        prev_lons[first_of_player] = players.last_scan_lon[scanner_ids[first_of_player]]
+        geo_eligible = self.geo_diversity_mask(prev_lats, prev_lons, scan_lats, scan_lons)
+
+        # Player-level bonus eligibility only changes between days, so evaluate it once here
+        n_players = len(players)
+        new_player_active = players.is_new_player[:n_players] & (players.new_player_bonus_remaining[:n_players] > 0)
+        streak_active = players.consecutive_days_active[:n_players] >= self.config.streak_bonus_days
+        comeback_active = players.days_since_last_activity[:n_players] >= self.config.comeback_bonus_days
+
+        scanner_points = np.empty(len(scanner_ids))
+        owner_points = np.empty(len(scanner_ids))
+        score_scans_kernel(
+            scanner_ids, sticker_ids, geo_eligible, self._event_active_today,
+            stickers.level, stickers.current_value, stickers.scans_today, stickers.unique_scans_today,
+            stickers.venue_code, new_player_active, streak_active, comeback_active,
+            players.venues_visited_mask, self.scan_params, scanner_points, owner_points
+        )
+
+        # Close out the day with per-player / per-sticker sums
+        self.scans_today_counter += len(scanner_ids)
+        self.total_scans += len(scanner_ids)
+        n_stickers = len(stickers)
+        owner_ids = stickers.owner_id[sticker_ids]
+        scanners_active = players.is_active[scanner_ids]
+        self._active_scans_today += int(np.count_nonzero(scanners_active))
+        self._active_points_today += float(scanner_points[scanners_active].sum() +
+                                           owner_points[players.is_active[owner_ids]].sum())
+        scans_by_player = np.bincount(scanner_ids, minlength=n_players)
+        points_by_player = (np.bincount(scanner_ids, weights=scanner_points, minlength=n_players) +
+                            np.bincount(owner_ids, weights=owner_points, minlength=n_players))
+        owner_revenue = np.bincount(owner_ids, weights=owner_points, minlength=n_players)
+        earnings_by_sticker = np.bincount(sticker_ids, weights=owner_points, minlength=n_stickers)
+
+        players.scans_today[:n_players] += scans_by_player
+        players.unique_scans_today[:n_players] += scans_by_player
+        players.total_scans[:n_players] += scans_by_player
+        players.daily_points[:n_players] += points_by_player
+        players.total_points[:n_players] += points_by_player
+        players.total_revenue_generated[:n_players] += owner_revenue
+        scanned = scans_by_player > 0
+        players.last_scan_day[:n_players][scanned] = self.current_day
+        players.days_since_last_activity[:n_players][scanned] = 0
+
+        stickers.total_scans[:n_stickers] += np.bincount(sticker_ids, minlength=n_stickers)
+        stickers.daily_earnings[:n_stickers] += earnings_by_sticker
+        stickers.total_earnings[:n_stickers] += earnings_by_sticker
+
+        players.last_scan_lat[scanner_ids[last_of_player]] = scan_lats[last_of_player]
+        players.last_scan_lon[scanner_ids[last_of_player]] = scan_lons[last_of_player]
+        self.record_scan_keys(pair_keys)
+
+    def _record_purchases(self, buyer_ids: np.ndarray, organic: np.ndarray):
+        """Add buyers to the per-type purchase counters (and organic_purchases where flagged)"""
+        by_type = np.bincount(self.players.type_code[buyer_ids], minlength=len(PLAYER_TYPES))
+        self.whale_purchases += int(by_type[WHALE])
+        self.grinder_purchases += int(by_type[GRINDER])
+        self.casual_purchases += int(by_type[CASUAL])
+        self.organic_purchases += int(np.count_nonzero(organic))
+
+    def simulate_purchases(self, day: int, player_ids: np.ndarray, before_scans: bool):
+        """Run point reinvestment, pack purchases and dollar top-ups for every player in one phase
+
+        Whales buy before the day's scans; grinders and casuals spend what they earned after.
+        """
+        players = self.players
+        config = self.config
+        ppp = config.pack_price_points
+        self._summary_dirty = True
+        player_ids = player_ids[TYPE_PARAMS['buys_before_scans'][players.type_code[player_ids]] == before_scans]
+        params = TYPE_PARAMS[players.type_code[player_ids]]
+
+        # Weekly reinvestment of ~10% of points into packs
         if day % 7 == 0:
-            if player.total_points >= self.config.pack_price_points:
-                reinvestment_points = max(int(player.total_points * 0.10), self.config.pack_price_points)
-                packs_from_reinvestment = reinvestment_points // self.config.pack_price_points
-                if packs_from_reinvestment > 0:
-                    player.total_points -= packs_from_reinvestment * self.config.pack_price_points
-                    player.stickers_owned += packs_from_reinvestment * 6
-                    self.organic_purchases += 1
-                    self.grinder_purchases += 1
-                    
-                    for _ in range(min(packs_from_reinvestment * 2, 6)):
-                        location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                        venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                        self.add_sticker(player.id, location, venue, player.level)
-        
-        # Occasional pack purchase with points
-        if day % 21 == 0 and player.total_points >= self.config.pack_price_points:
-            if random.random() < 0.2:
-                player.total_points -= self.config.pack_price_points
-                player.stickers_owned += 6
-                self.organic_purchases += 1
-                self.grinder_purchases += 1
-                
-                for _ in range(3):
-                    location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                    venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                    self.add_sticker(player.id, location, venue, player.level)
-    
-    def simulate_casual_behavior(self, player: AdvancedPlayer, day: int):
-        """Simulate casual player behavior with enhanced mechanics"""
-        # Casual players scan moderately
-        scans_today = random.randint(3, 8)
-        for _ in range(scans_today):
-            
-            available_stickers = [s for s in self.stickers.values() if s.is_active]
-            if available_stickers:
-                sticker = random.choice(available_stickers)
-                scan_location = (
-                    sticker.location[0] + random.uniform(-0.01, 0.01),
-                    sticker.location[1] + random.uniform(-0.01, 0.01)
-                )
-                self.simulate_scan(player.id, sticker.id, scan_location)
-        
-        # Weekly reinvestment
+            mask = (params['reinvest_sticker_cap'] > 0) & (players.total_points[player_ids] >= ppp)
+            buyers, cap = player_ids[mask], params['reinvest_sticker_cap'][mask]
+            packs = np.maximum((players.total_points[buyers] * 0.10).astype(np.int64), ppp) // ppp
+            players.total_points[buyers] -= packs * ppp
+            players.stickers_owned[buyers] += packs * 6
+            self._record_purchases(buyers, params['organic'][mask])
+            self.place_stickers(buyers, np.minimum(packs * 2, cap))
+
+        # Occasional pack purchase, paid in points or dollars depending on type
+        with_points = params['pack_with_points']
+        mask = ((day % params['pack_period'] == 0) &
+                (~with_points | (players.total_points[player_ids] >= ppp)))
+        mask[mask] = self.rng.random(np.count_nonzero(mask)) < params['pack_probability'][mask]
+        buyers, bought = player_ids[mask], params[mask]
+        packs = self.rng.integers(bought['packs_min'], bought['packs_max'], endpoint=True)
+        paid_points, paid_dollars = buyers[bought['pack_with_points']], ~bought['pack_with_points']
+        players.total_points[paid_points] -= packs[bought['pack_with_points']] * ppp
+        cost = packs[paid_dollars] * config.pack_price_dollars
+        players.money_spent[buyers[paid_dollars]] += cost
+        # Only whale pack purchases count towards a player's revenue generated, as in the per-player model
+        whale_paid = players.type_code[buyers[paid_dollars]] == WHALE
+        players.total_revenue_generated[buyers[paid_dollars][whale_paid]] += cost[whale_paid]
+        players.last_purchase_day[buyers[paid_dollars]] = day
+        self.total_revenue += float(cost.sum())
+        players.stickers_owned[buyers] += packs * 6
+        self._record_purchases(buyers, bought['organic'])
+        self.place_stickers(buyers, np.minimum(packs * bought['stickers_per_pack'], bought['pack_sticker_cap']))
+
+        # Weekly dollar top-up converted straight into packs
         if day % 7 == 0:
-            if player.total_points >= self.config.pack_price_points:
-                reinvestment_points = max(int(player.total_points * 0.10), self.config.pack_price_points)
-                packs_from_reinvestment = reinvestment_points // self.config.pack_price_points
-                if packs_from_reinvestment > 0:
-                    player.total_points -= packs_from_reinvestment * self.config.pack_price_points
-                    player.stickers_owned += packs_from_reinvestment * 6
-                    self.organic_purchases += 1
-                    self.casual_purchases += 1
-                    
-                    for _ in range(min(packs_from_reinvestment * 2, 4)):
-                        location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                        venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                        self.add_sticker(player.id, location, venue, player.level)
-        
-        # Occasional purchase
-        if day % 28 == 0:
-            if random.random() < 0.3:
-                cost = self.config.pack_price_dollars
-                player.money_spent += cost
-                self.total_revenue += cost
-                self.organic_purchases += 1
-                self.casual_purchases += 1
-                player.stickers_owned += 6
-                player.last_purchase_day = day
-                
-                for _ in range(2):
-                    location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                    venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                    self.add_sticker(player.id, location, venue, player.level)
-    
+            mask = params['topup_max'] > 0
+            buyers, topping = player_ids[mask], params[mask]
+            amounts = self.rng.uniform(topping['topup_min'], topping['topup_max'])
+            players.money_spent[buyers] += amounts
+            self.total_revenue += float(amounts.sum())
+            self._record_purchases(buyers, topping['organic'])
+            packs = (amounts * config.points_per_dollar // ppp).astype(np.int64)
+            players.stickers_owned[buyers] += packs * 6
+            self.place_stickers(buyers, np.minimum(packs * 2, topping['topup_sticker_cap']))
+
+    def simulate_day(self, day: int):
+        """Simulate one day: churn and whale purchases, one batched scan pass, then reinvestment"""
+        self._active_sticker_ids_dirty = True  # Rebuild the active index once per day
+        # Churn only happens here, so one active-id array serves every phase of the day
+        active_ids = self.simulate_player_behavior(day)
+
+        self.simulate_purchases(day, active_ids, before_scans=True)
+        self.simulate_daily_scans(active_ids)
+        self.simulate_purchases(day, active_ids, before_scans=False)
+
     # Removed update_sticker_decay - no longer needed
-    
+
     def simulate_new_player_growth(self, day: int):
         """Simulate new player acquisition with population and spread mechanics"""
-        current_players = len([p for p in self.players.values() if p.is_active])
-        
+        current_players = self._n_active
+
         # Check if we've reached the population cap
         if current_players >= self.max_possible_players:
             return
-        
+
         new_players_count = 0
-        
+
         # 1. Viral spread mechanics (40% of active players recruit 1 new player per 2 weeks)
         if day % self.config.viral_spread_frequency_days == 0:
-            active_players = [p for p in self.players.values() if p.is_active]
-            recruiting_players = int(len(active_players) * self.config.viral_spread_percentage)
+            recruiting_players = int(current_players * self.config.viral_spread_percentage)
             viral_recruits = min(recruiting_players, self.max_possible_players - current_players)
             new_players_count += viral_recruits
             self.viral_recruits_today = viral_recruits
-        
+
         # 2. Organic growth based on sticker activity (0.02-0.05% per 200 tags per week)
         if day % 7 == 0:  # Weekly organic growth
-            total_active_stickers = len([s for s in self.stickers.values() if s.is_active])
+            total_active_stickers = self._active_sticker_count
             if total_active_stickers >= self.config.organic_growth_tags_threshold:
                 # Calculate organic growth rate based on sticker density
                 sticker_density_factor = min(total_active_stickers / self.config.organic_growth_tags_threshold, 3.0)
-                organic_rate = random.uniform(
+                organic_rate = self.rng.uniform(
                     self.config.organic_growth_rate_min,
                     self.config.organic_growth_rate_max
                 ) * sticker_density_factor
-                
+
                 # Apply to total population, not just current players
                 organic_new_players = int(self.config.total_population * organic_rate)
                 organic_new_players = min(organic_new_players, self.max_possible_players - current_players - new_players_count)
                 new_players_count += organic_new_players
                 self.organic_new_players_today = organic_new_players
-        
+
         # 3. Event boost for both viral and organic growth
-        if self.is_event_active():
+        if self._event_active_today:
             new_players_count = int(new_players_count * 2.0)
-        
-        # Add new players using the configurable player type ratios
-        for _ in range(new_players_count):
-            player_type = random.choices(
-                list(self.config.new_player_type_ratios.keys()),
-                weights=list(self.config.new_player_type_ratios.values())
-            )[0]
-            self.add_player(player_type, is_new=True)
-            self.new_players_today += 1
-    
+
+        # Add new players using the configurable player type ratios, drawn in one batch
+        if new_players_count > 0:
+            type_codes = np.array([PLAYER_TYPE_CODES.get(name, CASUAL)
+                                   for name in self.config.new_player_type_ratios], dtype=np.int8)
+            weights = np.asarray(list(self.config.new_player_type_ratios.values()), dtype=np.float64)
+            type_picks = self.rng.choice(len(type_codes), size=new_players_count, p=weights / weights.sum())
+            self.add_players_bulk(type_codes[type_picks], is_new=True)
+            self.new_players_today += new_players_count
+
     def reset_daily_stats(self):
         """Reset daily statistics"""
-        for player in self.players.values():
-            if player.is_active:
-                player.scans_today = 0
-                player.unique_scans_today = 0
-                player.daily_points = 0
-                player.venues_visited_this_week = set()
-            else:
-                player.days_since_last_activity += 1
-        
-        for sticker in self.stickers.values():
-            sticker.scans_today = 0
-            sticker.unique_scans_today = 0
-            sticker.daily_earnings = 0.0
-        
+        # Only allocated rows: rows past `size` already hold these same zero defaults
+        players = self.players
+        n = len(players)
+        players.scans_today[:n] = 0
+        players.unique_scans_today[:n] = 0
+        players.daily_points[:n] = 0.0
+        players.venues_visited_mask[:n][players.active_mask] = 0  # Inactive players keep theirs, as before
+        players.days_since_last_activity[:n] += ~players.active_mask
+
+        stickers = self.stickers
+        n_stickers = len(stickers)
+        stickers.scans_today[:n_stickers] = 0
+        stickers.unique_scans_today[:n_stickers] = 0
+        stickers.daily_earnings[:n_stickers] = 0.0
+
+        self.scans_today_counter = 0
+        self._active_scans_today = 0
+        self._active_points_today = 0.0
+
         # Reset population tracking variables
         self.viral_recruits_today = 0
         self.organic_new_players_today = 0
-    
+
     def collect_daily_stats(self):
-        """Collect comprehensive daily statistics"""
-        active_players = [p for p in self.players.values() if p.is_active]
-        
+        """Collect comprehensive daily statistics from the running totals (no per-player pass)"""
+        active_count = self._n_active
+
         daily_stat = {
             'day': self.current_day,
-            'total_players': len(active_players),
+            'total_players': active_count,
             'total_players_ever': self.total_players_ever,
             'churned_players': self.churned_players,
-            'retained_players': len(active_players),
-            'retention_rate': len(active_players) / max(self.total_players_ever, 1),
+            'retained_players': active_count,
+            'retention_rate': active_count / max(self.total_players_ever, 1),
             'new_players_today': self.new_players_today,
             'returning_players_today': self.returning_players_today,
-            'total_stickers': len([s for s in self.stickers.values() if s.is_active]),
-            'total_scans': len([e for e in self.scan_events if e.timestamp.day == self.current_day]),
-            'total_points_earned': sum(p.daily_points for p in active_players),
+            'total_stickers': self._active_sticker_count,
+            'total_scans': self.scans_today_counter,
+            'total_points_earned': self._active_points_today,
             'total_revenue': self.total_revenue,
             'organic_purchases': self.organic_purchases,
             'whale_purchases': self.whale_purchases,
             'grinder_purchases': self.grinder_purchases,
             'casual_purchases': self.casual_purchases,
-            'whale_count': len([p for p in active_players if p.player_type == 'whale']),
-            'grinder_count': len([p for p in active_players if p.player_type == 'grinder']),
-            'casual_count': len([p for p in active_players if p.player_type == 'casual']),
-            'avg_points_per_player': statistics.mean([p.daily_points for p in active_players]) if active_players else 0,
-            'avg_scans_per_player': statistics.mean([p.scans_today for p in active_players]) if active_players else 0,
-            'avg_consecutive_days': statistics.mean([p.consecutive_days_active for p in active_players]) if active_players else 0,
-            'event_active': self.is_event_active(),
-            
+            'whale_count': int(self._n_active_by_type[WHALE]),
+            'grinder_count': int(self._n_active_by_type[GRINDER]),
+            'casual_count': int(self._n_active_by_type[CASUAL]),
+            'avg_points_per_player': self._active_points_today / active_count if active_count else 0,
+            'avg_scans_per_player': self._active_scans_today / active_count if active_count else 0,
+            'avg_consecutive_days': self._consecutive_days_total / active_count if active_count else 0,
+            'event_active': self._event_active_today,
+
             # === POPULATION & SPREAD METRICS ===
             'total_population': self.config.total_population,
             'population_density': self.config.population_density_per_quarter_sq_mile,
             'max_possible_players': self.max_possible_players,
-            'population_penetration_rate': len(active_players) / self.config.total_population,
+            'population_penetration_rate': active_count / self.config.total_population,
             'viral_recruits_today': self.viral_recruits_today,
             'organic_new_players_today': self.organic_new_players_today,
-            'population_cap_reached': len(active_players) >= self.max_possible_players,
+            'population_cap_reached': active_count >= self.max_possible_players,
         }
-        self.daily_stats.append(daily_stat)
+        row = self.daily_stats.allocate(1).start
+        for name, value in daily_stat.items():
+            getattr(self.daily_stats, name)[row] = value
         return daily_stat
-    
-    def run_simulation(self, days: int, initial_players: Dict[str, int] = None):
-        """Run the advanced simulation for a specified number of days"""
+
+    def run_simulation(self, days: int, initial_players: Dict[str, int] = None,
+                       progress_callback: Callable[[int, 'AdvancedFYNDRSimulator'], bool] = None):
+        """Run the advanced simulation for a specified number of days
+
+        `progress_callback(day, simulator)` runs after every simulated day; a truthy return
+        stops the run early (e.g. to prune a clearly bad configuration).
+        """
         if initial_players is None:
             initial_players = {'whale': 10, 'grinder': 50, 'casual': 100}
-        
-        # Initialize players
-        for player_type, count in initial_players.items():
-            for _ in range(count):
-                player_id = self.add_player(player_type, is_new=False)
-                # Give initial stickers
-                for _ in range(2):
-                    location = (random.uniform(40.0, 41.0), random.uniform(-74.0, -73.0))
-                    venue = random.choice(["campus", "coffee", "library", "park", "restaurant"])
-                    self.add_sticker(player_id, location, venue)
-        
+
+        # Initialize players, then give everyone their initial stickers in one bulk placement
+        initial_codes = np.repeat([PLAYER_TYPE_CODES.get(player_type, CASUAL) for player_type in initial_players],
+                                  list(initial_players.values()))
+        initial_ids = self.add_players_bulk(initial_codes, is_new=False)
+        self.place_stickers(initial_ids, np.full(len(initial_ids), 2), np.ones(len(initial_ids), dtype=np.int64))
+
         # Run simulation
+        self.daily_stats.reserve(len(self.daily_stats) + days)
         for day in range(1, days + 1):
             self.current_day = day
             self.current_week = (day - 1) // 7 + 1
+            self._event_active_today = self.is_event_active()
             self.new_players_today = 0
             self.returning_players_today = 0
-            
+
             # Reset daily stats
             self.reset_daily_stats()
-            
+
             # Simulate new player growth
             self.simulate_new_player_growth(day)
-            
-            # Simulate each active player's behavior
-            for player_id in list(self.players.keys()):
-                if self.players[player_id].is_active:
-                    self.simulate_player_behavior(player_id, day)
-            
+
+            # Simulate each active player's day
+            self.simulate_day(day)
+
             # Collect daily stats
             self.collect_daily_stats()
-            
+
             # Weekly reset
             if day % 7 == 0:
-                for player in self.players.values():
-                    if player.is_active:
-                        player.weekly_points = 0
-    
+                n = len(self.players)
+                self.players.weekly_points[:n] = 0.0  # Inactive rows are never read, so no mask needed
+                self._summary_dirty = True
+
+            if progress_callback is not None and progress_callback(day, self):
+                break
+
     def get_economy_summary(self) -> Dict:
-        """Get a comprehensive summary of the economy"""
-        active_players = [p for p in self.players.values() if p.is_active]
-        total_revenue = sum(p.money_spent for p in active_players)
-        total_points = sum(p.total_points for p in active_players)
-        total_scans = len(self.scan_events)
-        
+        """Get a comprehensive summary of the economy (cached until the simulation state changes)"""
+        if not self._summary_dirty:
+            return self._summary_cache
+
+        players = self.players
+        n = len(players)
+        active_count = self._n_active
+        total_scans = self.total_scans
+
+        # Single fused pass over the player columns
+        type_counts = np.zeros(len(PLAYER_TYPES), dtype=np.int64)
+        type_revenue = np.zeros(len(PLAYER_TYPES))
+        total_points, level_sum = economy_totals_kernel(
+            players.active_mask, players.type_code[:n], players.money_spent[:n],
+            players.total_points[:n], players.level[:n], type_counts, type_revenue
+        )
+        total_points = float(total_points)
+        total_revenue = float(type_revenue.sum())
+
         # Player type breakdown
-        player_types = Counter(p.player_type for p in active_players)
-        
-        # Revenue by player type
-        revenue_by_type = defaultdict(float)
-        for player in active_players:
-            revenue_by_type[player.player_type] += player.money_spent
-        
+        player_types = {name: int(count) for name, count in zip(PLAYER_TYPES, type_counts) if count}
+
+        # Revenue by type
+        revenue_by_type = {name: float(revenue) for name, revenue, count
+                           in zip(PLAYER_TYPES, type_revenue, type_counts) if count}
+
         # Retention metrics
-        retention_rate = len(active_players) / max(self.total_players_ever, 1)
-        
+        retention_rate = active_count / max(self.total_players_ever, 1)
+
         # Growth metrics
-        total_growth = self.total_players_ever - len(active_players)
-        
+        total_growth = self.total_players_ever - active_count
+
         # Average level calculation
-        avg_level = statistics.mean([p.level for p in active_players]) if active_players else 1
-        
-        return {
+        avg_level = level_sum / active_count if active_count else 1
+
+        self._summary_cache = {
             'total_revenue': total_revenue,
             'total_points': total_points,
             'total_scans': total_scans,
-            'total_players': len(active_players),
+            'total_players': active_count,
             'total_players_ever': self.total_players_ever,
             'retention_rate': retention_rate,
             'churn_rate': 1 - retention_rate,
             'total_growth': total_growth,
-            'total_stickers': len([s for s in self.stickers.values() if s.is_active]),
-            'player_types': dict(player_types),
-            'revenue_by_type': dict(revenue_by_type),
+            'total_stickers': self._active_sticker_count,
+            'player_types': player_types,
+            'revenue_by_type': revenue_by_type,
             'organic_purchases': self.organic_purchases,
             'whale_purchases': self.whale_purchases,
             'grinder_purchases': self.grinder_purchases,
             'casual_purchases': self.casual_purchases,
-            'avg_points_per_player': total_points / len(active_players) if active_players else 0,
-            'avg_revenue_per_player': total_revenue / len(active_players) if active_players else 0,
+            'avg_points_per_player': total_points / active_count if active_count else 0,
+            'avg_revenue_per_player': total_revenue / active_count if active_count else 0,
             'points_per_scan': total_points / total_scans if total_scans > 0 else 0,
-            'organic_purchase_rate': self.organic_purchases / max(len(active_players), 1),
+            'organic_purchase_rate': self.organic_purchases / max(active_count, 1),
             'avg_level': avg_level,
-            'whale_count': player_types.get('whale', 0),
-            'grinder_count': player_types.get('grinder', 0),
-            'casual_count': player_types.get('casual', 0),
-            
+            'whale_count': int(type_counts[WHALE]),
+            'grinder_count': int(type_counts[GRINDER]),
+            'casual_count': int(type_counts[CASUAL]),
+
             # === POPULATION & SPREAD METRICS ===
             'total_population': self.config.total_population,
             'population_density': self.config.population_density_per_quarter_sq_mile,
             'max_possible_players': self.max_possible_players,
-            'population_penetration_rate': len(active_players) / self.config.total_population,
-            'population_cap_reached': len(active_players) >= self.max_possible_players,
+            'population_penetration_rate': active_count / self.config.total_population,
+            'population_cap_reached': active_count >= self.max_possible_players,
             'viral_spread_rate': self.config.viral_spread_percentage,
             'organic_growth_rate_range': f"{self.config.organic_growth_rate_min*100:.3f}%-{self.config.organic_growth_rate_max*100:.3f}%",
         }
+        self._summary_dirty = False
+        return self._summary_cache
+
+
+# === PARALLEL PARAMETER SWEEPS ===
+
+def _source_digest() -> str:
+    """Digest of this module's source, so summaries cached by the analyzers go stale with any simulator change"""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+SIMULATOR_VERSION = _source_digest()
+
+_kernels_warm = False  # Set once this process (or the parent it was forked from) has run warmup_kernels
+
+def warmup_kernels():
+    """Run a tiny simulation so the Numba kernels are compiled (or loaded from cache), once per process"""
+    global _kernels_warm
+    if _kernels_warm:
+        return
+    simulator = AdvancedFYNDRSimulator(AdvancedGameConfig())
+    simulator.run_simulation(1, {'whale': 1, 'grinder': 1, 'casual': 1})
+    _kernels_warm = True
+
+_worker_simulator: Optional[AdvancedFYNDRSimulator] = None  # Long-lived simulator reused by this process
+
+def pooled_simulator(config: AdvancedGameConfig, seed: Seed = 0) -> AdvancedFYNDRSimulator:
+    """This process's simulator, reset for `config`; the player/sticker tables survive between runs"""
+    global _worker_simulator
+    if _worker_simulator is None:
+        _worker_simulator = AdvancedFYNDRSimulator(config, seed=seed)
+    else:
+        _worker_simulator.reset(config, seed)
+    return _worker_simulator
+
+def _init_sweep_worker():
+    """Pool initializer: one thread per worker process, kernels compiled once per worker"""
+    # Thread-count environment variables are read at import, which already happened in the parent,
+    # so Numba's pool is capped through its runtime API instead
+    if NUMBA_AVAILABLE:
+        set_num_threads(1)
+    warmup_kernels()
+    pooled_simulator(AdvancedGameConfig())
+
+def available_cpus() -> int:
+    """CPUs this process may run on (its affinity mask, so container/taskset limits count), at least 1"""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # No affinity API outside Linux
+        return os.cpu_count() or 1
+
+def spawn_seeds(base_seed: Optional[int], count: int) -> List[int]:
+    """Derive `count` independent, reproducible simulator seeds from one base seed"""
+    children = np.random.SeedSequence(base_seed).spawn(count)
+    return [int.from_bytes(child.generate_state(2, dtype=np.uint32).tobytes(), 'little') for child in children]
+
+def run_single_simulation(config_dict: Dict[str, Any], seed: Seed = 0, days: int = 270,
+                          initial_players: Dict[str, int] = None) -> Dict:
+    """Run one simulation from a plain config dict and return its economy summary (pickle-friendly)"""
+    simulator = pooled_simulator(AdvancedGameConfig(**config_dict), seed=seed)
+    simulator.run_simulation(days, initial_players)
+    return simulator.get_economy_summary()
+
+def _capture_errors(worker: Callable[..., Any], config_dict: Dict[str, Any], seed: Seed, days: int) -> Any:
+    """Run `worker` on one config, returning its exception instead of raising (so one failure can't end a chunk)"""
+    try:
+        return worker(config_dict, seed, days)
+    except Exception as error:
+        return error
+
+def run_parameter_sweep(configs: List[Any], days: int = 270, seeds: List[Optional[int]] = None,
+                        max_workers: Optional[int] = None, chunksize: Optional[int] = None,
+                        base_seed: Optional[int] = 0, worker: Callable[..., Any] = None,
+                        return_exceptions: bool = False) -> List[Any]:
+    """Run many configs (AdvancedGameConfig or dicts) on a process pool; results come back in input order
+
+    Without explicit `seeds`, each config gets its own stream spawned from `base_seed`.
+    `worker(config_dict, seed, days)` defaults to run_single_simulation; a replacement must be
+    a module-level function so it pickles. `chunksize` defaults to ~4 chunks per worker.
+    With `return_exceptions`, a failing config yields its exception in place of a result
+    instead of aborting the whole sweep.
+    """
+    config_dicts = [asdict(config) if isinstance(config, AdvancedGameConfig) else dict(config)
+                    for config in configs]
+    if not config_dicts:
+        return []
+    if seeds is None:
+        seeds = spawn_seeds(base_seed, len(config_dicts))
+
+    # Compile in the parent first so forked workers inherit the kernels
+    warmup_kernels()
+    context = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+    workers = min(max_workers or available_cpus(), len(config_dicts))
+    if chunksize is None:
+        chunksize = max(1, len(config_dicts) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_sweep_worker) as executor:
+        worker = worker or run_single_simulation
+        if return_exceptions:
+            worker = partial(_capture_errors, worker)
+        return list(executor.map(worker, config_dicts, seeds, itertools.repeat(days), chunksize=chunksize))
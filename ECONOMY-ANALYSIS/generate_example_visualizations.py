@@ -11,11 +11,16 @@ import sys
 import os
 from visualization_engine import FYNDRVisualizationEngine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def load_existing_results():
     """Load existing results from the JSON file"""
     try:
-        with open('okr_v2_optimized_results.json', 'r') as f:
-            return json.load(f)
+        with open('okr_v2_optimized_results.json', 'rb') as f:
+            return orjson.loads(f.read()) if orjson else json.load(f)
     except FileNotFoundError:
         print("Error: okr_v2_optimized_results.json not found!")
         print("Please run the OKR V2 analyzer first to generate results.")
@@ -9,16 +9,64 @@ from the OKR V2 analyzer run.
 import json
 import sys
 import os
+import argparse
+import numpy as np
 from visualization_engine import FYNDRVisualizationEngine
+from advanced_economy_simulator import AdvancedGameConfig, run_parameter_sweep
+from okr_optimized_analyzer_v2 import OKROptimizedAnalyzerV2
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+RESULTS_FILE = 'okr_v2_optimized_results.json'
+
+# Synthetic variations per player type, centred on the best configuration
+NUM_VARIATIONS = 16
+
+# player type -> (parameter, default, step per variation, lowest valid value, highest valid value)
+VARIATION_STEPS = {
+    'whale': (
+        ('owner_base_points', 2.0, 0.2, 0.1, np.inf),
+        ('pack_price_dollars', 3.0, 0.5, 0.5, np.inf),
+        ('churn_probability_whale', 0.1, 0.01, 0.0001, 1.0),
+    ),
+    'grinder': (
+        ('geo_diversity_bonus', 2.5, 0.2, 1.0, np.inf),
+        ('venue_variety_bonus', 2.5, 0.2, 1.0, np.inf),
+        ('churn_probability_grinder', 0.0008, 0.0001, 0.0001, 1.0),
+    ),
+    'casual': (
+        ('social_sneeze_bonus', 5.0, 0.3, 0.0, np.inf),
+        ('new_player_bonus_multiplier', 2.0, 0.1, 1.0, np.inf),
+        ('churn_probability_casual', 0.002, 0.0002, 0.0001, 1.0),
+    ),
+}
+
+# Result fields scaled by the variation factor
+SCALED_FIELDS = ('whale_score', 'grinder_score', 'casual_score', 'overall_score', 'revenue')
+
+def load_results():
+    """Load the whole results file, with orjson when it is installed"""
+    with open(RESULTS_FILE, 'rb') as f:
+        return orjson.loads(f.read()) if orjson else json.load(f)
 
 def create_progression_data_from_results():
     """Create progression data from the actual results file"""
     try:
-        with open('okr_v2_optimized_results.json', 'r') as f:
-            results = json.load(f)
-        
-        # Extract the all_simulation_results if available
-        all_results = results.get('all_simulation_results', [])
+        # Extract the all_simulation_results if available, streaming the records when ijson is
+        # installed so the rest of the document is never materialized
+        if ijson:
+            with open(RESULTS_FILE, 'rb') as f:
+                all_results = list(ijson.items(f, 'all_simulation_results.item', use_float=True))
+        else:
+            all_results = load_results().get('all_simulation_results', [])
         
         if not all_results:
             print("No simulation results found in the JSON file.")
@@ -34,11 +82,16 @@ def create_progression_data_from_results():
         print(f"Error reading results: {e}")
         return None
 
-def create_synthetic_progression_data():
-    """Create synthetic progression data based on the actual results"""
+def create_synthetic_progression_data(simulate_days: int = 0):
+    """Create synthetic progression data based on the actual results
+
+    With simulate_days > 0 each variation is re-simulated for that many days on a
+    process pool (reproducibly seeded) and gets its own summary, scores, revenue and
+    userbase from the V2 analyzer's scoring instead of scaled copies of the best
+    configuration's.
+    """
     try:
-        with open('okr_v2_optimized_results.json', 'r') as f:
-            results = json.load(f)
+        results = load_results()
         
         # Extract best configurations for each player type
         whale_result = results.get('whale_result', {})
@@ -47,6 +100,8 @@ def create_synthetic_progression_data():
         multiplayer_result = results.get('multiplayer_result', {})
         
         synthetic_results = []
+        deltas = np.arange(NUM_VARIATIONS) - NUM_VARIATIONS // 2
+        variation_factors = 1.0 + deltas * 0.1
         
         # Create progression data for each player type
         for player_type, result in [('whale', whale_result), ('grinder', grinder_result), ('casual', casual_result)]:
@@ -56,44 +111,33 @@ def create_synthetic_progression_data():
             config = result.get('config', {})
             summary = result.get('summary', {})
             
-            # Create 16 variations around the best configuration
-            for test_num in range(16):
-                variation_config = config.copy()
-                
-                # Vary key parameters
-                if player_type == 'whale':
-                    variation_config['owner_base_points'] = config.get('owner_base_points', 2.0) + (test_num - 8) * 0.2
-                    variation_config['pack_price_dollars'] = config.get('pack_price_dollars', 3.0) + (test_num - 8) * 0.5
-                    variation_config['churn_probability_whale'] = max(0.0001, config.get('churn_probability_whale', 0.1) + (test_num - 8) * 0.01)
-                    
-                elif player_type == 'grinder':
-                    variation_config['geo_diversity_bonus'] = config.get('geo_diversity_bonus', 2.5) + (test_num - 8) * 0.2
-                    variation_config['venue_variety_bonus'] = config.get('venue_variety_bonus', 2.5) + (test_num - 8) * 0.2
-                    variation_config['churn_probability_grinder'] = max(0.0001, config.get('churn_probability_grinder', 0.0008) + (test_num - 8) * 0.0001)
-                    
-                else:  # casual
-                    variation_config['social_sneeze_bonus'] = config.get('social_sneeze_bonus', 5.0) + (test_num - 8) * 0.3
-                    variation_config['new_player_bonus_multiplier'] = config.get('new_player_bonus_multiplier', 2.0) + (test_num - 8) * 0.1
-                    variation_config['churn_probability_casual'] = max(0.0001, config.get('churn_probability_casual', 0.002) + (test_num - 8) * 0.0002)
-                
-                # Generate realistic scores based on parameter variations
-                base_score = result.get('target_score', 0)
-                variation_factor = 1.0 + (test_num - 8) * 0.1
-                
+            # Vary key parameters for all variations at once
+            varied = {}
+            for key, default, step, low, high in VARIATION_STEPS[player_type]:
+                varied[key] = np.clip(config.get(key, default) + deltas * step, low, high).tolist()
+            
+            # Generate realistic scores based on parameter variations
+            scaled = {field: (result.get(field, 0) * variation_factors).tolist() for field in SCALED_FIELDS}
+            
+            for test_num in range(NUM_VARIATIONS):
                 synthetic_result = {
-                    'config': variation_config,
+                    'config': {**config, **{key: values[test_num] for key, values in varied.items()}},
                     'summary': summary,
-                    'whale_score': result.get('whale_score', 0) * variation_factor,
-                    'grinder_score': result.get('grinder_score', 0) * variation_factor,
-                    'casual_score': result.get('casual_score', 0) * variation_factor,
-                    'overall_score': result.get('overall_score', 0) * variation_factor,
-                    'revenue': result.get('revenue', 0) * variation_factor,
+                    **{field: values[test_num] for field, values in scaled.items()},
                     'userbase': result.get('userbase', 0),
                     'player_type_focus': player_type
                 }
-                
                 synthetic_results.append(synthetic_result)
         
+        if simulate_days and synthetic_results:
+            print(f"Simulating {len(synthetic_results)} variations for {simulate_days} days...")
+            summaries = run_parameter_sweep([r['config'] for r in synthetic_results], days=simulate_days)
+            # Rescore in one vectorized pass so scores, revenue and userbase match the new summaries
+            scored = OKROptimizedAnalyzerV2(cache_dir=None).score_simulations(
+                [AdvancedGameConfig(**r['config']) for r in synthetic_results], summaries)
+            for synthetic_result, result in zip(synthetic_results, scored):
+                synthetic_result.update({field: result[field] for field in SCALED_FIELDS + ('summary', 'userbase')})
+        
         return synthetic_results
         
     except Exception as e:
@@ -102,6 +146,13 @@ def create_synthetic_progression_data():
 
 def main():
     """Main function to generate progression visualizations"""
+    parser = argparse.ArgumentParser(description='Generate progression visualizations from OKR V2 results')
+    parser.add_argument('--simulate', type=int, default=0, metavar='DAYS',
+                        help='Re-run every synthetic variation for DAYS days instead of reusing the '
+                             'best configuration\'s summary (default: 0, no simulation)')
+    args = parser.parse_args()
+    simulate_days = args.simulate
+
     print("Generating Progression Visualizations from Results")
     print("=" * 60)
     
@@ -110,7 +161,7 @@ def main():
     
     if not all_results:
         print("Creating synthetic progression data based on best configurations...")
-        all_results = create_synthetic_progression_data()
+        all_results = create_synthetic_progression_data(simulate_days)
     
     if not all_results:
         print("Failed to create progression data.")
@@ -17,25 +17,30 @@ The analyzer iteratively refines economy parameters to maximize:
 import sys
 import os
 import time
-import random
 import json
 import csv
 import numpy as np
 from typing import List, Dict, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
-# Removed parallel processing imports for sequential execution
+from dataclasses import dataclass, asdict, replace, fields
 import statistics
 from collections import defaultdict, Counter
 import argparse
 import math
+import heapq
+from contextlib import nullcontext
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import the advanced simulator
-from advanced_economy_simulator import AdvancedFYNDRSimulator, AdvancedGameConfig
+from advanced_economy_simulator import AdvancedFYNDRSimulator, AdvancedGameConfig, run_parameter_sweep, available_cpus, njit
 
 @dataclass
 class OKROptimizationResult:
     """Results from OKR-focused optimization"""
-    config: Dict[str, Any]
+    config: AdvancedGameConfig
     summary: Dict[str, Any]
     
     # OKR-specific scores
@@ -53,15 +58,97 @@ class OKROptimizationResult:
     revenue_score: float
     userbase_score: float
 
+# Summary fields read by okr_scores_kernel, in argument order, with their defaults
+OKR_SCORE_INPUTS = (
+    ('whale_purchases', 0), ('whale_count', 1), ('total_revenue', 0), ('avg_level', 1),
+    ('grinder_count', 1), ('total_stickers', 1), ('total_scans', 1), ('total_points', 1),
+    ('avg_points_per_player', 0), ('total_players', 0), ('total_players_ever', 1),
+    ('retention_rate', 0), ('avg_scans_per_player', 0), ('new_players_today', 0),
+    ('organic_purchases', 0), ('avg_consecutive_days', 0), ('grinder_purchases', 0),
+    ('casual_purchases', 0),
+)
+
+@njit(cache=True)
+def _ratio(numerator, denominator):
+    """numerator / denominator where the denominator is positive, else 0"""
+    return numerator / denominator if denominator > 0 else 0.0
+
+@njit(cache=True)
+def okr_scores_kernel(whale_purchases, whale_count, total_revenue, avg_level,
+                      grinder_count, total_stickers, total_scans, total_points,
+                      avg_points_per_player, total_players, total_players_ever,
+                      retention_rate, avg_scans_per_player, new_players_today,
+                      organic_purchases, avg_consecutive_days, grinder_purchases, casual_purchases):
+    """Score every summary from its OKR_SCORE_INPUTS columns (float64 arrays)
+
+    Returns a (7, n) array with rows whale, grinder, casual, growth, retention, organic
+    and overall score.
+    """
+    n = whale_purchases.shape[0]
+    scores = np.empty((7, n))
+    for i in range(n):
+        # Whale investment: ARPU, revenue share and level compounding
+        whale_revenue = whale_purchases[i] * 3.0  # Approximate revenue
+        whale_arpu = _ratio(whale_revenue, whale_count[i])
+        whale_revenue_share = _ratio(whale_revenue, total_revenue[i])
+        level_multiplier = 1 + (avg_level[i] - 1) * 0.1
+        whale = (whale_arpu * 0.4) + (whale_revenue_share * 100 * 0.4) + (level_multiplier * 20 * 0.2)
+        
+        # Grinder leveling: sticker density, scan activity, points per scan and leveling speed
+        sticker_density = _ratio(total_stickers[i], grinder_count[i])
+        scan_activity = _ratio(total_scans[i], grinder_count[i])
+        points_per_scan = _ratio(total_points[i], total_scans[i])
+        leveling_speed = avg_points_per_player[i] / 120  # Points per level
+        grinder = (sticker_density * 0.3) + (scan_activity * 0.3) + (points_per_scan * 0.2) + (leveling_speed * 50 * 0.2)
+        
+        # Casual social: userbase growth, retention, engagement and acquisition
+        player_base = max(total_players[i], 1.0)
+        growth_rate = (total_players_ever[i] - total_players[i]) / player_base
+        social_engagement = min(avg_scans_per_player[i] / 10, 1.0)  # Normalize to 0-1
+        acquisition_rate = new_players_today[i] / player_base
+        casual = (growth_rate * 100 * 0.3) + (retention_rate[i] * 100 * 0.3) + (social_engagement * 50 * 0.2) + (acquisition_rate * 100 * 0.2)
+        
+        # Traditional growth, retention and organic purchase scores
+        growth = total_players[i] * 0.7 + (retention_rate[i] * 1000 * 0.3)
+        retention = (retention_rate[i] * 1000) + (avg_consecutive_days[i] * 10)
+        organic = (organic_purchases[i] * 0.5) + (grinder_purchases[i] * 0.3) + (casual_purchases[i] * 0.2)
+        
+        # Overall: OKR-weighted score combined with revenue and userbase at the end of the run
+        okr = (whale * 0.4) + (grinder * 0.35) + (casual * 0.25)
+        overall = (okr * 0.5) + (total_revenue[i] * 0.3) + (total_players[i] * 0.2)
+        
+        scores[0, i] = whale
+        scores[1, i] = grinder
+        scores[2, i] = casual
+        scores[3, i] = growth
+        scores[4, i] = retention
+        scores[5, i] = organic
+        scores[6, i] = overall
+    return scores
+
 class OKROptimizedAnalyzer:
     """Analyzer optimized for the three key OKRs"""
     
-    def __init__(self):
-        self.results = []
+    def __init__(self, processes: Optional[int] = None, surrogate_top: int = 8,
+                 seed: Optional[int] = None, verbose: bool = False):
+        self.top_k = 10
+        self.top_results: List[Tuple[float, int, OKROptimizationResult]] = []  # Min-heap of the top_k
+        self._recorded = 0
         self.best_result = None
         self.iteration = 0
         self.convergence_threshold = 0.01
         self.max_iterations = 50
+        self.processes = processes  # Worker processes per sweep (None = all cores)
+        self.verbose = verbose  # Print every simulation's score, not just iteration summaries
+        self._deterministic_variations = (None, [])  # (base config, its fixed sweep)
+        self._rng = np.random.default_rng(seed)  # Exploration draws; a fixed seed makes runs reproducible
+        self._sim_cache: Dict[Tuple, OKROptimizationResult] = {}  # (config_key, days, seed) -> result
+        
+        # Surrogate pre-screening: fixed variations simulated per iteration (0 = all), and the
+        # observed score slopes per (parameter, direction of change) around previous bases
+        self.surrogate_top = surrogate_top
+        self.sensitivity_threshold = 0.5  # Fixed variations predicted to move the score less are skipped
+        self.parameter_slopes = defaultdict(list)
         
     def create_base_config(self) -> AdvancedGameConfig:
         """Create a base configuration optimized for OKRs"""
@@ -129,234 +216,234 @@ class OKROptimizedAnalyzer:
             diminishing_rates=[1.0, 0.6, 0.3],
         )
     
-    def calculate_whale_investment_score(self, summary: Dict[str, Any]) -> float:
-        """Calculate score for whale investment and compounding returns"""
-        whale_revenue = summary.get('whale_purchases', 0) * 3.0  # Approximate revenue
-        whale_count = summary.get('whale_count', 1)
-        total_revenue = summary.get('total_revenue', 1)
-        
-        # Whale revenue per whale
-        whale_arpu = whale_revenue / whale_count if whale_count > 0 else 0
-        
-        # Whale revenue as percentage of total
-        whale_revenue_share = whale_revenue / total_revenue if total_revenue > 0 else 0
-        
-        # Compounding effect (higher levels = better returns)
-        avg_level = summary.get('avg_level', 1)
-        level_multiplier = 1 + (avg_level - 1) * 0.1
-        
-        # Score combines ARPU, revenue share, and level progression
-        investment_score = (whale_arpu * 0.4) + (whale_revenue_share * 100 * 0.4) + (level_multiplier * 20 * 0.2)
-        
-        return investment_score
-    
-    def calculate_grinder_leveling_score(self, summary: Dict[str, Any]) -> float:
-        """Calculate score for grinder leveling speed and sticker density rewards"""
-        grinder_count = summary.get('grinder_count', 1)
-        total_stickers = summary.get('total_stickers', 1)
-        total_scans = summary.get('total_scans', 1)
-        
-        # Sticker density (stickers per grinder)
-        sticker_density = total_stickers / grinder_count if grinder_count > 0 else 0
-        
-        # Scan activity (scans per grinder)
-        scan_activity = total_scans / grinder_count if grinder_count > 0 else 0
-        
-        # Points per scan (efficiency)
-        total_points = summary.get('total_points', 1)
-        points_per_scan = total_points / total_scans if total_scans > 0 else 0
-        
-        # Level progression rate
-        avg_points_per_player = summary.get('avg_points_per_player', 0)
-        leveling_speed = avg_points_per_player / 120  # Points per level
-        
-        # Score combines density, activity, efficiency, and leveling
-        leveling_score = (sticker_density * 0.3) + (scan_activity * 0.3) + (points_per_scan * 0.2) + (leveling_speed * 50 * 0.2)
-        
-        return leveling_score
+    def score_results(self, configs: List[AdvancedGameConfig],
+                      summaries: List[Dict[str, Any]]) -> List[OKROptimizationResult]:
+        """Score many simulation summaries at once in okr_scores_kernel"""
+        if not summaries:
+            return []
+        columns = [np.array([summary.get(key, default) for summary in summaries], dtype=np.float64)
+                   for key, default in OKR_SCORE_INPUTS]
+        (whale_scores, grinder_scores, casual_scores, growth_scores, retention_scores,
+         organic_scores, overall_scores) = okr_scores_kernel(*columns)
+        
+        return [
+            OKROptimizationResult(
+                config=config,
+                summary=summary,
+                whale_investment_score=float(whale_score),
+                grinder_leveling_score=float(grinder_score),
+                casual_social_score=float(casual_score),
+                growth_score=float(growth_score),
+                retention_score=float(retention_score),
+                organic_purchase_score=float(organic_score),
+                overall_score=float(overall_score),
+                revenue_score=summary.get('total_revenue', 0),
+                userbase_score=summary.get('total_players', 0)
+            )
+            for config, summary, whale_score, grinder_score, casual_score, growth_score, retention_score,
+                organic_score, overall_score in zip(
+                configs, summaries, whale_scores, grinder_scores, casual_scores,
+                growth_scores, retention_scores, organic_scores, overall_scores
+            )
+        ]
     
-    def calculate_casual_social_score(self, summary: Dict[str, Any]) -> float:
-        """Calculate score for casual player social engagement and userbase growth"""
-        casual_count = summary.get('casual_count', 1)
-        total_players = summary.get('total_players', 1)
-        total_players_ever = summary.get('total_players_ever', 1)
-        
-        # Userbase growth
-        growth_rate = (total_players_ever - total_players) / max(total_players, 1)
-        
-        # Casual player retention
-        retention_rate = summary.get('retention_rate', 0)
-        
-        # Social engagement (approximated by diversity metrics)
-        avg_scans_per_player = summary.get('avg_scans_per_player', 0)
-        social_engagement = min(avg_scans_per_player / 10, 1.0)  # Normalize to 0-1
-        
-        # New player acquisition
-        new_players = summary.get('new_players_today', 0)
-        acquisition_rate = new_players / max(total_players, 1)
-        
-        # Score combines growth, retention, engagement, and acquisition
-        social_score = (growth_rate * 100 * 0.3) + (retention_rate * 100 * 0.3) + (social_engagement * 50 * 0.2) + (acquisition_rate * 100 * 0.2)
-        
-        return social_score
+    def generate_parameter_variations(self, base_config: AdvancedGameConfig, iteration: int,
+                                      convergence_count: int = 0) -> List[AdvancedGameConfig]:
+        """Generate parameter variations for iterative optimization
+
+        The fixed sweep only depends on base_config, so it is rebuilt only after the
+        base changes; the random exploration configs are drawn fresh every call, fewer
+        of them as iterations without improvement pile up.
+        """
+        cached_base, deterministic = self._deterministic_variations
+        if cached_base is not base_config:
+            deterministic = [config for config in self._build_deterministic_variations(base_config)
+                             if self._validate(config)]
+            self._deterministic_variations = (base_config, deterministic)
+        random_count = max(1, 5 - 2 * convergence_count)
+        variations = deterministic + [config for config in self._build_random_variations(base_config, random_count)
+                                      if self._validate(config)]
+        
+        # Identical configs would only reproduce the same score; keep the first of each
+        unique = {}
+        for config in variations:
+            unique.setdefault(self.config_key(config), config)
+        return list(unique.values())
     
-    def calculate_traditional_scores(self, summary: Dict[str, Any]) -> Tuple[float, float, float]:
-        """Calculate traditional growth, retention, and organic purchase scores"""
-        total_players = summary.get('total_players', 0)
-        retention_rate = summary.get('retention_rate', 0)
-        organic_purchases = summary.get('organic_purchases', 0)
-        
-        # Growth score
-        growth_score = total_players * 0.7 + (retention_rate * 1000 * 0.3)
-        
-        # Retention score
-        avg_consecutive_days = summary.get('avg_consecutive_days', 0)
-        retention_score = (retention_rate * 1000) + (avg_consecutive_days * 10)
-        
-        # Organic purchase score
-        grinder_purchases = summary.get('grinder_purchases', 0)
-        casual_purchases = summary.get('casual_purchases', 0)
-        organic_score = (organic_purchases * 0.5) + (grinder_purchases * 0.3) + (casual_purchases * 0.2)
-        
-        return growth_score, retention_score, organic_score
+    @staticmethod
+    def config_key(config: AdvancedGameConfig) -> Tuple:
+        """Hashable identity of a config's parameter values"""
+        return tuple((name, _freeze(getattr(config, name))) for name in _CONFIG_FIELDS)
     
-    def calculate_overall_score(self, whale_score: float, grinder_score: float, casual_score: float,
-                              growth_score: float, retention_score: float, organic_score: float,
-                              summary: Dict[str, Any]) -> Tuple[float, float, float]:
-        """Calculate overall performance scores"""
-        
-        # OKR-weighted score (prioritizes the three key objectives)
-        okr_score = (whale_score * 0.4) + (grinder_score * 0.35) + (casual_score * 0.25)
-        
-        # Revenue score (total revenue at end of 270 days)
-        total_revenue = summary.get('total_revenue', 0)
-        revenue_score = total_revenue
-        
-        # Userbase score (total active players at end of 270 days)
-        total_players = summary.get('total_players', 0)
-        userbase_score = total_players
-        
-        # Overall score combines OKR performance with revenue and userbase
-        overall_score = (okr_score * 0.5) + (revenue_score * 0.3) + (userbase_score * 0.2)
-        
-        return overall_score, revenue_score, userbase_score
+    @staticmethod
+    def _validate(config: AdvancedGameConfig) -> bool:
+        """Cheap range checks so configs that cannot make sense are never simulated"""
+        churn = (config.churn_probability_base, config.churn_probability_whale,
+                 config.churn_probability_grinder, config.churn_probability_casual)
+        return (config.sticker_scan_cooldown_hours > 0
+                and all(0.0 <= p <= 1.0 for p in churn)
+                and config.pack_price_dollars > 0
+                and config.pack_price_points > 0
+                and config.owner_base_points > 0
+                and config.scanner_base_points >= 0
+                and config.new_player_bonus_multiplier > 0
+                and all(m > 0 for m in config.level_multipliers))
     
-    def generate_parameter_variations(self, base_config: AdvancedGameConfig, iteration: int) -> List[AdvancedGameConfig]:
-        """Generate parameter variations for iterative optimization"""
-        variations = []
-        
-        # Base configuration
-        variations.append(base_config)
-        
+    def _build_deterministic_variations(self, base_config: AdvancedGameConfig) -> List[AdvancedGameConfig]:
+        """Fixed whale, grinder, casual and economy variations around base_config"""
         # BROAD whale optimization variations
         whale_variations = [
             # Much higher base points for better whale returns
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 2.0}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 2.5}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 3.0}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 3.5}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 4.0}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 5.0}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'owner_base_points': 6.0}),
+            replace(base_config, owner_base_points=2.0),
+            replace(base_config, owner_base_points=2.5),
+            replace(base_config, owner_base_points=3.0),
+            replace(base_config, owner_base_points=3.5),
+            replace(base_config, owner_base_points=4.0),
+            replace(base_config, owner_base_points=5.0),
+            replace(base_config, owner_base_points=6.0),
             # Much better progression multipliers
-            AdvancedGameConfig(**{**base_config.__dict__, 'level_multipliers': [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0]}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'level_multipliers': [1.0, 1.15, 1.3, 1.45, 1.6, 1.75, 1.9, 2.05, 2.2, 2.35, 2.5]}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'level_multipliers': [1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.2, 2.4, 2.6, 2.8, 3.0]}),
+            replace(base_config, level_multipliers=[1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0]),
+            replace(base_config, level_multipliers=[1.0, 1.15, 1.3, 1.45, 1.6, 1.75, 1.9, 2.05, 2.2, 2.35, 2.5]),
+            replace(base_config, level_multipliers=[1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.2, 2.4, 2.6, 2.8, 3.0]),
             # Much lower whale churn
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_whale': 0.0001}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_whale': 0.0002}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_whale': 0.0003}),
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_whale': 0.0005}),
+            replace(base_config, churn_probability_whale=0.0001),
+            replace(base_config, churn_probability_whale=0.0002),
+            replace(base_config, churn_probability_whale=0.0003),
+            replace(base_config, churn_probability_whale=0.0005),
         ]
         
         # Grinder optimization variations
         grinder_variations = [
             # Higher diversity bonuses
-            AdvancedGameConfig(**{**base_config.__dict__, 'geo_diversity_bonus': base_config.geo_diversity_bonus * 1.2}),
+            replace(base_config, geo_diversity_bonus=base_config.geo_diversity_bonus * 1.2),
             # Better scan cooldown
-            AdvancedGameConfig(**{**base_config.__dict__, 'sticker_scan_cooldown_hours': base_config.sticker_scan_cooldown_hours - 2}),
+            replace(base_config, sticker_scan_cooldown_hours=base_config.sticker_scan_cooldown_hours - 2),
             # Lower grinder churn
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_grinder': base_config.churn_probability_grinder * 0.9}),
+            replace(base_config, churn_probability_grinder=base_config.churn_probability_grinder * 0.9),
         ]
         
         # Casual social optimization variations
         casual_variations = [
             # Enhanced social mechanics
-            AdvancedGameConfig(**{**base_config.__dict__, 'social_sneeze_bonus': base_config.social_sneeze_bonus * 1.3}),
+            replace(base_config, social_sneeze_bonus=base_config.social_sneeze_bonus * 1.3),
             # Better new player experience
-            AdvancedGameConfig(**{**base_config.__dict__, 'new_player_bonus_multiplier': base_config.new_player_bonus_multiplier * 1.2}),
+            replace(base_config, new_player_bonus_multiplier=base_config.new_player_bonus_multiplier * 1.2),
             # Lower casual churn
-            AdvancedGameConfig(**{**base_config.__dict__, 'churn_probability_casual': base_config.churn_probability_casual * 0.9}),
+            replace(base_config, churn_probability_casual=base_config.churn_probability_casual * 0.9),
         ]
         
         # Economy balance variations
         economy_variations = [
             # Slightly lower pack price for accessibility
-            AdvancedGameConfig(**{**base_config.__dict__, 'pack_price_dollars': base_config.pack_price_dollars * 0.95}),
+            replace(base_config, pack_price_dollars=base_config.pack_price_dollars * 0.95),
             # Better point conversion
-            AdvancedGameConfig(**{**base_config.__dict__, 'points_per_dollar': base_config.points_per_dollar * 1.1}),
+            replace(base_config, points_per_dollar=base_config.points_per_dollar * 1.1),
         ]
         
         # Combine variations
-        all_variations = whale_variations + grinder_variations + casual_variations + economy_variations
-        
-        # Add some random variations for exploration
-        for _ in range(5):
-            random_config = AdvancedGameConfig(**base_config.__dict__)
-            
-            # Randomly adjust key parameters
-            random_config.owner_base_points *= random.uniform(0.9, 1.1)
-            random_config.geo_diversity_bonus *= random.uniform(0.9, 1.1)
-            random_config.social_sneeze_bonus *= random.uniform(0.9, 1.1)
-            random_config.churn_probability_whale *= random.uniform(0.8, 1.2)
-            random_config.churn_probability_grinder *= random.uniform(0.8, 1.2)
-            random_config.churn_probability_casual *= random.uniform(0.8, 1.2)
-            
-            all_variations.append(random_config)
-        
-        return all_variations
+        return whale_variations + grinder_variations + casual_variations + economy_variations
     
-    def run_single_simulation(self, config: AdvancedGameConfig, days: int = 270) -> Optional[OKROptimizationResult]:
-        """Run a single simulation and calculate OKR scores"""
-        try:
-            simulator = AdvancedFYNDRSimulator(config)
-            simulator.run_simulation(days)
-            summary = simulator.get_economy_summary()
-            
-            # Calculate OKR-specific scores
-            whale_score = self.calculate_whale_investment_score(summary)
-            grinder_score = self.calculate_grinder_leveling_score(summary)
-            casual_score = self.calculate_casual_social_score(summary)
-            
-            # Calculate traditional scores
-            growth_score, retention_score, organic_score = self.calculate_traditional_scores(summary)
-            
-            # Calculate overall scores
-            overall_score, revenue_score, userbase_score = self.calculate_overall_score(
-                whale_score, grinder_score, casual_score,
-                growth_score, retention_score, organic_score,
-                summary
+    def _build_random_variations(self, base_config: AdvancedGameConfig, count: int = 5) -> List[AdvancedGameConfig]:
+        """Random perturbations of key parameters around base_config, for exploration"""
+        # Draw every multiplier in two batches: +-10% for point values, +-20% for churn rates
+        points = self._rng.uniform(0.9, 1.1, (count, 3)).tolist()
+        churn = self._rng.uniform(0.8, 1.2, (count, 3)).tolist()
+        return [
+            replace(
+                base_config,
+                owner_base_points=base_config.owner_base_points * owner,
+                geo_diversity_bonus=base_config.geo_diversity_bonus * geo,
+                social_sneeze_bonus=base_config.social_sneeze_bonus * social,
+                churn_probability_whale=base_config.churn_probability_whale * whale,
+                churn_probability_grinder=base_config.churn_probability_grinder * grinder,
+                churn_probability_casual=base_config.churn_probability_casual * casual,
             )
-            
-            return OKROptimizationResult(
-                config=config.__dict__,
-                summary=summary,
-                whale_investment_score=whale_score,
-                grinder_leveling_score=grinder_score,
-                casual_social_score=casual_score,
-                growth_score=growth_score,
-                retention_score=retention_score,
-                organic_purchase_score=organic_score,
-                overall_score=overall_score,
-                revenue_score=revenue_score,
-                userbase_score=userbase_score
-            )
-            
-        except Exception as e:
-            print(f"Error in simulation: {e}")
-            return None
+            for (owner, geo, social), (whale, grinder, casual) in zip(points, churn)
+        ]
+    
+    @staticmethod
+    def parameter_changes(base_config: AdvancedGameConfig,
+                          config: AdvancedGameConfig) -> List[Tuple[str, float]]:
+        """(field, numeric change) for every field that differs; list fields change by their sum"""
+        changes = []
+        for name in _CONFIG_FIELDS:
+            base_value, value = getattr(base_config, name), getattr(config, name)
+            if value == base_value:
+                continue
+            if isinstance(value, list):
+                value, base_value = sum(value), sum(base_value)
+            if isinstance(value, (int, float)) and isinstance(base_value, (int, float)):
+                changes.append((name, float(value - base_value)))
+        return changes
     
-    def run_iterative_optimization(self, max_iterations: int = 50, days: int = 270) -> OKROptimizationResult:
+    def predict_score_change(self, base_config: AdvancedGameConfig, config: AdvancedGameConfig) -> float:
+        """Linearized score change from the learned slopes; +inf while any slope is still unknown"""
+        predicted = 0.0
+        for name, change in self.parameter_changes(base_config, config):
+            slopes = self.parameter_slopes.get((name, change > 0))
+            if not slopes:
+                return math.inf
+            predicted += sum(slopes) / len(slopes) * change
+        return predicted
+    
+    def screen_variations(self, base_config: AdvancedGameConfig,
+                          variations: List[AdvancedGameConfig]) -> List[AdvancedGameConfig]:
+        """Keep the surrogate's top fixed variations plus every random exploration config
+
+        Only fixed variations whose slopes are all learned compete for the surrogate_top slots;
+        those with an unknown prediction are always simulated (which is how their slopes get
+        learned). Fixed variations on parameters the score has proven insensitive to are dropped first.
+        """
+        if not self.surrogate_top:
+            return variations
+        fixed = self._deterministic_variations[1] if self._deterministic_variations[0] is base_config else []
+        fixed_ids = {id(config) for config in fixed}
+        predicted = {id(config): self.predict_score_change(base_config, config)
+                     for config in variations if id(config) in fixed_ids}
+        candidates = [config for config in variations
+                      if math.isfinite(predicted.get(id(config), math.inf))
+                      and abs(predicted[id(config)]) >= self.sensitivity_threshold]
+        ranked = sorted(candidates, key=lambda config: predicted[id(config)], reverse=True)
+        keep = {id(config) for config in ranked[:self.surrogate_top]}
+        return [config for config in variations
+                if not math.isfinite(predicted.get(id(config), math.inf)) or id(config) in keep]
+    
+    def learn_parameter_slopes(self, base_config: AdvancedGameConfig, base_score: float,
+                               scored: List[Tuple[AdvancedGameConfig, OKROptimizationResult]]):
+        """Record score slopes from simulated variations that changed exactly one parameter"""
+        for config, result in scored:
+            changes = self.parameter_changes(base_config, config)
+            if len(changes) != 1:
+                continue
+            name, change = changes[0]
+            self.parameter_slopes[(name, change > 0)].append((result.overall_score - base_score) / change)
+    
+    def run_single_simulation(self, config: AdvancedGameConfig, days: int = 270,
+                              seed: int = 0) -> OKROptimizationResult:
+        """Run a single simulation and calculate OKR scores (memoized per config, days and seed)"""
+        key = (self.config_key(config), days, seed)
+        if key not in self._sim_cache:
+            summary = _run_sim_worker(asdict(config), seed, days)
+            self._sim_cache[key] = self.score_results([config], [summary])[0]
+        return self._sim_cache[key]
+    
+    def record_results(self, iteration: int, results: List[OKROptimizationResult], log=None):
+        """Append newly simulated results to the NDJSON log and fold them into the top-k heap"""
+        for result in results:
+            if log is not None:
+                record = {'iteration': iteration, 'score': result.overall_score, 'config': asdict(result.config)}
+                log.write(orjson.dumps(record) + b"\n" if orjson else (json.dumps(record) + "\n").encode())
+            entry = (result.overall_score, self._recorded, result)
+            self._recorded += 1
+            if len(self.top_results) < self.top_k:
+                heapq.heappush(self.top_results, entry)
+            else:
+                heapq.heappushpop(self.top_results, entry)
+        if log is not None:
+            log.flush()
+    
+    def run_iterative_optimization(self, max_iterations: int = 50, days: int = 270,
+                                   log_path: Optional[str] = None) -> OKROptimizationResult:
         """Run iterative optimization to find the best economy parameters"""
         print("=" * 80)
         print("OKR-OPTIMIZED FYNDR ECONOMY ANALYSIS")
@@ -368,64 +455,95 @@ class OKROptimizedAnalyzer:
         print(f"Target: Maximum revenue + active userbase after {days} days")
         print()
         
-        # Start with base configuration
+        # Start with base configuration; its score is only known once it came out of a sweep
         current_config = self.create_base_config()
+        current_score = None
         best_score = 0
         convergence_count = 0
         
-        for iteration in range(max_iterations):
-            self.iteration = iteration
-            print(f"Iteration {iteration + 1}/{max_iterations}")
-            
-            # Generate parameter variations
-            variations = self.generate_parameter_variations(current_config, iteration)
-            print(f"Testing {len(variations)} parameter variations...")
+        # Every newly simulated result goes to the NDJSON log as it arrives; only the
+        # top_k results stay in memory
+        with (open(log_path, 'wb') if log_path else nullcontext()) as log:
+            for iteration in range(max_iterations):
+                self.iteration = iteration
+                # One write per iteration; per-simulation lines only with verbose
+                lines = [f"Iteration {iteration + 1}/{max_iterations}"]
             
-            # Run simulations sequentially with progress tracking
-            results = []
-            for i, config in enumerate(variations):
-                progress = (i + 1) / len(variations) * 100
-                print(f"  Running simulation {i+1}/{len(variations)} ({progress:.1f}%)...", end=" ")
-                result = self.run_single_simulation(config, days)
-                if result is not None:
-                    results.append(result)
-                    print(f"Score: {result.overall_score:.2f}")
+                # Generate parameter variations
+                variations = self.generate_parameter_variations(current_config, iteration, convergence_count)
+                screened = self.screen_variations(current_config, variations)
+                if len(screened) < len(variations):
+                    lines.append(f"Testing {len(screened)} of {len(variations)} parameter variations "
+                                 f"(surrogate skipped {len(variations) - len(screened)})...")
                 else:
-                    print("Failed")
+                    lines.append(f"Testing {len(variations)} parameter variations...")
+                variations = screened
             
-            if not results:
-                print("No successful simulations in this iteration")
-                continue
+                # Run the configs not simulated before on a process pool; every variation uses the
+                # same seed so score differences come from the parameters rather than the random stream
+                keys = [(self.config_key(config), days, 0) for config in variations]
+                pending = [(config, key) for config, key in zip(variations, keys) if key not in self._sim_cache]
+                sweep = run_parameter_sweep([config for config, _ in pending], days=days, seeds=[0] * len(pending),
+                                            max_workers=self.processes, worker=_run_sim_worker,
+                                            return_exceptions=True)
+                outcomes = dict(zip([key for _, key in pending], sweep))
+                succeeded = [(config, key, outcomes[key]) for config, key in pending
+                             if not isinstance(outcomes[key], Exception)]
+                self._sim_cache.update(zip([key for _, key, _ in succeeded],
+                                           self.score_results([config for config, _, _ in succeeded],
+                                                              [summary for _, _, summary in succeeded])))
             
-            # Sort by overall score
-            results.sort(key=lambda x: x.overall_score, reverse=True)
-            best_result = results[0]
+                scored = []
+                for i, (config, key) in enumerate(zip(variations, keys)):
+                    if key in self._sim_cache:
+                        result = self._sim_cache[key]
+                        scored.append((config, result))
+                        cached = "" if key in outcomes else " (cached)"
+                        if self.verbose:
+                            lines.append(f"  Simulation {i+1}/{len(variations)}: Score: {result.overall_score:.2f}{cached}")
+                    else:
+                        lines.append(f"  Simulation {i+1}/{len(variations)}: Failed ({outcomes[key]!r})")
+                results = [result for _, result in scored]
+                self.record_results(iteration, [self._sim_cache[key] for _, key, _ in succeeded], log)
+                if current_score is not None:
+                    self.learn_parameter_slopes(current_config, current_score, scored)
             
-            print(f"Best score this iteration: {best_result.overall_score:.2f}")
-            print(f"  Whale Investment: {best_result.whale_investment_score:.2f}")
-            print(f"  Grinder Leveling: {best_result.grinder_leveling_score:.2f}")
-            print(f"  Casual Social: {best_result.casual_social_score:.2f}")
-            print(f"  Revenue: ${best_result.revenue_score:.2f}")
-            print(f"  Userbase: {best_result.userbase_score}")
+                if not results:
+                    lines.append("No successful simulations in this iteration")
+                    sys.stdout.write("\n".join(lines) + "\n\n")
+                    continue
             
-            # Check for improvement
-            if best_result.overall_score > best_score:
-                improvement = best_result.overall_score - best_score
-                print(f"Improvement: +{improvement:.2f}")
-                best_score = best_result.overall_score
-                self.best_result = best_result
-                current_config = AdvancedGameConfig(**best_result.config)
-                convergence_count = 0
-            else:
-                convergence_count += 1
-                print("No improvement - convergence count:", convergence_count)
+                # Sort by overall score
+                results.sort(key=lambda x: x.overall_score, reverse=True)
+                best_result = results[0]
             
-            # Check for convergence
-            if convergence_count >= 3:
-                print("Converged - no improvement for 3 iterations")
-                break
+                lines.append(f"Best score this iteration: {best_result.overall_score:.2f}")
+                lines.append(f"  Whale Investment: {best_result.whale_investment_score:.2f}")
+                lines.append(f"  Grinder Leveling: {best_result.grinder_leveling_score:.2f}")
+                lines.append(f"  Casual Social: {best_result.casual_social_score:.2f}")
+                lines.append(f"  Revenue: ${best_result.revenue_score:.2f}")
+                lines.append(f"  Userbase: {best_result.userbase_score}")
             
-            print()
+                # Check for improvement
+                if best_result.overall_score > best_score:
+                    improvement = best_result.overall_score - best_score
+                    lines.append(f"Improvement: +{improvement:.2f}")
+                    best_score = best_result.overall_score
+                    self.best_result = best_result
+                    current_config = best_result.config
+                    current_score = best_score
+                    convergence_count = 0
+                else:
+                    convergence_count += 1
+                    lines.append(f"No improvement - convergence count: {convergence_count}")
+            
+                # Check for convergence
+                if convergence_count >= 3:
+                    lines.append("Converged - no improvement for 3 iterations")
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    break
+            
+                sys.stdout.write("\n".join(lines) + "\n\n")
         
         print("=" * 80)
         print("OPTIMIZATION COMPLETE")
@@ -456,51 +574,67 @@ class OKROptimizedAnalyzer:
         print("DETAILED OKR ANALYSIS")
         print("=" * 80)
         
+        # Shared figures, looked up once
+        get = summary.get
+        whale_revenue = get('whale_purchases', 0) * 3.0
+        whale_count = get('whale_count', 0)
+        grinder_count = get('grinder_count', 0)
+        total_stickers = get('total_stickers', 0)
+        total_scans = get('total_scans', 0)
+        total_players = get('total_players', 0)
+        total_players_ever = get('total_players_ever', 0)
+        total_revenue = get('total_revenue', 0)
+        # Divisors, floored at 1 so empty economies don't divide by zero
+        whale_base = max(whale_count, 1)
+        grinder_base = max(grinder_count, 1)
+        revenue_base = max(total_revenue, 1)
+        players_base = max(total_players, 1)
+        points_per_scan = get('total_points', 0) / max(total_scans, 1)
+        
         # Whale Analysis
         print("\n🐋 WHALE INVESTMENT ANALYSIS:")
-        print(f"  Total Whale Revenue: ${summary.get('whale_purchases', 0) * 3.0:.2f}")
-        print(f"  Whale Count: {summary.get('whale_count', 0)}")
-        print(f"  Whale ARPU: ${(summary.get('whale_purchases', 0) * 3.0) / max(summary.get('whale_count', 1), 1):.2f}")
-        print(f"  Whale Revenue Share: {(summary.get('whale_purchases', 0) * 3.0) / max(summary.get('total_revenue', 1), 1) * 100:.1f}%")
-        print(f"  Average Player Level: {summary.get('avg_level', 1):.1f}")
+        print(f"  Total Whale Revenue: ${whale_revenue:.2f}")
+        print(f"  Whale Count: {whale_count}")
+        print(f"  Whale ARPU: ${whale_revenue / whale_base:.2f}")
+        print(f"  Whale Revenue Share: {whale_revenue / revenue_base * 100:.1f}%")
+        print(f"  Average Player Level: {get('avg_level', 1):.1f}")
         
         # Grinder Analysis
         print("\n⚡ GRINDER LEVELING ANALYSIS:")
-        print(f"  Grinder Count: {summary.get('grinder_count', 0)}")
-        print(f"  Total Stickers: {summary.get('total_stickers', 0)}")
-        print(f"  Sticker Density: {summary.get('total_stickers', 0) / max(summary.get('grinder_count', 1), 1):.1f} stickers/grinder")
-        print(f"  Total Scans: {summary.get('total_scans', 0)}")
-        print(f"  Scan Activity: {summary.get('total_scans', 0) / max(summary.get('grinder_count', 1), 1):.1f} scans/grinder")
-        print(f"  Points per Scan: {summary.get('total_points', 0) / max(summary.get('total_scans', 1), 1):.2f}")
+        print(f"  Grinder Count: {grinder_count}")
+        print(f"  Total Stickers: {total_stickers}")
+        print(f"  Sticker Density: {total_stickers / grinder_base:.1f} stickers/grinder")
+        print(f"  Total Scans: {total_scans}")
+        print(f"  Scan Activity: {total_scans / grinder_base:.1f} scans/grinder")
+        print(f"  Points per Scan: {points_per_scan:.2f}")
         
         # Casual Social Analysis
         print("\n👥 CASUAL SOCIAL ANALYSIS:")
-        print(f"  Casual Count: {summary.get('casual_count', 0)}")
-        print(f"  Total Players: {summary.get('total_players', 0)}")
-        print(f"  Total Players Ever: {summary.get('total_players_ever', 0)}")
-        print(f"  Growth Rate: {(summary.get('total_players_ever', 0) - summary.get('total_players', 0)) / max(summary.get('total_players', 1), 1) * 100:.1f}%")
-        print(f"  Retention Rate: {summary.get('retention_rate', 0) * 100:.1f}%")
-        print(f"  Average Scans per Player: {summary.get('avg_scans_per_player', 0):.1f}")
+        print(f"  Casual Count: {get('casual_count', 0)}")
+        print(f"  Total Players: {total_players}")
+        print(f"  Total Players Ever: {total_players_ever}")
+        print(f"  Growth Rate: {(total_players_ever - total_players) / players_base * 100:.1f}%")
+        print(f"  Retention Rate: {get('retention_rate', 0) * 100:.1f}%")
+        print(f"  Average Scans per Player: {get('avg_scans_per_player', 0):.1f}")
         
         # Economy Summary
         print("\n💰 ECONOMY SUMMARY:")
-        print(f"  Total Revenue: ${summary.get('total_revenue', 0):.2f}")
-        print(f"  Organic Purchases: {summary.get('organic_purchases', 0)}")
-        print(f"  Average Points per Player: {summary.get('avg_points_per_player', 0):.1f}")
-        print(f"  Points per Scan: {summary.get('total_points', 0) / max(summary.get('total_scans', 1), 1):.2f}")
+        print(f"  Total Revenue: ${total_revenue:.2f}")
+        print(f"  Organic Purchases: {get('organic_purchases', 0)}")
+        print(f"  Average Points per Player: {get('avg_points_per_player', 0):.1f}")
         
         # Optimal Parameters
         print("\n🎯 OPTIMAL PARAMETERS:")
         config = result.config
-        print(f"  Owner Base Points: {config.get('owner_base_points', 0):.2f}")
-        print(f"  Scanner Base Points: {config.get('scanner_base_points', 0):.2f}")
-        print(f"  Geo Diversity Bonus: {config.get('geo_diversity_bonus', 0):.2f}")
-        print(f"  Social Sneeze Bonus: {config.get('social_sneeze_bonus', 0):.2f}")
-        print(f"  Daily Scan Cap: {config.get('daily_scan_cap', 0)}")
-        print(f"  Pack Price: ${config.get('pack_price_dollars', 0):.2f}")
-        print(f"  Whale Churn Rate: {config.get('churn_probability_whale', 0):.4f}")
-        print(f"  Grinder Churn Rate: {config.get('churn_probability_grinder', 0):.4f}")
-        print(f"  Casual Churn Rate: {config.get('churn_probability_casual', 0):.4f}")
+        print(f"  Owner Base Points: {config.owner_base_points:.2f}")
+        print(f"  Scanner Base Points: {config.scanner_base_points:.2f}")
+        print(f"  Geo Diversity Bonus: {config.geo_diversity_bonus:.2f}")
+        print(f"  Social Sneeze Bonus: {config.social_sneeze_bonus:.2f}")
+        print(f"  Scan Cooldown: {config.sticker_scan_cooldown_hours}h")
+        print(f"  Pack Price: ${config.pack_price_dollars:.2f}")
+        print(f"  Whale Churn Rate: {config.churn_probability_whale:.4f}")
+        print(f"  Grinder Churn Rate: {config.churn_probability_grinder:.4f}")
+        print(f"  Casual Churn Rate: {config.churn_probability_casual:.4f}")
     
     def export_results(self, prefix: str = "okr_optimized"):
         """Export optimization results"""
@@ -511,7 +645,7 @@ class OKROptimizedAnalyzer:
         # Export detailed results
         export_data = {
             'optimization_result': {
-                'config': self.best_result.config,
+                'config': asdict(self.best_result.config),
                 'summary': self.best_result.summary,
                 'whale_investment_score': self.best_result.whale_investment_score,
                 'grinder_leveling_score': self.best_result.grinder_leveling_score,
@@ -523,6 +657,10 @@ class OKROptimizedAnalyzer:
                 'revenue_score': self.best_result.revenue_score,
                 'userbase_score': self.best_result.userbase_score,
             },
+            'top_results': [
+                {'overall_score': score, 'config': asdict(result.config)}
+                for score, _, result in sorted(self.top_results, key=lambda entry: entry[:2], reverse=True)
+            ],
             'optimization_metadata': {
                 'iterations': self.iteration + 1,
                 'convergence_threshold': self.convergence_threshold,
@@ -530,31 +668,50 @@ class OKROptimizedAnalyzer:
             }
         }
         
-        with open(f'{prefix}_results.json', 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson:
+            with open(f'{prefix}_results.json', 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(f'{prefix}_results.json', 'w') as f:
+                json.dump(export_data, f, indent=2)
         
         # Export CSV summary
+        result = self.best_result
+        rows = [
+            ['metric', 'value'],
+            ['overall_score', result.overall_score],
+            ['whale_investment_score', result.whale_investment_score],
+            ['grinder_leveling_score', result.grinder_leveling_score],
+            ['casual_social_score', result.casual_social_score],
+            ['revenue_score', result.revenue_score],
+            ['userbase_score', result.userbase_score],
+            ['total_revenue', result.summary.get('total_revenue', 0)],
+            ['total_players', result.summary.get('total_players', 0)],
+            ['whale_count', result.summary.get('whale_count', 0)],
+            ['grinder_count', result.summary.get('grinder_count', 0)],
+            ['casual_count', result.summary.get('casual_count', 0)],
+        ]
         with open(f'{prefix}_summary.csv', 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'metric', 'value'
-            ])
-            
-            result = self.best_result
-            writer.writerow(['overall_score', result.overall_score])
-            writer.writerow(['whale_investment_score', result.whale_investment_score])
-            writer.writerow(['grinder_leveling_score', result.grinder_leveling_score])
-            writer.writerow(['casual_social_score', result.casual_social_score])
-            writer.writerow(['revenue_score', result.revenue_score])
-            writer.writerow(['userbase_score', result.userbase_score])
-            writer.writerow(['total_revenue', result.summary.get('total_revenue', 0)])
-            writer.writerow(['total_players', result.summary.get('total_players', 0)])
-            writer.writerow(['whale_count', result.summary.get('whale_count', 0)])
-            writer.writerow(['grinder_count', result.summary.get('grinder_count', 0)])
-            writer.writerow(['casual_count', result.summary.get('casual_count', 0)])
+            csv.writer(f).writerows(rows)
         
         print(f"Results exported to {prefix}_results.json and {prefix}_summary.csv")
 
+_CONFIG_FIELDS = tuple(field.name for field in fields(AdvancedGameConfig))
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a config value: lists become tuples, dicts sorted item tuples"""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+def _run_sim_worker(config_dict: Dict[str, Any], seed: int, days: int) -> Dict[str, Any]:
+    """Process-pool entry point: simulate one variation and return its summary"""
+    simulator = AdvancedFYNDRSimulator(AdvancedGameConfig(**config_dict), seed=seed)
+    simulator.run_simulation(days)
+    return simulator.get_economy_summary()
+
 def main():
     """Main function to run OKR-optimized analysis"""
     parser = argparse.ArgumentParser(description='OKR-Optimized FYNDR Economy Analyzer')
@@ -562,7 +719,14 @@ def main():
                        help='Maximum number of optimization iterations')
     parser.add_argument('--days', type=int, default=270, 
                        help='Number of days to simulate')
-    # Removed processes argument - now runs sequentially
+    parser.add_argument('--processes', type=int, default=None,
+                       help='Worker processes for each sweep (default: all cores)')
+    parser.add_argument('--surrogate-top', type=int, default=8,
+                       help='Fixed variations simulated per iteration after surrogate screening (0 = all)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Seed for the random exploration variations (default: unseeded)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print the score of every simulation')
     parser.add_argument('--prefix', type=str, default='okr_optimized', 
                        help='Prefix for output files')
     
@@ -572,16 +736,19 @@ def main():
     print("=" * 50)
     print(f"Max Iterations: {args.iterations}")
     print(f"Simulation Days: {args.days}")
+    print(f"Processes: {args.processes or available_cpus()}")
     print()
     
     # Create analyzer
-    analyzer = OKROptimizedAnalyzer()
+    analyzer = OKROptimizedAnalyzer(processes=args.processes, surrogate_top=args.surrogate_top,
+                                    seed=args.seed, verbose=args.verbose)
     
     # Run optimization
     start_time = time.time()
     best_result = analyzer.run_iterative_optimization(
         max_iterations=args.iterations,
-        days=args.days
+        days=args.days,
+        log_path=f'{args.prefix}_all_runs.ndjson'
     )
     end_time = time.time()
     
@@ -15,24 +15,297 @@ how they work together, rather than using a one-size-fits-all approach.
 import sys
 import os
 import time
-import random
 import json
 import csv
+import hashlib
 import numpy as np
-from typing import List, Dict, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Tuple, Any, Optional, Callable
+from dataclasses import dataclass, asdict, fields, replace
 import statistics
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import argparse
 import math
+from functools import partial
+from types import MappingProxyType
 
 # Import the advanced simulator
-from advanced_economy_simulator import AdvancedFYNDRSimulator, AdvancedGameConfig
+from advanced_economy_simulator import (AdvancedFYNDRSimulator, AdvancedGameConfig, pooled_simulator,
+                                       run_parameter_sweep, available_cpus, njit, SIMULATOR_VERSION)
 
-# Import visualization engine
-from visualization_engine import FYNDRVisualizationEngine
+try:
+    from skopt import Optimizer
+    from skopt.space import Integer, Real
+except ImportError:
+    Optimizer = None
 
-@dataclass
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bayesian search bounds per phase, spanning the hand-picked grids below; int bounds give an
+# Integer dimension, float bounds a Real one (log-uniform for churn probabilities). List-valued
+# parameters are not searched: the whale grid's level_multipliers curves are grid-only, and a
+# Bayesian whale phase keeps the base config's curve. Parameters the simulator never reads
+# (weekly_earn_cap, daily_passive_cap, social_sneeze_bonus/_cap, new_player_free_packs) are left
+# out too: they would be flat dimensions; only the grids still vary them, as they always did
+SEARCH_SPACES = {
+    'whale': {
+        'owner_base_points': (2.0, 6.0),
+        'scanner_base_points': (1.0, 1.6),
+        'churn_probability_whale': (0.0001, 0.1),
+        'pack_price_dollars': (0.5, 20.0),
+        'points_per_dollar': (10.0, 200.0),
+    },
+    'grinder': {
+        'geo_diversity_bonus': (1.0, 2.5),
+        'venue_variety_bonus': (1.0, 2.5),
+        'sticker_scan_cooldown_hours': (4, 11),
+        'churn_probability_grinder': (0.0003, 0.0008),
+        'pack_price_points': (200, 350),
+        'points_per_dollar': (100.0, 130.0),
+    },
+    'casual': {
+        'new_player_bonus_multiplier': (2.0, 3.5),
+        'churn_probability_casual': (0.0008, 0.002),
+        'event_frequency_days': (15, 30),
+        'event_duration_days': (7, 12),
+        'streak_bonus_multiplier': (1.5, 2.5),
+        'comeback_bonus_multiplier': (2.0, 3.0),
+    },
+}
+
+# Balanced base configuration every phase starts from; read-only (list fields are tuples)
+BASE_CONFIG_KWARGS = MappingProxyType({
+    # === CORE SCORING PARAMETERS ===
+    'owner_base_points': 2.0,
+    'scanner_base_points': 1.0,
+    'unique_scanner_bonus': 1.0,
+
+    # === DIVERSITY BONUSES ===
+    'geo_diversity_radius': 500.0,
+    'geo_diversity_bonus': 1.0,
+    'venue_variety_bonus': 1.0,
+
+    # === SOCIAL MECHANICS ===
+    'social_sneeze_threshold': 3,
+    'social_sneeze_bonus': 3.0,
+    'social_sneeze_cap': 1,
+
+    # === PROGRESSION SYSTEM ===
+    'level_multipliers': (1.0, 1.05, 1.10, 1.15, 1.20),
+    'points_per_level': 100,
+    'max_level': 20,
+
+    # === ECONOMY PARAMETERS ===
+    'pack_price_points': 300,
+    'pack_price_dollars': 3.0,
+    'points_per_dollar': 100.0,
+    'wallet_topup_min': 5.0,
+    'wallet_topup_max': 50.0,
+
+    # === PLAYER BEHAVIOR CAPS ===
+    'weekly_earn_cap': 500,
+    'daily_passive_cap': 100,
+    'sticker_scan_cooldown_hours': 11,
+
+    # === RETENTION MECHANICS ===
+    'churn_probability_base': 0.001,
+    'churn_probability_whale': 0.0005,
+    'churn_probability_grinder': 0.0008,
+    'churn_probability_casual': 0.002,
+
+    # === ENGAGEMENT BONUSES ===
+    'streak_bonus_days': 7,
+    'streak_bonus_multiplier': 1.5,
+    'comeback_bonus_days': 3,
+    'comeback_bonus_multiplier': 2.0,
+
+    # === NEW PLAYER ONBOARDING ===
+    'new_player_bonus_days': 7,
+    'new_player_bonus_multiplier': 2.0,
+    'new_player_free_packs': 1,
+
+    # === SEASONAL EVENTS ===
+    'event_frequency_days': 30,
+    'event_duration_days': 7,
+    'event_bonus_multiplier': 1.5,
+
+    # === DIMINISHING RETURNS ===
+    'diminishing_threshold': 3,
+    'diminishing_rates': (1.0, 0.6, 0.3),
+})
+
+# Multiplier ranges on the base config for each phase's exploratory random variations
+RANDOM_MULTIPLIERS = {
+    'whale': {
+        'owner_base_points': (1.2, 2.0),
+        'scanner_base_points': (1.1, 1.5),
+        'churn_probability_whale': (0.3, 1.0),
+        'pack_price_dollars': (0.7, 1.5),
+    },
+    'grinder': {
+        'geo_diversity_bonus': (1.2, 2.0),
+        'venue_variety_bonus': (1.2, 2.0),
+        'churn_probability_grinder': (0.3, 1.0),
+        'pack_price_points': (0.7, 1.5),
+    },
+    'casual': {
+        'social_sneeze_bonus': (1.2, 2.0),
+        'new_player_bonus_multiplier': (1.2, 2.0),
+        'churn_probability_casual': (0.3, 1.0),
+        'event_frequency_days': (0.7, 1.5),
+    },
+}
+RANDOM_VARIATIONS = 5
+
+# Returned by run_simulations for a variation stopped early by checkpoint pruning
+PRUNED = 'pruned'
+
+def digest_seed(*parts: Any) -> int:
+    """Reproducible 64-bit seed from JSON-serializable parts (unlike hash(), stable across processes)"""
+    payload = json.dumps(parts, sort_keys=True).encode()
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+
+@dataclass(slots=True)
+class EconomySummary:
+    """The economy-summary fields the score kernels read; defaults stand in for missing keys"""
+    whale_purchases: float = 0.0
+    pack_price_dollars: float = 3.0
+    whale_count: float = 1.0
+    total_revenue: float = 1.0
+    avg_level: float = 1.0
+    churn_rate: float = 0.1
+    grinder_count: float = 1.0
+    total_stickers: float = 1.0
+    total_scans: float = 1.0
+    total_points: float = 1.0
+    grinder_purchases: float = 0.0
+    avg_points_per_player: float = 0.0
+    total_players: float = 1.0
+    total_players_ever: float = 1.0
+    retention_rate: float = 0.0
+    avg_scans_per_player: float = 0.0
+    new_players_today: float = 0.0
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any]) -> 'EconomySummary':
+        """Pick the scored fields out of a get_economy_summary() dict"""
+        return cls(**{name: float(summary[name]) for name in _ECONOMY_SUMMARY_FIELDS if name in summary})
+
+_ECONOMY_SUMMARY_FIELDS = tuple(field.name for field in fields(EconomySummary))
+
+# EconomySummary fields each score kernel takes, in argument order
+WHALE_SCORE_KEYS = ('whale_purchases', 'pack_price_dollars', 'whale_count', 'total_revenue', 'avg_level',
+                    'churn_rate')
+GRINDER_SCORE_KEYS = ('grinder_count', 'total_stickers', 'total_scans', 'total_points', 'grinder_purchases',
+                      'avg_points_per_player', 'churn_rate')
+CASUAL_SCORE_KEYS = ('total_players', 'total_players_ever', 'retention_rate', 'avg_scans_per_player',
+                     'new_players_today')
+
+# Feature weights of each score; the products keep the original formulas' scale factors visible
+WHALE_WEIGHTS = np.array([0.4, 200 * 0.3, 100 * 0.2, 100 * 0.1])
+GRINDER_WEIGHTS = np.array([0.25, 0.25, 0.2, 50 * 0.1, 10 * 0.1, 100 * 0.1])
+CASUAL_WEIGHTS = np.array([200 * 0.4, 50 * 0.3, 100 * 0.2, 100 * 0.1])
+OVERALL_WEIGHTS = np.array([0.4, 0.35, 0.25])  # Whale, grinder, casual (same weighting as V1)
+
+@njit(cache=True)
+def _whale_features(whale_purchases, pack_price_dollars, whale_count, total_revenue, avg_level, churn_rate):
+    """Whale investment and retention features, in WHALE_WEIGHTS order"""
+    whale_revenue = whale_purchases * pack_price_dollars
+    
+    # Whale ARPU
+    whale_arpu = whale_revenue / whale_count if whale_count > 0 else 0.0
+    
+    # Whale revenue share
+    whale_revenue_share = whale_revenue / total_revenue if total_revenue > 0 else 0.0
+    
+    # Level progression (compounding returns)
+    level_progression = avg_level / 10
+    
+    # Whale retention
+    whale_retention = 1 - churn_rate
+    
+    return whale_arpu, whale_revenue_share, level_progression, whale_retention
+
+@njit(cache=True)
+def _grinder_features(grinder_count, total_stickers, total_scans, total_points, grinder_purchases,
+                      avg_points_per_player, churn_rate):
+    """Grinder leveling, engagement and sticker placement features, in GRINDER_WEIGHTS order"""
+    # Sticker density (exploration reward)
+    sticker_density = total_stickers / grinder_count if grinder_count > 0 else 0.0
+    
+    # Scan activity
+    scan_activity = total_scans / grinder_count if grinder_count > 0 else 0.0
+    
+    # Points per scan (efficiency)
+    points_per_scan = total_points / total_scans if total_scans > 0 else 0.0
+    
+    # Level progression
+    leveling_speed = avg_points_per_player / 100  # Points per level
+    
+    # Grinder sticker placement (their "revenue" - they pay with points)
+    sticker_placement = grinder_purchases / grinder_count if grinder_count > 0 else 0.0
+    
+    # Grinder retention
+    grinder_retention = 1 - churn_rate
+    
+    return sticker_density, scan_activity, points_per_scan, leveling_speed, sticker_placement, grinder_retention
+
+@njit(cache=True)
+def _casual_features(total_players, total_players_ever, retention_rate, avg_scans_per_player, new_players_today):
+    """Casual growth and social engagement features, in CASUAL_WEIGHTS order"""
+    # Growth rate
+    growth_rate = (total_players_ever - total_players) / max(total_players, 1.0)
+    
+    # Social engagement (scan activity as proxy)
+    social_engagement = min(avg_scans_per_player / 10, 1.0)
+    
+    # New player acquisition
+    acquisition_rate = new_players_today / max(total_players, 1.0)
+    
+    return growth_rate, social_engagement, acquisition_rate, retention_rate
+
+@njit(cache=True)
+def feature_columns_kernel(whale_columns, grinder_columns, casual_columns):
+    """Whale, grinder and casual feature matrices, one row per summary
+
+    Each argument is a (len(*_SCORE_KEYS), n) float64 matrix with one column per summary.
+    """
+    n = whale_columns.shape[1]
+    whale = np.empty((n, len(WHALE_WEIGHTS)))
+    grinder = np.empty((n, len(GRINDER_WEIGHTS)))
+    casual = np.empty((n, len(CASUAL_WEIGHTS)))
+    for i in range(n):
+        w = whale_columns[:, i]
+        g = grinder_columns[:, i]
+        c = casual_columns[:, i]
+        whale[i] = _whale_features(w[0], w[1], w[2], w[3], w[4], w[5])
+        grinder[i] = _grinder_features(g[0], g[1], g[2], g[3], g[4], g[5], g[6])
+        casual[i] = _casual_features(c[0], c[1], c[2], c[3], c[4])
+    return whale, grinder, casual
+
+def score_columns(whale_columns: np.ndarray, grinder_columns: np.ndarray, casual_columns: np.ndarray) -> np.ndarray:
+    """(4, n) unscaled whale, grinder, casual and overall scores: feature matrices times the weights"""
+    whale, grinder, casual = feature_columns_kernel(whale_columns, grinder_columns, casual_columns)
+    scores = np.empty((4, whale.shape[0]))
+    scores[0] = whale @ WHALE_WEIGHTS
+    scores[1] = grinder @ GRINDER_WEIGHTS
+    scores[2] = casual @ CASUAL_WEIGHTS
+    scores[3] = OVERALL_WEIGHTS @ scores[:3]
+    return scores
+
+def _summary_columns(summaries: List[EconomySummary], keys: Tuple[str, ...]) -> np.ndarray:
+    """(len(keys), len(summaries)) float64 matrix of the given summary fields"""
+    return np.array([[getattr(summary, key) for summary in summaries] for key in keys],
+                    dtype=np.float64).reshape(len(keys), len(summaries))
+
+@dataclass(slots=True, frozen=True)
 class PlayerTypeResult:
     """Results from optimizing for a specific player type"""
     player_type: str
@@ -43,7 +316,7 @@ class PlayerTypeResult:
     revenue: float
     userbase: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MultiPlayerResult:
     """Results from multi-player optimization"""
     config: Dict[str, Any]
@@ -58,158 +331,98 @@ class MultiPlayerResult:
 class OKROptimizedAnalyzerV2:
     """V2 analyzer with player-specific optimization phases"""
     
-    def __init__(self):
+    def __init__(self, processes: Optional[int] = None, prune_day: int = 30, prune_fraction: float = 0.3,
+                 n_calls: int = 40, cache_dir: Optional[str] = os.path.join('.cache', 'simulations'),
+                 verbose: bool = False, patience: int = 10, plateau_rel_tol: float = 0.001,
+                 sim_cache_size: int = 5000):
+        self.processes = processes  # Worker processes per phase sweep (None = all cores)
+        self.n_calls = n_calls  # Simulations per Bayesian phase search (0 = hand-picked grid)
+        self.verbose = verbose  # Print every simulation's outcome, not just each sweep's summary
+        # Checkpoint pruning: at prune_day a variation scoring below prune_fraction of the sweep's
+        # reference config's checkpoint score (the phase's base config, or the balanced hybrid in phase 4)
+        # is stopped (prune_fraction 0 disables it). The reference is fixed before the sweep starts,
+        # so the pruned set never depends on worker scheduling
+        self._checkpoint_scores: Dict[Tuple[str, str, int], float] = {}
+        self.prune_day = prune_day
+        self.prune_fraction = prune_fraction
+        # Early stopping: a Bayesian phase search ends once its running best score has a relative std
+        # below plateau_rel_tol over the last `patience` simulations (patience 0 disables it); the
+        # hand-picked grids are separate parameter families, not a converging sequence, so they always run in full
+        self.patience = patience
+        self.plateau_rel_tol = plateau_rel_tol
+        # Summaries by simulation key, backed by one JSON file per key under cache_dir (None = memory only);
+        # memory holds the sim_cache_size most recently used. Keys include the simulator's source digest,
+        # so editing advanced_economy_simulator.py leaves earlier disk entries unused
+        self.cache_dir = cache_dir
+        self._sim_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()  # Least recently used first
+        self.sim_cache_size = sim_cache_size
         self.whale_result: Optional[PlayerTypeResult] = None
         self.grinder_result: Optional[PlayerTypeResult] = None
         self.casual_result: Optional[PlayerTypeResult] = None
         self.multiplayer_result: Optional[MultiPlayerResult] = None
+        self.best_configs: Dict[str, AdvancedGameConfig] = {}  # Winning config per phase, seeds the next iteration
         self.phase_results = {}
+        self._result_dicts: Dict[str, Tuple[Any, Optional[Dict[str, Any]]]] = {}  # Phase name -> (result, asdict(result))
         self.all_simulation_results = []  # Store all simulation results for visualization
-        self.visualization_engine = FYNDRVisualizationEngine()
-        
+        self._base_config = self.create_base_config()  # Phases derive their variations from it via replace()
+        self._visualization_engine = None  # Created on first use; importing it pulls in matplotlib
+        
+    @property
+    def visualization_engine(self):
+        """The visualization engine, imported and constructed the first time it is needed"""
+        if self._visualization_engine is None:
+            from visualization_engine import FYNDRVisualizationEngine
+            self._visualization_engine = FYNDRVisualizationEngine()
+        return self._visualization_engine
+    
     def create_base_config(self) -> AdvancedGameConfig:
         """Create a balanced base configuration"""
-        return AdvancedGameConfig(
-            # === CORE SCORING PARAMETERS ===
-            owner_base_points=2.0,
-            scanner_base_points=1.0,
-            unique_scanner_bonus=1.0,
-            
-            # === DIVERSITY BONUSES ===
-            geo_diversity_radius=500.0,
-            geo_diversity_bonus=1.0,
-            venue_variety_bonus=1.0,
-            
-            # === SOCIAL MECHANICS ===
-            social_sneeze_threshold=3,
-            social_sneeze_bonus=3.0,
-            social_sneeze_cap=1,
-            
-            # === PROGRESSION SYSTEM ===
-            level_multipliers=[1.0, 1.05, 1.10, 1.15, 1.20],
-            points_per_level=100,
-            max_level=20,
-            
-            # === ECONOMY PARAMETERS ===
-            pack_price_points=300,
-            pack_price_dollars=3.0,
-            points_per_dollar=100.0,
-            wallet_topup_min=5.0,
-            wallet_topup_max=50.0,
-            
-            # === PLAYER BEHAVIOR CAPS ===
-            weekly_earn_cap=500,
-            daily_passive_cap=100,
-            sticker_scan_cooldown_hours=11,
-            
-            # === RETENTION MECHANICS ===
-            churn_probability_base=0.001,
-            churn_probability_whale=0.0005,
-            churn_probability_grinder=0.0008,
-            churn_probability_casual=0.002,
-            
-            # === ENGAGEMENT BONUSES ===
-            streak_bonus_days=7,
-            streak_bonus_multiplier=1.5,
-            comeback_bonus_days=3,
-            comeback_bonus_multiplier=2.0,
-            
-            # === NEW PLAYER ONBOARDING ===
-            new_player_bonus_days=7,
-            new_player_bonus_multiplier=2.0,
-            new_player_free_packs=1,
-            
-            # === SEASONAL EVENTS ===
-            event_frequency_days=30,
-            event_duration_days=7,
-            event_bonus_multiplier=1.5,
-            
-            # === DIMINISHING RETURNS ===
-            diminishing_threshold=3,
-            diminishing_rates=[1.0, 0.6, 0.3],
-        )
+        return AdvancedGameConfig(**BASE_CONFIG_KWARGS)
     
-    def calculate_whale_score(self, summary: Dict[str, Any]) -> float:
+    @staticmethod
+    def calculate_whale_score(summary: EconomySummary) -> float:
         """Calculate whale-specific optimization score"""
-        whale_revenue = summary.get('whale_purchases', 0) * summary.get('pack_price_dollars', 3.0)
-        whale_count = summary.get('whale_count', 1)
-        total_revenue = summary.get('total_revenue', 1)
-        avg_level = summary.get('avg_level', 1)
-        
-        # Whale ARPU
-        whale_arpu = whale_revenue / whale_count if whale_count > 0 else 0
-        
-        # Whale revenue share
-        whale_revenue_share = whale_revenue / total_revenue if total_revenue > 0 else 0
-        
-        # Level progression (compounding returns)
-        level_progression = avg_level / 10
-        
-        # Whale retention
-        whale_retention = 1 - summary.get('churn_rate', 0.1)
-        
-        # Weighted score focusing on whale investment and retention
-        whale_score = (whale_arpu * 0.4) + (whale_revenue_share * 200 * 0.3) + (level_progression * 100 * 0.2) + (whale_retention * 100 * 0.1)
-        
-        return whale_score
+        features = _whale_features(summary.whale_purchases, summary.pack_price_dollars, summary.whale_count,
+                                   summary.total_revenue, summary.avg_level, summary.churn_rate)
+        return float(np.dot(features, WHALE_WEIGHTS))
     
-    def calculate_grinder_score(self, summary: Dict[str, Any]) -> float:
+    @staticmethod
+    def calculate_grinder_score(summary: EconomySummary) -> float:
         """Calculate grinder-specific optimization score"""
-        grinder_count = summary.get('grinder_count', 1)
-        total_stickers = summary.get('total_stickers', 1)
-        total_scans = summary.get('total_scans', 1)
-        total_points = summary.get('total_points', 1)
-        grinder_purchases = summary.get('grinder_purchases', 0)  # Stickers placed by grinders
-        
-        # Sticker density (exploration reward)
-        sticker_density = total_stickers / grinder_count if grinder_count > 0 else 0
-        
-        # Scan activity
-        scan_activity = total_scans / grinder_count if grinder_count > 0 else 0
-        
-        # Points per scan (efficiency)
-        points_per_scan = total_points / total_scans if total_scans > 0 else 0
-        
-        # Level progression
-        avg_points_per_player = summary.get('avg_points_per_player', 0)
-        leveling_speed = avg_points_per_player / 100  # Points per level
-        
-        # Grinder sticker placement (their "revenue" - they pay with points)
-        sticker_placement = grinder_purchases / grinder_count if grinder_count > 0 else 0
-        
-        # Grinder retention
-        grinder_retention = 1 - summary.get('churn_rate', 0.1)
-        
-        # Weighted score focusing on leveling, engagement, and sticker placement
-        grinder_score = (sticker_density * 0.25) + (scan_activity * 0.25) + (points_per_scan * 0.2) + (leveling_speed * 50 * 0.1) + (sticker_placement * 10 * 0.1) + (grinder_retention * 100 * 0.1)
-        
-        return grinder_score
+        features = _grinder_features(summary.grinder_count, summary.total_stickers, summary.total_scans,
+                                     summary.total_points, summary.grinder_purchases,
+                                     summary.avg_points_per_player, summary.churn_rate)
+        return float(np.dot(features, GRINDER_WEIGHTS))
     
-    def calculate_casual_score(self, summary: Dict[str, Any]) -> float:
+    @staticmethod
+    def calculate_casual_score(summary: EconomySummary) -> float:
         """Calculate casual-specific optimization score"""
-        casual_count = summary.get('casual_count', 1)
-        total_players = summary.get('total_players', 1)
-        total_players_ever = summary.get('total_players_ever', 1)
-        retention_rate = summary.get('retention_rate', 0)
-        
-        # Growth rate
-        growth_rate = (total_players_ever - total_players) / max(total_players, 1)
-        
-        # Social engagement (scan activity as proxy)
-        avg_scans_per_player = summary.get('avg_scans_per_player', 0)
-        social_engagement = min(avg_scans_per_player / 10, 1.0)
-        
-        # New player acquisition
-        new_players = summary.get('new_players_today', 0)
-        acquisition_rate = new_players / max(total_players, 1)
-        
-        # Casual retention
-        casual_retention = retention_rate
-        
-        # Weighted score focusing on growth and social engagement
-        casual_score = (growth_rate * 200 * 0.4) + (social_engagement * 50 * 0.3) + (acquisition_rate * 100 * 0.2) + (casual_retention * 100 * 0.1)
+        features = _casual_features(summary.total_players, summary.total_players_ever, summary.retention_rate,
+                                    summary.avg_scans_per_player, summary.new_players_today)
+        return float(np.dot(features, CASUAL_WEIGHTS))
+    
+    @staticmethod
+    def generate_random_variations(base_config: AdvancedGameConfig, focus: str) -> List[AdvancedGameConfig]:
+        """Space-filling (Latin hypercube) draws over RANDOM_MULTIPLIERS[focus], applied to `base_config`
+
+        The draws are seeded from the focus and base config, so the same base yields the same variations.
+        """
+        ranges = RANDOM_MULTIPLIERS[focus]
+        low, high = np.array(list(ranges.values())).T
+        rng = np.random.default_rng(digest_seed(focus, asdict(base_config)))
+        if qmc is not None:
+            unit = qmc.LatinHypercube(d=len(ranges), seed=rng).random(RANDOM_VARIATIONS)
+        else:
+            unit = rng.random((RANDOM_VARIATIONS, len(ranges)))
         
-        return casual_score
+        variations = []
+        for multipliers in low + unit * (high - low):
+            changes = {}
+            for field, multiplier in zip(ranges, multipliers):
+                value = getattr(base_config, field) * multiplier
+                changes[field] = int(round(value)) if isinstance(getattr(base_config, field), int) else float(value)
+            variations.append(replace(base_config, **changes))
+        return variations
     
     def generate_whale_optimizations(self, base_config: AdvancedGameConfig) -> List[AdvancedGameConfig]:
         """Generate parameter variations optimized for whale investment with BROAD ranges"""
@@ -266,18 +479,10 @@ class OKROptimizedAnalyzerV2:
         ]
         
         for opt in whale_optimizations:
-            config_dict = base_config.__dict__.copy()
-            config_dict.update(opt)
-            variations.append(AdvancedGameConfig(**config_dict))
+            variations.append(replace(base_config, **opt))
         
         # Random variations for exploration
-        for _ in range(5):
-            config_dict = base_config.__dict__.copy()
-            config_dict['owner_base_points'] *= random.uniform(1.2, 2.0)
-            config_dict['scanner_base_points'] *= random.uniform(1.1, 1.5)
-            config_dict['churn_probability_whale'] *= random.uniform(0.3, 1.0)
-            config_dict['pack_price_dollars'] *= random.uniform(0.7, 1.5)
-            variations.append(AdvancedGameConfig(**config_dict))
+        variations.extend(self.generate_random_variations(base_config, 'whale'))
         
         return variations
     
@@ -316,18 +521,10 @@ class OKROptimizedAnalyzerV2:
         ]
         
         for opt in grinder_optimizations:
-            config_dict = base_config.__dict__.copy()
-            config_dict.update(opt)
-            variations.append(AdvancedGameConfig(**config_dict))
+            variations.append(replace(base_config, **opt))
         
         # Random variations for exploration
-        for _ in range(5):
-            config_dict = base_config.__dict__.copy()
-            config_dict['geo_diversity_bonus'] *= random.uniform(1.2, 2.0)
-            config_dict['venue_variety_bonus'] *= random.uniform(1.2, 2.0)
-            config_dict['churn_probability_grinder'] *= random.uniform(0.3, 1.0)
-            config_dict['pack_price_points'] *= random.uniform(0.7, 1.5)
-            variations.append(AdvancedGameConfig(**config_dict))
+        variations.extend(self.generate_random_variations(base_config, 'grinder'))
         
         return variations
     
@@ -366,45 +563,40 @@ class OKROptimizedAnalyzerV2:
         ]
         
         for opt in casual_optimizations:
-            config_dict = base_config.__dict__.copy()
-            config_dict.update(opt)
-            variations.append(AdvancedGameConfig(**config_dict))
+            variations.append(replace(base_config, **opt))
         
         # Random variations for exploration
-        for _ in range(5):
-            config_dict = base_config.__dict__.copy()
-            config_dict['social_sneeze_bonus'] *= random.uniform(1.2, 2.0)
-            config_dict['new_player_bonus_multiplier'] *= random.uniform(1.2, 2.0)
-            config_dict['churn_probability_casual'] *= random.uniform(0.3, 1.0)
-            config_dict['event_frequency_days'] = int(config_dict['event_frequency_days'] * random.uniform(0.7, 1.5))
-            variations.append(AdvancedGameConfig(**config_dict))
+        variations.extend(self.generate_random_variations(base_config, 'casual'))
         
         return variations
     
-    def run_single_simulation(self, config: AdvancedGameConfig, days: int, 
-                            player_type_focus: str = None) -> Optional[Dict[str, Any]]:
-        """Run a single simulation and return results"""
-        try:
-            simulator = AdvancedFYNDRSimulator(config)
-            simulator.run_simulation(days)
-            summary = simulator.get_economy_summary()
-            
-            # Calculate player-type specific scores
-            whale_score = self.calculate_whale_score(summary)
-            grinder_score = self.calculate_grinder_score(summary)
-            casual_score = self.calculate_casual_score(summary)
-            
-            # Calculate overall score (same as V1 for consistency)
-            overall_score = (whale_score * 0.4) + (grinder_score * 0.35) + (casual_score * 0.25)
-            
-            # Scale scores to match V1 ranges (V1 scores were ~300-400 range)
-            whale_score *= 10
-            grinder_score *= 10  
-            casual_score *= 10
-            overall_score *= 10
-            
-            result = {
-                'config': config.__dict__,
+    @classmethod
+    def calculate_target_score(cls, summary: Dict[str, Any], focus: str) -> float:
+        """Unscaled score a phase optimizes: 'whale', 'grinder', 'casual' or 'overall'"""
+        summary = EconomySummary.from_summary(summary)
+        if focus == 'whale':
+            return cls.calculate_whale_score(summary)
+        if focus == 'grinder':
+            return cls.calculate_grinder_score(summary)
+        if focus == 'casual':
+            return cls.calculate_casual_score(summary)
+        return float(np.dot([cls.calculate_whale_score(summary), cls.calculate_grinder_score(summary),
+                             cls.calculate_casual_score(summary)], OVERALL_WEIGHTS))
+    
+    def score_simulations(self, configs: List[AdvancedGameConfig], summaries: List[Dict[str, Any]],
+                          player_type_focus: str = None) -> List[Dict[str, Any]]:
+        """Score a batch of simulation summaries in one vectorized pass and record them for visualization"""
+        inputs = [EconomySummary.from_summary(summary) for summary in summaries]
+        scores = score_columns(_summary_columns(inputs, WHALE_SCORE_KEYS),
+                               _summary_columns(inputs, GRINDER_SCORE_KEYS),
+                               _summary_columns(inputs, CASUAL_SCORE_KEYS))
+        
+        # Scale scores to match V1 ranges (V1 scores were ~300-400 range)
+        scores *= 10
+        
+        results = [
+            {
+                'config': asdict(config),
                 'summary': summary,
                 'whale_score': whale_score,
                 'grinder_score': grinder_score,
@@ -414,15 +606,227 @@ class OKROptimizedAnalyzerV2:
                 'userbase': summary.get('total_players', 0),
                 'player_type_focus': player_type_focus
             }
+            for config, summary, (whale_score, grinder_score, casual_score, overall_score)
+            in zip(configs, summaries, scores.T.tolist())
+        ]
+        
+        # Store results for visualization
+        self.all_simulation_results.extend(results)
+        
+        return results
+    
+    def run_single_simulation(self, config: AdvancedGameConfig, days: int, 
+                            player_type_focus: str = None) -> Optional[Dict[str, Any]]:
+        """Run a single simulation and return results"""
+        return self.run_simulations([config], days, player_type_focus)[0]
+    
+    def checkpoint_score(self, config: AdvancedGameConfig, days: int, focus: str) -> float:
+        """`focus` score of a config's run at prune_day, seeded as run_simulations would seed it (memoized)"""
+        key = (self.simulation_key(config, days), focus, self.prune_day)
+        if key not in self._checkpoint_scores:
+            scores = []
             
-            # Store result for visualization
-            self.all_simulation_results.append(result)
-            
-            return result
+            def capture(day: int, simulator: AdvancedFYNDRSimulator) -> bool:
+                if day != self.prune_day:
+                    return False
+                scores.append(self.calculate_target_score(simulator.get_economy_summary(), focus))
+                return True
             
-        except Exception as e:
-            print(f"Error in simulation: {e}")
-            return None
+            simulator = AdvancedFYNDRSimulator(config, seed=digest_seed(key[0]))
+            simulator.run_simulation(days, progress_callback=capture)
+            self._checkpoint_scores[key] = scores[0] if scores else 0.0
+        return self._checkpoint_scores[key]
+    
+    def run_simulations(self, configs: List[AdvancedGameConfig], days: int,
+                        player_type_focus: str = None, prune_focus: str = None,
+                        prune_base: Optional[AdvancedGameConfig] = None) -> List[Any]:
+        """Run independent simulations on a process pool; results in input order
+
+        Each entry is a result dict, None if the simulation failed, or PRUNED if
+        `prune_focus` names the score to prune on and the variation fell behind
+        `prune_base`'s checkpoint score (the sweep's reference config, e.g. its base config).
+        Configs simulated before for the same day count (in this or an earlier run, via
+        the disk cache) reuse that summary instead of running again. Every simulation is
+        seeded from its key, so a config always produces the same summary.
+        """
+        keys = [self.simulation_key(config, days) for config in configs]
+        summaries = [self.cached_summary(key) for key in keys]
+        pending = {}  # key -> first index needing a simulation; repeated configs share its run
+        for i, (key, summary) in enumerate(zip(keys, summaries)):
+            if summary is None:
+                pending.setdefault(key, i)
+        
+        if pending:
+            worker = _run_sim_worker
+            if prune_focus and prune_base is not None and self.prune_fraction > 0 and days > self.prune_day:
+                threshold = self.prune_fraction * self.checkpoint_score(prune_base, days, prune_focus)
+                worker = partial(_run_sim_worker, prune=(prune_focus, self.prune_day, threshold))
+            fresh = run_parameter_sweep([configs[i] for i in pending.values()], days=days,
+                                        seeds=[digest_seed(key) for key in pending], max_workers=self.processes,
+                                        worker=worker)
+            self.store_summaries({key: summary for key, summary in zip(pending, fresh) if isinstance(summary, dict)})
+            by_key = dict(zip(pending, fresh))
+            summaries = [by_key[key] if summary is None else summary for key, summary in zip(keys, summaries)]
+        finished = [i for i, summary in enumerate(summaries) if isinstance(summary, dict)]
+        scored = self.score_simulations([configs[i] for i in finished], [summaries[i] for i in finished],
+                                        player_type_focus)
+        results = list(summaries)
+        for i, result in zip(finished, scored):
+            results[i] = result
+        return results
+    
+    @staticmethod
+    def simulation_key(config: AdvancedGameConfig, days: int) -> str:
+        """Stable digest of a config's parameter values, the simulated day count and the simulator source"""
+        payload = json.dumps({'config': asdict(config), 'days': days, 'simulator': SIMULATOR_VERSION}, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def dedupe_variations(self, variations: List[AdvancedGameConfig], days: int) -> List[AdvancedGameConfig]:
+        """Drop repeated parameter sets (e.g. a grid point that equals the base config), keeping first occurrences"""
+        unique = {}
+        for config in variations:
+            unique.setdefault(self.simulation_key(config, days), config)
+        if len(unique) < len(variations):
+            print(f"Skipped {len(variations) - len(unique)} duplicate variations")
+        return list(unique.values())
+    
+    def cached_summary(self, key: str) -> Optional[Dict[str, Any]]:
+        """Summary of an earlier simulation with this key, from memory or the disk cache"""
+        summary = self._sim_cache.get(key)
+        if summary is not None:
+            self._sim_cache.move_to_end(key)
+        elif self.cache_dir:
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    summary = orjson.loads(f.read()) if orjson else json.load(f)
+                self.remember_summaries({key: summary})
+        return summary
+    
+    def remember_summaries(self, summaries: Dict[str, Dict[str, Any]]):
+        """Add summaries to the in-memory cache, evicting the least recently used past sim_cache_size"""
+        self._sim_cache.update(summaries)
+        for key in summaries:
+            self._sim_cache.move_to_end(key)
+        while len(self._sim_cache) > self.sim_cache_size:
+            self._sim_cache.popitem(last=False)
+    
+    def store_summaries(self, summaries: Dict[str, Dict[str, Any]]):
+        """Remember finished summaries and persist them so later analyzer runs can reuse them"""
+        self.remember_summaries(summaries)
+        if not self.cache_dir or not summaries:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for key, summary in summaries.items():
+            with open(os.path.join(self.cache_dir, f"{key}.json"), 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY) if orjson
+                        else json.dumps(summary).encode())
+    
+    def run_phase_search(self, focus: str, base_config: AdvancedGameConfig, days: int,
+                         generate: Callable[[AdvancedGameConfig], List[AdvancedGameConfig]]
+                         ) -> Tuple[List[AdvancedGameConfig], List[Any]]:
+        """Evaluate a phase: Bayesian search when scikit-optimize is available, else the grid"""
+        if self.n_calls and Optimizer is not None and focus in SEARCH_SPACES:
+            print(f"Testing {self.n_calls} {focus}-optimized configurations (Bayesian search)...")
+            return self.run_bayesian_search(focus, base_config, days)
+        variations = self.dedupe_variations(generate(base_config), days)
+        print(f"Testing {len(variations)} {focus}-optimized configurations...")
+        return variations, self.run_simulations(variations, days, prune_focus=focus, prune_base=base_config)
+    
+    def plateaued(self, best_history: List[float], batch_results: List[Any], focus: str) -> bool:
+        """Extend the running-best history with a batch; True once the last `patience` entries are flat"""
+        best = best_history[-1] if best_history else 0.0
+        for result in batch_results:
+            if isinstance(result, dict):
+                best = max(best, result[f'{focus}_score'])
+            best_history.append(best)
+        if not self.patience or len(best_history) < self.patience or best <= 0:
+            return False
+        return np.std(best_history[-self.patience:]) / best < self.plateau_rel_tol
+    
+    def run_bayesian_search(self, focus: str, base_config: AdvancedGameConfig,
+                            days: int) -> Tuple[List[AdvancedGameConfig], List[Any]]:
+        """Gaussian-process ask/tell search over SEARCH_SPACES[focus], one pool-sized batch at a time
+
+        The base config (the previous phase's winner) is simulated in the first batch, so the
+        search never returns something worse than its starting point.
+        """
+        space = SEARCH_SPACES[focus]
+        names = list(space)
+        dimensions = [
+            Integer(low, high, name=name) if isinstance(low, int) else
+            Real(low, high, prior='log-uniform' if name.startswith('churn_probability') else 'uniform', name=name)
+            for name, (low, high) in space.items()
+        ]
+        optimizer = Optimizer(dimensions, base_estimator="GP", acq_func="EI",
+                              n_initial_points=min(10, self.n_calls),
+                              random_state=digest_seed(focus, asdict(base_config)) % 2**32)
+        batch_size = self.processes or available_cpus()
+        base_point = [getattr(base_config, name) for name in names]
+        
+        configs, results, best_history, observed = [], [], [], []
+        while len(configs) < self.n_calls:
+            n_points = min(batch_size, self.n_calls - len(configs)) - (not configs)
+            points = optimizer.ask(n_points=n_points) if n_points > 0 else []
+            batch = [
+                replace(base_config, **{name: int(value) if isinstance(space[name][0], int) else float(value)
+                                        for name, value in zip(names, point)})
+                for point in points
+            ]
+            if not configs:
+                batch.insert(0, base_config)
+            batch_results = self.run_simulations(batch, days, prune_focus=focus, prune_base=base_config)
+            observed.extend(-result[f'{focus}_score'] for result in batch_results if isinstance(result, dict))
+            # The optimizer minimizes; failed or pruned variations count as the worst score seen so far
+            losses = [-result[f'{focus}_score'] if isinstance(result, dict) else max(observed, default=0.0)
+                      for result in batch_results]
+            if not configs:
+                # The base point is only told when it lies inside the search bounds
+                if base_point in optimizer.space:
+                    optimizer.tell(base_point, losses[0])
+                losses = losses[1:]
+            if points:
+                optimizer.tell(points, losses)
+            configs.extend(batch)
+            results.extend(batch_results)
+            if self.plateaued(best_history, batch_results, focus) and len(configs) < self.n_calls:
+                print(f"Stopped after {len(configs)} of {self.n_calls} searches: best {focus} score plateaued")
+                break
+        return configs, results
+    
+    def report_sweep(self, label: str, results: List[Any], score_key: str) -> Optional[Dict[str, Any]]:
+        """Print a sweep's outcome in one write and return its best positively scored result
+
+        Per-simulation lines appear only with verbose; otherwise a tally and a score histogram.
+        """
+        score_name = score_key.replace('_', ' ').title()
+        lines, scores = [], []
+        best_result = None
+        pruned = failed = 0
+        for i, result in enumerate(results):
+            if result == PRUNED:
+                pruned += 1
+                outcome = f"Pruned at day {self.prune_day}"
+            elif result:
+                score = result[score_key]
+                scores.append(score)
+                outcome = f"{score_name}: {score:.2f}"
+                if score > (best_result[score_key] if best_result else 0):
+                    best_result = result
+            else:
+                failed += 1
+                outcome = "Failed"
+            if self.verbose:
+                lines.append(f"  {label.capitalize()} simulation {i+1}/{len(results)}: {outcome}")
+        
+        lines.append(f"  {len(results)} {label} simulations: {len(scores)} scored, {pruned} pruned, {failed} failed")
+        if scores:
+            counts, edges = np.histogram(scores, bins=min(5, len(scores)))
+            lines.append(f"  {score_name} distribution:")
+            lines.extend(f"    {low:9.2f} - {high:9.2f} | {'#' * count}"
+                         for low, high, count in zip(edges[:-1], edges[1:], counts))
+        print("\n".join(lines))
+        return best_result
     
     def run_phase_1_whale_optimization(self, days: int = 90, base_config: AdvancedGameConfig = None) -> PlayerTypeResult:
         """Phase 1: Optimize parameters for whales only"""
@@ -433,28 +837,10 @@ class OKROptimizedAnalyzerV2:
         print()
         
         if base_config is None:
-            base_config = self.create_base_config()
-        variations = self.generate_whale_optimizations(base_config)
-        
-        best_score = 0
-        best_result = None
+            base_config = self._base_config
         
-        print(f"Testing {len(variations)} whale-optimized configurations...")
-        
-        for i, config in enumerate(variations):
-            progress = (i + 1) / len(variations) * 100
-            print(f"  Running whale simulation {i+1}/{len(variations)} ({progress:.1f}%)...", end=" ")
-            
-            result = self.run_single_simulation(config, days)
-            if result:
-                whale_score = result['whale_score']
-                print(f"Whale Score: {whale_score:.2f}")
-                
-                if whale_score > best_score:
-                    best_score = whale_score
-                    best_result = result
-            else:
-                print("Failed")
+        variations, results = self.run_phase_search('whale', base_config, days, self.generate_whale_optimizations)
+        best_result = self.report_sweep('whale', results, 'whale_score')
         
         if best_result:
             whale_result = PlayerTypeResult(
@@ -467,6 +853,7 @@ class OKROptimizedAnalyzerV2:
                 userbase=best_result['userbase']
             )
             self.whale_result = whale_result
+            self.best_configs['whale'] = AdvancedGameConfig(**best_result['config'])
             
             print(f"\nBest Whale Configuration Found:")
             print(f"  Whale Score: {whale_result.target_score:.2f}")
@@ -493,28 +880,10 @@ class OKROptimizedAnalyzerV2:
         print()
         
         if base_config is None:
-            base_config = self.create_base_config()
-        variations = self.generate_grinder_optimizations(base_config)
-        
-        best_score = 0
-        best_result = None
-        
-        print(f"Testing {len(variations)} grinder-optimized configurations...")
+            base_config = self._base_config
         
-        for i, config in enumerate(variations):
-            progress = (i + 1) / len(variations) * 100
-            print(f"  Running grinder simulation {i+1}/{len(variations)} ({progress:.1f}%)...", end=" ")
-            
-            result = self.run_single_simulation(config, days)
-            if result:
-                grinder_score = result['grinder_score']
-                print(f"Grinder Score: {grinder_score:.2f}")
-                
-                if grinder_score > best_score:
-                    best_score = grinder_score
-                    best_result = result
-            else:
-                print("Failed")
+        variations, results = self.run_phase_search('grinder', base_config, days, self.generate_grinder_optimizations)
+        best_result = self.report_sweep('grinder', results, 'grinder_score')
         
         if best_result:
             grinder_result = PlayerTypeResult(
@@ -527,6 +896,7 @@ class OKROptimizedAnalyzerV2:
                 userbase=best_result['userbase']
             )
             self.grinder_result = grinder_result
+            self.best_configs['grinder'] = AdvancedGameConfig(**best_result['config'])
             
             print(f"\nBest Grinder Configuration Found:")
             print(f"  Grinder Score: {grinder_result.target_score:.2f}")
@@ -552,28 +922,10 @@ class OKROptimizedAnalyzerV2:
         print()
         
         if base_config is None:
-            base_config = self.create_base_config()
-        variations = self.generate_casual_optimizations(base_config)
+            base_config = self._base_config
         
-        best_score = 0
-        best_result = None
-        
-        print(f"Testing {len(variations)} casual-optimized configurations...")
-        
-        for i, config in enumerate(variations):
-            progress = (i + 1) / len(variations) * 100
-            print(f"  Running casual simulation {i+1}/{len(variations)} ({progress:.1f}%)...", end=" ")
-            
-            result = self.run_single_simulation(config, days)
-            if result:
-                casual_score = result['casual_score']
-                print(f"Casual Score: {casual_score:.2f}")
-                
-                if casual_score > best_score:
-                    best_score = casual_score
-                    best_result = result
-            else:
-                print("Failed")
+        variations, results = self.run_phase_search('casual', base_config, days, self.generate_casual_optimizations)
+        best_result = self.report_sweep('casual', results, 'casual_score')
         
         if best_result:
             casual_result = PlayerTypeResult(
@@ -586,6 +938,7 @@ class OKROptimizedAnalyzerV2:
                 userbase=best_result['userbase']
             )
             self.casual_result = casual_result
+            self.best_configs['casual'] = AdvancedGameConfig(**best_result['config'])
             
             print(f"\nBest Casual Configuration Found:")
             print(f"  Casual Score: {casual_result.target_score:.2f}")
@@ -616,87 +969,68 @@ class OKROptimizedAnalyzerV2:
             return None
         
         # Create hybrid configurations combining best individual parameters
+        whale_config = self.whale_result.config
+        grinder_config = self.grinder_result.config
+        casual_config = self.casual_result.config
+        owner_base_points = whale_config.get('owner_base_points', 2.0)
+        geo_diversity_bonus = grinder_config.get('geo_diversity_bonus', 1.0)
+        social_sneeze_bonus = casual_config.get('social_sneeze_bonus', 3.0)
         hybrid_configs = []
         
         # Configuration 1: Whale-focused hybrid
-        whale_hybrid = self.create_base_config()
-        whale_hybrid.__dict__.update(self.whale_result.config)
-        whale_hybrid.__dict__.update({
-            'geo_diversity_bonus': self.grinder_result.config.get('geo_diversity_bonus', 1.0),
-            'social_sneeze_bonus': self.casual_result.config.get('social_sneeze_bonus', 3.0),
-        })
+        whale_hybrid = replace(
+            self._base_config,
+            **{**whale_config,
+               'geo_diversity_bonus': geo_diversity_bonus,
+               'social_sneeze_bonus': social_sneeze_bonus}
+        )
         hybrid_configs.append(whale_hybrid)
         
         # Configuration 2: Grinder-focused hybrid
-        grinder_hybrid = self.create_base_config()
-        grinder_hybrid.__dict__.update(self.grinder_result.config)
-        grinder_hybrid.__dict__.update({
-            'owner_base_points': self.whale_result.config.get('owner_base_points', 2.0),
-            'social_sneeze_bonus': self.casual_result.config.get('social_sneeze_bonus', 3.0),
-        })
+        grinder_hybrid = replace(
+            self._base_config,
+            **{**grinder_config,
+               'owner_base_points': owner_base_points,
+               'social_sneeze_bonus': social_sneeze_bonus}
+        )
         hybrid_configs.append(grinder_hybrid)
         
         # Configuration 3: Casual-focused hybrid
-        casual_hybrid = self.create_base_config()
-        casual_hybrid.__dict__.update(self.casual_result.config)
-        casual_hybrid.__dict__.update({
-            'owner_base_points': self.whale_result.config.get('owner_base_points', 2.0),
-            'geo_diversity_bonus': self.grinder_result.config.get('geo_diversity_bonus', 1.0),
-        })
+        casual_hybrid = replace(
+            self._base_config,
+            **{**casual_config,
+               'owner_base_points': owner_base_points,
+               'geo_diversity_bonus': geo_diversity_bonus}
+        )
         hybrid_configs.append(casual_hybrid)
         
         # Configuration 4: Balanced hybrid (average of best parameters)
-        balanced_hybrid = self.create_base_config()
-        balanced_hybrid.__dict__.update({
-            'owner_base_points': (self.whale_result.config.get('owner_base_points', 2.0) + 2.0) / 2,
-            'geo_diversity_bonus': (self.grinder_result.config.get('geo_diversity_bonus', 1.0) + 1.0) / 2,
-            'social_sneeze_bonus': (self.casual_result.config.get('social_sneeze_bonus', 3.0) + 3.0) / 2,
-            'pack_price_dollars': (self.whale_result.config.get('pack_price_dollars', 3.0) + 3.0) / 2,
-            'pack_price_points': (self.grinder_result.config.get('pack_price_points', 300) + 300) / 2,
-            'churn_probability_whale': self.whale_result.config.get('churn_probability_whale', 0.0005),
-            'churn_probability_grinder': self.grinder_result.config.get('churn_probability_grinder', 0.0008),
-            'churn_probability_casual': self.casual_result.config.get('churn_probability_casual', 0.002),
+        balanced_hybrid = replace(self._base_config, **{
+            'owner_base_points': (owner_base_points + 2.0) / 2,
+            'geo_diversity_bonus': (geo_diversity_bonus + 1.0) / 2,
+            'social_sneeze_bonus': (social_sneeze_bonus + 3.0) / 2,
+            'pack_price_dollars': (whale_config.get('pack_price_dollars', 3.0) + 3.0) / 2,
+            'pack_price_points': (grinder_config.get('pack_price_points', 300) + 300) // 2,
+            'churn_probability_whale': whale_config.get('churn_probability_whale', 0.0005),
+            'churn_probability_grinder': grinder_config.get('churn_probability_grinder', 0.0008),
+            'churn_probability_casual': casual_config.get('churn_probability_casual', 0.002),
         })
         hybrid_configs.append(balanced_hybrid)
         
-        # Test additional random combinations
-        for _ in range(8):
-            random_hybrid = self.create_base_config()
-            random_hybrid.__dict__.update({
-                'owner_base_points': random.uniform(
-                    self.whale_result.config.get('owner_base_points', 2.0) * 0.8,
-                    self.whale_result.config.get('owner_base_points', 2.0) * 1.2
-                ),
-                'geo_diversity_bonus': random.uniform(
-                    self.grinder_result.config.get('geo_diversity_bonus', 1.0) * 0.8,
-                    self.grinder_result.config.get('geo_diversity_bonus', 1.0) * 1.2
-                ),
-                'social_sneeze_bonus': random.uniform(
-                    self.casual_result.config.get('social_sneeze_bonus', 3.0) * 0.8,
-                    self.casual_result.config.get('social_sneeze_bonus', 3.0) * 1.2
-                ),
-            })
-            hybrid_configs.append(random_hybrid)
-        
-        best_score = 0
-        best_result = None
+        # Test additional random combinations within +/-20% of the winners' values, drawn
+        # reproducibly in one batch
+        rng = np.random.default_rng(digest_seed('hybrid', whale_config, grinder_config, casual_config))
+        centers = np.array([owner_base_points, geo_diversity_bonus, social_sneeze_bonus])
+        for owner, geo, sneeze in rng.uniform(centers * 0.8, centers * 1.2, size=(8, 3)).tolist():
+            hybrid_configs.append(replace(self._base_config, owner_base_points=owner,
+                                          geo_diversity_bonus=geo, social_sneeze_bonus=sneeze))
         
+        hybrid_configs = self.dedupe_variations(hybrid_configs, days)
         print(f"Testing {len(hybrid_configs)} multi-player hybrid configurations...")
         
-        for i, config in enumerate(hybrid_configs):
-            progress = (i + 1) / len(hybrid_configs) * 100
-            print(f"  Running hybrid simulation {i+1}/{len(hybrid_configs)} ({progress:.1f}%)...", end=" ")
-            
-            result = self.run_single_simulation(config, days)
-            if result:
-                overall_score = result['overall_score']
-                print(f"Overall Score: {overall_score:.2f}")
-                
-                if overall_score > best_score:
-                    best_score = overall_score
-                    best_result = result
-            else:
-                print("Failed")
+        # Hybrids falling well behind the balanced hybrid's checkpoint overall score are pruned
+        results = self.run_simulations(hybrid_configs, days, prune_focus='overall', prune_base=balanced_hybrid)
+        best_result = self.report_sweep('hybrid', results, 'overall_score')
         
         if best_result:
             multiplayer_result = MultiPlayerResult(
@@ -710,6 +1044,7 @@ class OKROptimizedAnalyzerV2:
                 userbase=best_result['userbase']
             )
             self.multiplayer_result = multiplayer_result
+            self.best_configs['multiplayer'] = AdvancedGameConfig(**best_result['config'])
             
             print(f"\nBest Multi-Player Configuration Found:")
             print(f"  Overall Score: {multiplayer_result.overall_score:.2f}")
@@ -745,37 +1080,13 @@ class OKROptimizedAnalyzerV2:
             if iterations > 1:
                 print(f"\n{'='*20} ITERATION {iteration + 1}/{iterations} {'='*20}")
             
-            # Phase 1: Whale optimization
-            # On subsequent iterations, use the best whale config as base
-            if iteration > 0 and self.whale_result:
-                base_config = AdvancedGameConfig(**self.whale_result.config)
-                whale_result = self.run_phase_1_whale_optimization(days, base_config)
-            else:
-                whale_result = self.run_phase_1_whale_optimization(days)
-            
-            # Phase 2: Grinder optimization
-            # On subsequent iterations, use the best grinder config as base
-            if iteration > 0 and self.grinder_result:
-                base_config = AdvancedGameConfig(**self.grinder_result.config)
-                grinder_result = self.run_phase_2_grinder_optimization(days, base_config)
-            else:
-                grinder_result = self.run_phase_2_grinder_optimization(days)
-            
-            # Phase 3: Casual optimization
-            # On subsequent iterations, use the best casual config as base
-            if iteration > 0 and self.casual_result:
-                base_config = AdvancedGameConfig(**self.casual_result.config)
-                casual_result = self.run_phase_3_casual_optimization(days, base_config)
-            else:
-                casual_result = self.run_phase_3_casual_optimization(days)
-            
-            # Phase 4: Multi-player optimization
-            # On subsequent iterations, use the best multiplayer config as base
-            if iteration > 0 and self.multiplayer_result:
-                base_config = AdvancedGameConfig(**self.multiplayer_result.config)
-                multiplayer_result = self.run_phase_4_multiplayer_optimization(days, base_config)
-            else:
-                multiplayer_result = self.run_phase_4_multiplayer_optimization(days)
+            # Phases 1-4: whale, grinder, casual, then multi-player optimization
+            # On subsequent iterations, each phase starts from its own best config so far
+            base_configs = self.best_configs if iteration > 0 else {}
+            whale_result = self.run_phase_1_whale_optimization(days, base_configs.get('whale'))
+            grinder_result = self.run_phase_2_grinder_optimization(days, base_configs.get('grinder'))
+            casual_result = self.run_phase_3_casual_optimization(days, base_configs.get('casual'))
+            multiplayer_result = self.run_phase_4_multiplayer_optimization(days, base_configs.get('multiplayer'))
         
         end_time = time.time()
         
@@ -838,6 +1149,14 @@ class OKROptimizedAnalyzerV2:
             print(f"  Grinder Churn: {config.get('churn_probability_grinder', 0):.4f}")
             print(f"  Casual Churn: {config.get('churn_probability_casual', 0):.4f}")
     
+    def result_dict(self, phase: str) -> Optional[Dict[str, Any]]:
+        """asdict() of a phase's result, converted once per result object (a new result replaces it)"""
+        result = getattr(self, f'{phase}_result')
+        cached = self._result_dicts.get(phase)
+        if cached is None or cached[0] is not result:
+            cached = self._result_dicts[phase] = (result, asdict(result) if result else None)
+        return cached[1]
+    
     def export_results(self, prefix: str = "okr_v2_optimized"):
         """Export all optimization results and generate visualizations"""
         export_data = {
@@ -846,15 +1165,20 @@ class OKROptimizedAnalyzerV2:
                 'phases': 4,
                 'description': 'Phase 1: Whale optimization, Phase 2: Grinder optimization, Phase 3: Casual optimization, Phase 4: Multi-player integration'
             },
-            'whale_result': asdict(self.whale_result) if self.whale_result else None,
-            'grinder_result': asdict(self.grinder_result) if self.grinder_result else None,
-            'casual_result': asdict(self.casual_result) if self.casual_result else None,
-            'multiplayer_result': asdict(self.multiplayer_result) if self.multiplayer_result else None,
+            'whale_result': self.result_dict('whale'),
+            'grinder_result': self.result_dict('grinder'),
+            'casual_result': self.result_dict('casual'),
+            'multiplayer_result': self.result_dict('multiplayer'),
             'all_simulation_results': self.all_simulation_results
         }
         
-        with open(f'{prefix}_results.json', 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # all_simulation_results holds every scored run, so serialize it in one pass at the end
+        if orjson:
+            with open(f'{prefix}_results.json', 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(f'{prefix}_results.json', 'w') as f:
+                json.dump(export_data, f, indent=2)
         
         print(f"Results exported to {prefix}_results.json")
         
@@ -869,6 +1193,32 @@ class OKROptimizedAnalyzerV2:
             print(f"Error generating visualizations: {e}")
             print("Continuing without visualizations...")
 
+def _run_sim_worker(config_dict: Dict[str, Any], seed: Optional[int], days: int,
+                    prune: Tuple[str, int, float] = None) -> Any:
+    """Process-pool entry point: simulate one variation and return its summary
+
+    Returns None if the simulation fails. With `prune=(focus, day, threshold)` the run stops
+    and returns PRUNED when its `focus` score at `day` is below `threshold`, which the parent
+    fixes before the sweep starts.
+    """
+    pruned = False
+    
+    def checkpoint(day: int, simulator: AdvancedFYNDRSimulator) -> bool:
+        nonlocal pruned
+        focus, prune_day, threshold = prune
+        if day != prune_day:
+            return False
+        pruned = OKROptimizedAnalyzerV2.calculate_target_score(simulator.get_economy_summary(), focus) < threshold
+        return pruned
+    
+    try:
+        simulator = pooled_simulator(AdvancedGameConfig(**config_dict), seed=seed)
+        simulator.run_simulation(days, progress_callback=checkpoint if prune else None)
+        return PRUNED if pruned else simulator.get_economy_summary()
+    except Exception as e:
+        print(f"Error in simulation: {e}")
+        return None
+
 def main():
     """Main function to run V2 OKR-optimized analysis"""
     parser = argparse.ArgumentParser(description='OKR-Optimized FYNDR Economy Analyzer V2')
@@ -876,6 +1226,24 @@ def main():
                        help='Number of days to simulate')
     parser.add_argument('--iterations', type=int, default=1, 
                        help='Number of iterations to run (each iteration runs all 4 phases)')
+    parser.add_argument('--processes', type=int, default=None,
+                       help='Worker processes for each phase sweep (default: all cores)')
+    parser.add_argument('--prune-day', type=int, default=30,
+                       help='Day at which clearly bad variations are checked for pruning')
+    parser.add_argument('--prune-fraction', type=float, default=0.3,
+                       help="Prune variations scoring below this fraction of the phase base config's checkpoint score (0 = off)")
+    parser.add_argument('--n-calls', type=int, default=40,
+                       help='Simulations per Bayesian phase search when scikit-optimize is installed (0 = grid)')
+    parser.add_argument('--patience', type=int, default=10,
+                       help='Stop a Bayesian phase search once its best score has been flat for this many simulations (0 = off)')
+    parser.add_argument('--plateau-rel-tol', type=float, default=0.001,
+                       help='Relative std of the recent best scores below which a Bayesian phase search counts as flat')
+    parser.add_argument('--cache-dir', type=str, default=os.path.join('.cache', 'simulations'),
+                       help="Directory caching simulation summaries between runs ('' = memory only)")
+    parser.add_argument('--sim-cache-size', type=int, default=5000,
+                       help='Simulation summaries kept in memory (least recently used are dropped first)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print the outcome of every simulation')
     parser.add_argument('--prefix', type=str, default='okr_v2_optimized', 
                        help='Prefix for output files')
     
@@ -888,7 +1256,11 @@ def main():
     print()
     
     # Create analyzer
-    analyzer = OKROptimizedAnalyzerV2()
+    analyzer = OKROptimizedAnalyzerV2(processes=args.processes, prune_day=args.prune_day,
+                                      prune_fraction=args.prune_fraction, n_calls=args.n_calls,
+                                      cache_dir=args.cache_dir or None, verbose=args.verbose,
+                                      patience=args.patience, plateau_rel_tol=args.plateau_rel_tol,
+                                      sim_cache_size=args.sim_cache_size)
     
     # Run complete optimization
     results = analyzer.run_complete_optimization(args.days, args.iterations)
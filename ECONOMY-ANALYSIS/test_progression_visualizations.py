@@ -7,7 +7,7 @@ parameter and score progression visualizations.
 """
 
 import json
-import random
+import numpy as np
 from visualization_engine import FYNDRVisualizationEngine
 
 def create_example_progression_data():
@@ -51,81 +51,85 @@ def create_example_progression_data():
         'event_bonus_multiplier': 1.5
     }
     
-    # Create 16 test configurations for each player type
+    # Create 16 test configurations for each player type, one array per parameter
+    test_num = np.arange(16)
+    rng = np.random.default_rng()
+    variations = {
+        # Whale-focused variations
+        'whale': {
+            'owner_base_points': 1.0 + (test_num * 0.5),  # 1.0 to 8.5
+            'pack_price_dollars': 0.5 + (test_num * 1.0),  # 0.5 to 15.5
+            'points_per_dollar': 200.0 - (test_num * 10.0),  # 200 to 50
+            'churn_probability_whale': 0.0001 + (test_num * 0.005),  # 0.0001 to 0.075
+            'geo_diversity_bonus': 1.0 + (test_num * 0.2),  # 1.0 to 4.0
+            'social_sneeze_bonus': 3.0 + (test_num * 0.3),  # 3.0 to 7.5
+        },
+        # Grinder-focused variations
+        'grinder': {
+            'owner_base_points': 1.5 + (test_num * 0.3),  # 1.5 to 6.0
+            'pack_price_dollars': 1.0 + (test_num * 0.8),  # 1.0 to 13.0
+            'geo_diversity_bonus': 1.0 + (test_num * 0.4),  # 1.0 to 7.0
+            'venue_variety_bonus': 1.0 + (test_num * 0.4),  # 1.0 to 7.0
+            'churn_probability_grinder': 0.0001 + (test_num * 0.004),  # 0.0001 to 0.06
+            'weekly_earn_cap': 500 + (test_num * 50),  # 500 to 1250
+        },
+        # Casual-focused variations
+        'casual': {
+            'owner_base_points': 1.0 + (test_num * 0.4),  # 1.0 to 7.0
+            'pack_price_dollars': 1.0 + (test_num * 0.6),  # 1.0 to 10.0
+            'social_sneeze_bonus': 3.0 + (test_num * 0.5),  # 3.0 to 10.5
+            'social_sneeze_cap': 1 + (test_num // 4),  # 1 to 4
+            'churn_probability_casual': 0.0001 + (test_num * 0.003),  # 0.0001 to 0.045
+            'new_player_bonus_multiplier': 2.0 + (test_num * 0.2),  # 2.0 to 5.0
+        },
+    }
+    
     all_results = []
     
-    for player_type in ['whale', 'grinder', 'casual']:
-        player_results = []
+    for player_type, varied in variations.items():
+        params = {name: np.full(len(test_num), value) for name, value in base_config.items()}
+        params.update(varied)
+        
+        # Generate realistic scores based on parameter values
+        if player_type == 'whale':
+            whale_scores = 400 + (params['owner_base_points'] * 20) - (params['churn_probability_whale'] * 10000)
+            grinder_scores = 200 + (params['geo_diversity_bonus'] * 30)
+            casual_scores = 100 + (params['social_sneeze_bonus'] * 20)
+        elif player_type == 'grinder':
+            whale_scores = 300 + (params['owner_base_points'] * 15)
+            grinder_scores = 500 + (params['geo_diversity_bonus'] * 50) + (params['venue_variety_bonus'] * 40)
+            casual_scores = 150 + (params['social_sneeze_bonus'] * 15)
+        else:  # casual
+            whale_scores = 250 + (params['owner_base_points'] * 10)
+            grinder_scores = 300 + (params['geo_diversity_bonus'] * 25)
+            casual_scores = 200 + (params['social_sneeze_bonus'] * 30) + (params['new_player_bonus_multiplier'] * 20)
+        
+        overall_scores = (whale_scores + grinder_scores + casual_scores) / 3
+        
+        # Generate realistic revenue and userbase
+        revenues = 1000 + (overall_scores * 2) + rng.uniform(-200, 200, len(test_num))
+        userbases = (300 + (overall_scores * 0.5) + rng.uniform(-50, 50, len(test_num))).astype(int)
+        purchases = (100 + (overall_scores * 0.3)).astype(int)
         
-        for test_num in range(16):
-            config = base_config.copy()
-            
-            # Vary key parameters based on player type
-            if player_type == 'whale':
-                # Whale-focused variations
-                config['owner_base_points'] = 1.0 + (test_num * 0.5)  # 1.0 to 8.5
-                config['pack_price_dollars'] = 0.5 + (test_num * 1.0)  # 0.5 to 15.5
-                config['points_per_dollar'] = 200.0 - (test_num * 10.0)  # 200 to 50
-                config['churn_probability_whale'] = 0.0001 + (test_num * 0.005)  # 0.0001 to 0.075
-                config['geo_diversity_bonus'] = 1.0 + (test_num * 0.2)  # 1.0 to 4.0
-                config['social_sneeze_bonus'] = 3.0 + (test_num * 0.3)  # 3.0 to 7.5
-                
-            elif player_type == 'grinder':
-                # Grinder-focused variations
-                config['owner_base_points'] = 1.5 + (test_num * 0.3)  # 1.5 to 6.0
-                config['pack_price_dollars'] = 1.0 + (test_num * 0.8)  # 1.0 to 13.0
-                config['geo_diversity_bonus'] = 1.0 + (test_num * 0.4)  # 1.0 to 7.0
-                config['venue_variety_bonus'] = 1.0 + (test_num * 0.4)  # 1.0 to 7.0
-                config['churn_probability_grinder'] = 0.0001 + (test_num * 0.004)  # 0.0001 to 0.06
-                config['weekly_earn_cap'] = 500 + (test_num * 50)  # 500 to 1250
-                
-            else:  # casual
-                # Casual-focused variations
-                config['owner_base_points'] = 1.0 + (test_num * 0.4)  # 1.0 to 7.0
-                config['pack_price_dollars'] = 1.0 + (test_num * 0.6)  # 1.0 to 10.0
-                config['social_sneeze_bonus'] = 3.0 + (test_num * 0.5)  # 3.0 to 10.5
-                config['social_sneeze_cap'] = 1 + (test_num // 4)  # 1 to 4
-                config['churn_probability_casual'] = 0.0001 + (test_num * 0.003)  # 0.0001 to 0.045
-                config['new_player_bonus_multiplier'] = 2.0 + (test_num * 0.2)  # 2.0 to 5.0
-            
-            # Generate realistic scores based on parameter values
-            if player_type == 'whale':
-                whale_score = 400 + (config['owner_base_points'] * 20) - (config['churn_probability_whale'] * 10000)
-                grinder_score = 200 + (config['geo_diversity_bonus'] * 30)
-                casual_score = 100 + (config['social_sneeze_bonus'] * 20)
-            elif player_type == 'grinder':
-                whale_score = 300 + (config['owner_base_points'] * 15)
-                grinder_score = 500 + (config['geo_diversity_bonus'] * 50) + (config['venue_variety_bonus'] * 40)
-                casual_score = 150 + (config['social_sneeze_bonus'] * 15)
-            else:  # casual
-                whale_score = 250 + (config['owner_base_points'] * 10)
-                grinder_score = 300 + (config['geo_diversity_bonus'] * 25)
-                casual_score = 200 + (config['social_sneeze_bonus'] * 30) + (config['new_player_bonus_multiplier'] * 20)
-            
-            overall_score = (whale_score + grinder_score + casual_score) / 3
-            
-            # Generate realistic revenue and userbase
-            revenue = 1000 + (overall_score * 2) + random.uniform(-200, 200)
-            userbase = 300 + (overall_score * 0.5) + random.uniform(-50, 50)
-            
-            result = {
+        configs = [dict(zip(params, row)) for row in zip(*(values.tolist() for values in params.values()))]
+        for config, whale_score, grinder_score, casual_score, overall_score, revenue, userbase, purchase_count in zip(
+                configs, whale_scores.tolist(), grinder_scores.tolist(), casual_scores.tolist(),
+                overall_scores.tolist(), revenues.tolist(), userbases.tolist(), purchases.tolist()):
+            all_results.append({
                 'config': config,
                 'summary': {
                     'total_revenue': revenue,
-                    'total_players': int(userbase),
-                    f'{player_type}_purchases': int(100 + (overall_score * 0.3))
+                    'total_players': userbase,
+                    f'{player_type}_purchases': purchase_count
                 },
                 'whale_score': whale_score,
                 'grinder_score': grinder_score,
                 'casual_score': casual_score,
                 'overall_score': overall_score,
                 'revenue': revenue,
-                'userbase': int(userbase),
+                'userbase': userbase,
                 'player_type_focus': player_type
-            }
-            
-            player_results.append(result)
-            all_results.append(result)
+            })
     
     return all_results
 
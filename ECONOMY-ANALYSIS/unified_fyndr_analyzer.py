@@ -21,25 +21,29 @@ Modes:
     optimize   - Run comprehensive optimization
     both       - Run both focused tests and optimization
     quick      - Run quick analysis with fewer combinations
+    check      - Check that successive halving keeping every combination matches a plain run
 """
 
 import sys
 import os
 import time
-import random
 import json
+import hashlib
+import heapq
 import csv
 import numpy as np
 from typing import List, Dict, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import multiprocessing as mp
-import statistics
-from collections import defaultdict, Counter
+from dataclasses import dataclass, asdict, replace
+from collections import OrderedDict
 import argparse
 
 # Import the advanced simulator
-from advanced_economy_simulator import AdvancedFYNDRSimulator, AdvancedGameConfig
+from advanced_economy_simulator import AdvancedGameConfig, available_cpus, run_parameter_sweep, SIMULATOR_VERSION
+
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
 
 @dataclass
 class FocusedTestResult:
@@ -61,6 +65,7 @@ class OptimizationResult:
     retention_score: float
     organic_purchase_score: float
     overall_score: float
+    days: int  # Simulated horizon; successive halving scores most combinations only over a shorter one
 
 @dataclass
 class ParameterRange:
@@ -74,10 +79,17 @@ class ParameterRange:
 class UnifiedFYNDRAnalyzer:
     """Unified analyzer combining all analysis capabilities"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = os.path.join('.cache', 'unified'), sim_cache_size: int = 5000):
         self.focused_results = []
         self.optimization_results = []
         self.parameter_ranges = self._define_parameter_ranges()
+        self._base_config = self.create_base_config()  # Focused tests derive their configs from it via replace()
+        # Summaries by simulation key, backed by one JSON file per key under cache_dir (None = memory only);
+        # memory holds the sim_cache_size most recently used. Keys include the simulator's source digest,
+        # so editing advanced_economy_simulator.py leaves earlier disk entries unused
+        self.cache_dir = cache_dir
+        self._sim_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()  # Least recently used first
+        self.sim_cache_size = sim_cache_size
     
     def _define_parameter_ranges(self) -> List[ParameterRange]:
         """Define comprehensive parameter ranges for optimization"""
@@ -105,7 +117,7 @@ class UnifiedFYNDRAnalyzer:
             ParameterRange("points_per_dollar", 50.0, 200.0, 25.0, "float"),
             
             # === PLAYER BEHAVIOR CAPS ===
-            ParameterRange("daily_scan_cap", 10, 30, 5, "int"),
+            # daily_scan_cap was removed from the simulator (replaced with per-sticker cooldown)
             ParameterRange("weekly_earn_cap", 300, 800, 100, "int"),
             ParameterRange("daily_passive_cap", 50, 200, 25, "int"),
             
@@ -121,9 +133,7 @@ class UnifiedFYNDRAnalyzer:
             ParameterRange("comeback_bonus_days", 2, 7, 1, "int"),
             ParameterRange("comeback_bonus_multiplier", 1.5, 3.0, 0.25, "float"),
             
-            # === STICKER DECAY ===
-            ParameterRange("sticker_decay_rate", 0.05, 0.2, 0.025, "float"),
-            ParameterRange("sticker_min_value", 0.05, 0.3, 0.05, "float"),
+            # Sticker decay was removed from the simulator
             
             # === NEW PLAYER ONBOARDING ===
             ParameterRange("new_player_bonus_days", 3, 14, 1, "int"),
@@ -168,8 +178,7 @@ class UnifiedFYNDRAnalyzer:
             pack_price_dollars=3.0,
             points_per_dollar=100.0,
             
-            # Player behavior caps (from spec)
-            daily_scan_cap=20,
+            # Player behavior caps (from spec; daily_scan_cap replaced with per-sticker cooldown)
             weekly_earn_cap=500,
             daily_passive_cap=100,
             
@@ -185,10 +194,6 @@ class UnifiedFYNDRAnalyzer:
             comeback_bonus_days=3,
             comeback_bonus_multiplier=2.0,
             
-            # Sticker decay (optimized)
-            sticker_decay_rate=0.1,
-            sticker_min_value=0.1,
-            
             # New player onboarding (optimized)
             new_player_bonus_days=7,
             new_player_bonus_multiplier=2.0,
@@ -240,8 +245,8 @@ class UnifiedFYNDRAnalyzer:
         overall_score = (growth_score * 0.4) + (retention_score * 0.3) + (organic_purchase_score * 0.3)
         return overall_score
     
-    def run_focused_analysis(self) -> List[FocusedTestResult]:
-        """Run focused parameter analysis on critical game mechanics"""
+    def run_focused_analysis(self, num_processes: int = None) -> List[FocusedTestResult]:
+        """Run focused parameter analysis on critical game mechanics, all tests on one process pool"""
         print("=" * 80)
         print("FOCUSED PARAMETER ANALYSIS")
         print("=" * 80)
@@ -258,14 +263,43 @@ class UnifiedFYNDRAnalyzer:
             self._test_diversity_bonuses,
             self._test_retention_mechanics,
             self._test_engagement_mechanics,
-            self._test_sticker_decay,
         ]
         
+        tests = []
         for test_func in test_categories:
-            print(f"Running {test_func.__name__}...")
-            category_results = test_func()
-            results.extend([r for r in category_results if r is not None])
-            print(f"  Completed: {len([r for r in category_results if r is not None])} tests")
+            category_tests = test_func()
+            tests.extend(category_tests)
+            print(f"Queued {test_func.__name__}: {len(category_tests)} tests")
+        
+        # Tests sharing a config (e.g. each category's base case) are simulated once
+        keys = [self.simulation_key(asdict(config), 270) for _, config in tests]
+        # Summaries are scored from this local map, not read back from the size-bounded cache
+        summaries_by_key = {}
+        pending = {}
+        for key, (_, config) in zip(keys, tests):
+            if key in summaries_by_key or key in pending:
+                continue
+            summary = self.cached_summary(key)
+            if summary is None:
+                pending[key] = config
+            else:
+                summaries_by_key[key] = summary
+        print(f"Simulating {len(pending)} of {len(tests)} tests ({len(tests) - len(pending)} cached or repeated)")
+        
+        # Every focused test runs 270 days from the simulator's default seed
+        summaries = run_parameter_sweep(list(pending.values()), days=270, seeds=[0] * len(pending),
+                                        max_workers=num_processes, return_exceptions=True)
+        for key, summary in zip(pending, summaries):
+            if not isinstance(summary, Exception):
+                self.store_summary(key, summary)
+            summaries_by_key[key] = summary
+        
+        for key, (test_name, config) in zip(keys, tests):
+            summary = summaries_by_key[key]
+            if isinstance(summary, Exception):
+                print(f"Error in test {test_name}: {summary}")
+                continue
+            results.append(self._score_focused_test(test_name, config, summary))
         
         # Sort by overall score
         results.sort(key=lambda x: x.overall_score, reverse=True)
@@ -277,9 +311,9 @@ class UnifiedFYNDRAnalyzer:
         
         return results
     
-    def _test_pack_pricing(self) -> List[FocusedTestResult]:
-        """Test different pack pricing strategies"""
-        results = []
+    def _test_pack_pricing(self) -> List[Tuple[str, AdvancedGameConfig]]:
+        """Pack pricing strategies to test, as (test name, config) pairs"""
+        tests = []
         
         pack_tests = [
             {"pack_price_dollars": 2.0, "pack_price_points": 200, "name": "Low Price, Low Points"},
@@ -292,20 +326,16 @@ class UnifiedFYNDRAnalyzer:
         ]
         
         for test_config in pack_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
+            overrides = {key: value for key, value in test_config.items() if key != "name"}
+            config = replace(self._base_config, **overrides)
             
-            result = self._run_single_focused_test(f"Pack Pricing: {test_config['name']}", config)
-            if result:
-                results.append(result)
+            tests.append((f"Pack Pricing: {test_config['name']}", config))
         
-        return results
+        return tests
     
-    def _test_scoring_mechanics(self) -> List[FocusedTestResult]:
-        """Test different scoring mechanics"""
-        results = []
+    def _test_scoring_mechanics(self) -> List[Tuple[str, AdvancedGameConfig]]:
+        """Scoring mechanics to test, as (test name, config) pairs"""
+        tests = []
         
         scoring_tests = [
             {"owner_base_points": 1.5, "scanner_base_points": 0.75, "name": "Low Base Scoring"},
@@ -318,20 +348,16 @@ class UnifiedFYNDRAnalyzer:
         ]
         
         for test_config in scoring_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
+            overrides = {key: value for key, value in test_config.items() if key != "name"}
+            config = replace(self._base_config, **overrides)
             
-            result = self._run_single_focused_test(f"Scoring: {test_config['name']}", config)
-            if result:
-                results.append(result)
+            tests.append((f"Scoring: {test_config['name']}", config))
         
-        return results
+        return tests
     
-    def _test_diversity_bonuses(self) -> List[FocusedTestResult]:
-        """Test different diversity bonus configurations"""
-        results = []
+    def _test_diversity_bonuses(self) -> List[Tuple[str, AdvancedGameConfig]]:
+        """Diversity bonus configurations to test, as (test name, config) pairs"""
+        tests = []
         
         diversity_tests = [
             {"geo_diversity_bonus": 0.5, "venue_variety_bonus": 0.5, "name": "Low Diversity Bonuses"},
@@ -345,20 +371,16 @@ class UnifiedFYNDRAnalyzer:
         ]
         
         for test_config in diversity_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
+            overrides = {key: value for key, value in test_config.items() if key != "name"}
+            config = replace(self._base_config, **overrides)
             
-            result = self._run_single_focused_test(f"Diversity: {test_config['name']}", config)
-            if result:
-                results.append(result)
+            tests.append((f"Diversity: {test_config['name']}", config))
         
-        return results
+        return tests
     
-    def _test_retention_mechanics(self) -> List[FocusedTestResult]:
-        """Test different retention mechanics"""
-        results = []
+    def _test_retention_mechanics(self) -> List[Tuple[str, AdvancedGameConfig]]:
+        """Retention mechanics to test, as (test name, config) pairs"""
+        tests = []
         
         retention_tests = [
             {"churn_probability_base": 0.0005, "churn_probability_casual": 0.001, "name": "Low Churn"},
@@ -373,25 +395,18 @@ class UnifiedFYNDRAnalyzer:
         ]
         
         for test_config in retention_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
+            overrides = {key: value for key, value in test_config.items() if key != "name"}
+            config = replace(self._base_config, **overrides)
             
-            result = self._run_single_focused_test(f"Retention: {test_config['name']}", config)
-            if result:
-                results.append(result)
+            tests.append((f"Retention: {test_config['name']}", config))
         
-        return results
+        return tests
     
-    def _test_engagement_mechanics(self) -> List[FocusedTestResult]:
-        """Test different engagement mechanics"""
-        results = []
+    def _test_engagement_mechanics(self) -> List[Tuple[str, AdvancedGameConfig]]:
+        """Engagement mechanics to test, as (test name, config) pairs"""
+        tests = []
         
         engagement_tests = [
-            {"daily_scan_cap": 10, "name": "Low Scan Cap"},
-            {"daily_scan_cap": 20, "name": "Base Scan Cap"},
-            {"daily_scan_cap": 30, "name": "High Scan Cap"},
             {"weekly_earn_cap": 300, "name": "Low Weekly Cap"},
             {"weekly_earn_cap": 500, "name": "Base Weekly Cap"},
             {"weekly_earn_cap": 800, "name": "High Weekly Cap"},
@@ -404,69 +419,41 @@ class UnifiedFYNDRAnalyzer:
         ]
         
         for test_config in engagement_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
+            overrides = {key: value for key, value in test_config.items() if key != "name"}
+            config = replace(self._base_config, **overrides)
             
-            result = self._run_single_focused_test(f"Engagement: {test_config['name']}", config)
-            if result:
-                results.append(result)
+            tests.append((f"Engagement: {test_config['name']}", config))
         
-        return results
+        return tests
     
-    def _test_sticker_decay(self) -> List[FocusedTestResult]:
-        """Test different sticker decay mechanics"""
-        results = []
-        
-        decay_tests = [
-            {"sticker_decay_rate": 0.05, "sticker_min_value": 0.2, "name": "Slow Decay, High Min"},
-            {"sticker_decay_rate": 0.1, "sticker_min_value": 0.1, "name": "Base Decay, Base Min"},
-            {"sticker_decay_rate": 0.15, "sticker_min_value": 0.05, "name": "Fast Decay, Low Min"},
-            {"sticker_decay_rate": 0.2, "sticker_min_value": 0.05, "name": "Very Fast Decay, Low Min"},
-        ]
-        
-        for test_config in decay_tests:
-            config = self.create_base_config()
-            for key, value in test_config.items():
-                if key != "name":
-                    setattr(config, key, value)
-            
-            result = self._run_single_focused_test(f"Decay: {test_config['name']}", config)
-            if result:
-                results.append(result)
-        
-        return results
-    
-    def _run_single_focused_test(self, test_name: str, config: AdvancedGameConfig) -> Optional[FocusedTestResult]:
-        """Run a single focused test with given configuration"""
-        try:
-            simulator = AdvancedFYNDRSimulator(config)
-            simulator.run_simulation(270)  # 270 days
-            summary = simulator.get_economy_summary()
-            
-            # Calculate scores
-            growth_score = self._calculate_growth_score(summary)
-            retention_score = self._calculate_retention_score(summary)
-            organic_purchase_score = self._calculate_organic_purchase_score(summary)
-            overall_score = self._calculate_overall_score(growth_score, retention_score, organic_purchase_score)
-            
-            return FocusedTestResult(
-                test_name=test_name,
-                config=config.__dict__,
-                summary=summary,
-                growth_score=growth_score,
-                retention_score=retention_score,
-                organic_purchase_score=organic_purchase_score,
-                overall_score=overall_score
-            )
-        except Exception as e:
-            print(f"Error in test {test_name}: {e}")
-            return None
+    def _score_focused_test(self, test_name: str, config: AdvancedGameConfig,
+                            summary: Dict[str, Any]) -> FocusedTestResult:
+        """Score a finished focused test simulation"""
+        growth_score = self._calculate_growth_score(summary)
+        retention_score = self._calculate_retention_score(summary)
+        organic_purchase_score = self._calculate_organic_purchase_score(summary)
+        overall_score = self._calculate_overall_score(growth_score, retention_score, organic_purchase_score)
+        
+        return FocusedTestResult(
+            test_name=test_name,
+            config=asdict(config),
+            summary=summary,
+            growth_score=growth_score,
+            retention_score=retention_score,
+            organic_purchase_score=organic_purchase_score,
+            overall_score=overall_score
+        )
     
     def run_optimization_analysis(self, max_combinations: int = 500, days: int = 270, 
-                                 num_processes: int = None) -> List[OptimizationResult]:
-        """Run comprehensive optimization analysis"""
+                                 num_processes: int = None, halving_days: Tuple[int, ...] = (60,),
+                                 keep_fraction: float = 1 / 3, seed: Optional[int] = None) -> List[OptimizationResult]:
+        """Run comprehensive optimization analysis
+
+        Successive halving: every combination is first simulated for halving_days[0] days, only
+        the top keep_fraction by overall score go on to the next horizon, and so on until the
+        survivors run the full `days`. Pass halving_days=() to simulate everything for `days`.
+        `seed` fixes the sampled combinations (None draws fresh ones on every run).
+        """
         print("=" * 80)
         print("COMPREHENSIVE OPTIMIZATION ANALYSIS")
         print("=" * 80)
@@ -474,67 +461,131 @@ class UnifiedFYNDRAnalyzer:
         print()
         
         if num_processes is None:
-            num_processes = min(mp.cpu_count(), 8)
+            num_processes = available_cpus()
         
         start_time = time.time()
         
         # Generate parameter combinations
-        combinations = self._generate_parameter_combinations(max_combinations)
+        combinations = self._generate_parameter_combinations(max_combinations, seed)
         print(f"Generated {len(combinations)} parameter combinations")
         print(f"Using {num_processes} processes")
         
-        # Run simulations in parallel
-        results = []
-        with ProcessPoolExecutor(max_workers=num_processes) as executor:
-            # Submit all jobs
-            future_to_config = {
-                executor.submit(self._run_single_optimization, config, days): config 
-                for config in combinations
-            }
-            
-            # Collect results
-            completed = 0
-            for future in as_completed(future_to_config):
-                result = future.result()
-                if result is not None:
-                    results.append(result)
-                
-                completed += 1
-                if completed % 50 == 0:
-                    print(f"Completed {completed}/{len(combinations)} simulations")
+        # Shorter horizons weed out weak combinations before the full-length runs; a longer
+        # run replays the shorter one exactly (same seed), so survivors simply start over
+        horizons = sorted(d for d in set(halving_days) if 0 < d < days) + [days]
+        all_results = []
+        for horizon in horizons:
+            results = self._run_optimization_round(combinations, horizon, num_processes)
+            all_results.extend(results)
+            if horizon < days:
+                keep = max(1, int(len(results) * keep_fraction))
+                combinations = [result.config for result in heapq.nlargest(keep, results, key=lambda x: x.overall_score)]
+                print(f"Day {horizon}: kept the top {len(combinations)} of {len(results)} combinations")
         
         # Sort by overall score
         results.sort(key=lambda x: x.overall_score, reverse=True)
-        self.optimization_results = results
+        # Every round's results stay, tagged with their horizon, so the parameter analysis and the
+        # exports also see the combinations screened out early: full-length survivors first
+        all_results.sort(key=lambda x: (x.days, x.overall_score), reverse=True)
+        self.optimization_results = all_results
         
         end_time = time.time()
         print(f"\nOptimization analysis completed in {end_time - start_time:.2f} seconds")
-        print(f"Successful simulations: {len(results)}")
+        print(f"Combinations tested: {sum(result.days == horizons[0] for result in all_results)}")
+        print(f"Survivors simulated for {days} days: {len(results)}")
         
         return results
     
-    def _generate_parameter_combinations(self, max_combinations: int) -> List[Dict[str, Any]]:
-        """Generate parameter combinations for testing"""
-        combinations = []
+    def check_halving(self, max_combinations: int = 12, days: int = 20, halving_days: Tuple[int, ...] = (5,),
+                      num_processes: int = 1) -> bool:
+        """Deterministic check that successive halving keeping every combination changes nothing
+
+        With keep_fraction=1.0 all combinations survive each horizon, so the full-length results
+        must match a run without halving exactly: same configs, same order, same summaries.
+        Both runs simulate from scratch: the check uses and leaves an empty memory-only cache.
+        """
+        cache_dir, self.cache_dir = self.cache_dir, None
+        try:
+            self._sim_cache.clear()
+            halved = self.run_optimization_analysis(max_combinations, days, num_processes, halving_days,
+                                                    keep_fraction=1.0, seed=0)
+            self._sim_cache.clear()
+            plain = self.run_optimization_analysis(max_combinations, days, num_processes, halving_days=(), seed=0)
+        finally:
+            self.cache_dir = cache_dir
+            self._sim_cache.clear()
+        matches = [(r.config, r.summary, r.overall_score, r.days) for r in halved] == \
+                  [(r.config, r.summary, r.overall_score, r.days) for r in plain]
+        print(f"Halving check: {'passed' if matches else 'FAILED'} ({len(plain)} combinations, "
+              f"halving at {', '.join(map(str, halving_days))} of {days} days)")
+        return matches
+    
+    def _run_optimization_round(self, combinations: List[Dict[str, Any]], days: int,
+                                num_processes: int) -> List[OptimizationResult]:
+        """Score every distinct combination over `days`, reusing cached simulations and running the rest in parallel"""
+        unique = {}
+        for config in combinations:
+            unique.setdefault(self.simulation_key(config, days), config)
+        if len(unique) < len(combinations):
+            print(f"Skipped {len(combinations) - len(unique)} duplicate combinations")
         
-        # Generate random combinations within the defined ranges
-        for _ in range(max_combinations):
-            config = {}
-            
-            for param_range in self.parameter_ranges:
-                if param_range.param_type == "float":
-                    value = random.uniform(param_range.min_value, param_range.max_value)
-                    # Round to step precision
-                    value = round(value / param_range.step) * param_range.step
-                elif param_range.param_type == "int":
-                    value = random.randint(
-                        int(param_range.min_value), 
-                        int(param_range.max_value)
-                    )
-                else:  # list
-                    value = param_range.min_value  # Default for now
-                
-                config[param_range.name] = value
+        results = []
+        pending = {}
+        for key, config in unique.items():
+            summary = self.cached_summary(key)
+            if summary is not None:
+                results.append(self._score_optimization(config, summary, days))
+            else:
+                pending[key] = config
+        if results:
+            print(f"Reused {len(results)} cached simulations")
+        
+        # Run the remaining simulations in parallel, in a few chunks per worker to keep task overhead low
+        summaries = run_parameter_sweep(list(pending.values()), days=days, seeds=[0] * len(pending),
+                                        max_workers=num_processes, return_exceptions=True)
+        for (key, config), summary in zip(pending.items(), summaries):
+            if isinstance(summary, Exception):
+                print(f"Error in optimization simulation: {summary}")
+                continue
+            self.store_summary(key, summary)
+            results.append(self._score_optimization(config, summary, days))
+        
+        return results
+    
+    def _generate_parameter_combinations(self, max_combinations: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Generate parameter combinations for testing
+
+        Draws a scrambled Sobol sequence over all parameter ranges (uniform random draws without
+        scipy), so the combinations cover the space evenly, and snaps each value onto its range's steps.
+        Without a seed every run explores fresh combinations; the same seed yields the same
+        combinations, so a rerun finds them in the simulation cache.
+        """
+        if max_combinations <= 0:
+            return []
+        
+        names = [param_range.name for param_range in self.parameter_ranges]
+        low = np.array([param_range.min_value for param_range in self.parameter_ranges], dtype=np.float64)
+        high = np.array([param_range.max_value for param_range in self.parameter_ranges], dtype=np.float64)
+        step = np.array([param_range.step for param_range in self.parameter_ranges], dtype=np.float64)
+        is_int = [param_range.param_type == "int" for param_range in self.parameter_ranges]
+        # List parameters keep their minimum for now
+        is_list = np.array([param_range.param_type == "list" for param_range in self.parameter_ranges])
+        n_steps = np.where(is_list, 1, np.floor((high - low) / step + 1e-9).astype(np.int64) + 1)
+        
+        if qmc is not None:
+            # Sobol points are balanced in powers of two, so draw the next one up and trim
+            unit = qmc.Sobol(d=len(names), scramble=True, seed=seed).random_base2(int(np.ceil(np.log2(max_combinations))))
+            unit = unit[:max_combinations]
+        else:
+            unit = np.random.default_rng(seed).random((max_combinations, len(names)))
+        
+        # Each unit value picks one of its range's evenly weighted steps
+        step_index = np.minimum(np.floor(unit * n_steps), n_steps - 1)
+        values = np.round(low + step_index * step, 10)
+        
+        combinations = []
+        for row in values.tolist():
+            config = {name: int(value) if integer else value for name, value, integer in zip(names, row, is_int)}
             
             # Add fixed parameters
             config.update({
@@ -550,77 +601,114 @@ class UnifiedFYNDRAnalyzer:
         
         return combinations
     
-    def _run_single_optimization(self, config_dict: Dict[str, Any], days: int) -> Optional[OptimizationResult]:
-        """Run a single optimization simulation with given parameters"""
-        try:
-            # Create config from dictionary
-            config = AdvancedGameConfig(**config_dict)
-            
-            # Create and run simulator
-            simulator = AdvancedFYNDRSimulator(config)
-            simulator.run_simulation(days)
-            
-            # Get results
-            summary = simulator.get_economy_summary()
-            
-            # Calculate scores
-            growth_score = self._calculate_growth_score(summary)
-            retention_score = self._calculate_retention_score(summary)
-            organic_purchase_score = self._calculate_organic_purchase_score(summary)
-            overall_score = self._calculate_overall_score(growth_score, retention_score, organic_purchase_score)
-            
-            return OptimizationResult(
-                config=config_dict,
-                summary=summary,
-                growth_score=growth_score,
-                retention_score=retention_score,
-                organic_purchase_score=organic_purchase_score,
-                overall_score=overall_score
-            )
-            
-        except Exception as e:
-            print(f"Error in optimization simulation: {e}")
-            return None
+    def _score_optimization(self, config_dict: Dict[str, Any], summary: Dict[str, Any],
+                            days: int) -> OptimizationResult:
+        """Score a finished optimization simulation of `days` days"""
+        growth_score = self._calculate_growth_score(summary)
+        retention_score = self._calculate_retention_score(summary)
+        organic_purchase_score = self._calculate_organic_purchase_score(summary)
+        overall_score = self._calculate_overall_score(growth_score, retention_score, organic_purchase_score)
+        
+        return OptimizationResult(
+            config=config_dict,
+            summary=summary,
+            growth_score=growth_score,
+            retention_score=retention_score,
+            organic_purchase_score=organic_purchase_score,
+            overall_score=overall_score,
+            days=days
+        )
     
-    def get_parameter_analysis(self) -> Dict[str, Dict[str, float]]:
-        """Analyze which parameters have the most impact on scores"""
+    @staticmethod
+    def simulation_key(config_dict: Dict[str, Any], days: int) -> str:
+        """Stable digest of a config's parameter values, the simulated day count and the simulator source"""
+        payload = json.dumps({'config': config_dict, 'days': days, 'simulator': SIMULATOR_VERSION},
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def cached_summary(self, key: str) -> Optional[Dict[str, Any]]:
+        """Summary of an earlier simulation with this key, from memory or the disk cache"""
+        summary = self._sim_cache.get(key)
+        if summary is not None:
+            self._sim_cache.move_to_end(key)
+        elif self.cache_dir:
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            if os.path.exists(path):
+                with open(path) as f:
+                    summary = json.load(f)
+                self.remember_summary(key, summary)
+        return summary
+    
+    def remember_summary(self, key: str, summary: Dict[str, Any]):
+        """Add a summary to the in-memory cache, evicting the least recently used past sim_cache_size"""
+        self._sim_cache[key] = summary
+        self._sim_cache.move_to_end(key)
+        while len(self._sim_cache) > self.sim_cache_size:
+            self._sim_cache.popitem(last=False)
+    
+    def store_summary(self, key: str, summary: Dict[str, Any]):
+        """Remember a finished summary and persist it so later analyzer runs can reuse it"""
+        self.remember_summary(key, summary)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, f"{key}.json"), 'w') as f:
+                json.dump(summary, f)
+    
+    def screening_results(self) -> List[OptimizationResult]:
+        """Results of the first (shortest) optimization round, which scored every combination over the same horizon"""
+        if not self.optimization_results:
+            return []
+        first_days = min(result.days for result in self.optimization_results)
+        return [result for result in self.optimization_results if result.days == first_days]
+    
+    def survivor_results(self) -> List[OptimizationResult]:
+        """Results of the combinations simulated for the full horizon, best first"""
         if not self.optimization_results:
+            return []
+        full_days = max(result.days for result in self.optimization_results)
+        return [result for result in self.optimization_results if result.days == full_days]
+    
+    def get_parameter_analysis(self) -> Dict[str, Dict[str, float]]:
+        """Analyze which parameters have the most impact on scores
+
+        Uses the first optimization round only: it covers every combination, whereas the later
+        rounds hold just the survivors of the earlier ones and would bias the correlations.
+        """
+        results = self.screening_results()
+        if not results:
             return {}
         
-        # Group results by parameter values
-        param_analysis = defaultdict(list)
-        
-        for result in self.optimization_results:
-            for param_name, param_value in result.config.items():
-                if isinstance(param_value, (int, float)):
-                    param_analysis[param_name].append({
-                        'value': param_value,
-                        'overall_score': result.overall_score,
-                        'growth_score': result.growth_score,
-                        'retention_score': result.retention_score,
-                        'organic_purchase_score': result.organic_purchase_score
-                    })
-        
-        # Calculate statistics for each parameter
+        # One row per result, one column per numeric config parameter
+        param_names = [name for name, value in results[0].config.items()
+                       if isinstance(value, (int, float))]
+        if len(results) < 10 or not param_names:  # Too few samples
+            return {}
+        values = np.array([[result.config[name] for name in param_names] for result in results],
+                          dtype=np.float64)
+        scores = np.array([result.overall_score for result in results], dtype=np.float64)
+        
+        # Correlation between each parameter's values and the overall score, all columns in one product
+        centered = values - values.mean(axis=0)
+        centered_scores = scores - scores.mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlations = (centered.T @ centered_scores) / (np.linalg.norm(centered, axis=0) * np.linalg.norm(centered_scores))
+        min_values, max_values, mean_values = values.min(axis=0), values.max(axis=0), values.mean(axis=0)
+        correlations = np.where(max_values > min_values, correlations, 0.0)
+        
+        mean_score = float(scores.mean())
+        std_score = float(scores.std(ddof=1))
         analysis = {}
-        for param_name, values in param_analysis.items():
-            if len(values) < 10:  # Skip parameters with too few samples
-                continue
-                
-            scores = [v['overall_score'] for v in values]
-            param_values = [v['value'] for v in values]
-            
-            # Calculate correlation between parameter value and overall score
-            correlation = np.corrcoef(param_values, scores)[0, 1] if len(set(param_values)) > 1 else 0
-            
+        for i, param_name in enumerate(param_names):
+            as_value = int if isinstance(results[0].config[param_name], int) else float
             analysis[param_name] = {
-                'correlation': correlation,
-                'mean_score': statistics.mean(scores),
-                'std_score': statistics.stdev(scores) if len(scores) > 1 else 0,
-                'min_value': min(param_values),
-                'max_value': max(param_values),
-                'mean_value': statistics.mean(param_values),
-                'samples': len(values)
+                'correlation': float(correlations[i]),
+                'mean_score': mean_score,
+                'std_score': std_score,
+                'min_value': as_value(min_values[i]),
+                'max_value': as_value(max_values[i]),
+                'mean_value': float(mean_values[i]),
+                'samples': len(scores),
+                'days': results[0].days
             }
         
         return analysis
@@ -661,8 +749,11 @@ class UnifiedFYNDRAnalyzer:
             print("-" * 50)
             
             # Top 5 results
-            top_results = self.optimization_results[:5]
-            print(f"\nTop 5 Configurations (out of {len(self.optimization_results)} tested):")
+            survivors = self.survivor_results()
+            top_results = survivors[:5]
+            print(f"\nCombinations tested: {len(self.screening_results())}")
+            print(f"Survivors simulated for {survivors[0].days} days: {len(survivors)}")
+            print(f"\nTop 5 Configurations (out of {len(survivors)} survivors):")
             
             for i, result in enumerate(top_results, 1):
                 print(f"\n{i}. Overall Score: {result.overall_score:.2f}")
@@ -681,7 +772,8 @@ class UnifiedFYNDRAnalyzer:
                 # Sort by absolute correlation
                 sorted_params = sorted(analysis.items(), key=lambda x: abs(x[1]['correlation']), reverse=True)
                 
-                print("\nTop 15 Most Impactful Parameters:")
+                sample = next(iter(analysis.values()))
+                print(f"\nTop 15 Most Impactful Parameters (all {sample['samples']} combinations at day {sample['days']}):")
                 for param_name, stats in sorted_params[:15]:
                     print(f"{param_name}:")
                     print(f"  Correlation: {stats['correlation']:.3f}")
@@ -723,14 +815,9 @@ class UnifiedFYNDRAnalyzer:
         print("  • New Player Bonus Multiplier: 1.8 - 2.5 (optimal: 2.0)")
         
         print("\n📊 PLAYER BEHAVIOR CAPS:")
-        print("  • Daily Scan Cap: 15 - 25 (optimal: 20)")
         print("  • Weekly Earn Cap: 400 - 600 (optimal: 500)")
         print("  • Daily Passive Cap: 75 - 125 (optimal: 100)")
         
-        print("\n🎨 STICKER DECAY:")
-        print("  • Decay Rate: 0.08 - 0.12 (optimal: 0.10)")
-        print("  • Minimum Value: 0.08 - 0.15 (optimal: 0.10)")
-        
         print("\n🎉 SEASONAL EVENTS:")
         print("  • Event Frequency: 21 - 35 days (optimal: 30 days)")
         print("  • Event Duration: 5 - 10 days (optimal: 7 days)")
@@ -806,7 +893,8 @@ class UnifiedFYNDRAnalyzer:
                     'growth_score': result.growth_score,
                     'retention_score': result.retention_score,
                     'organic_purchase_score': result.organic_purchase_score,
-                    'overall_score': result.overall_score
+                    'overall_score': result.overall_score,
+                    'days': result.days
                 }
                 for result in self.optimization_results
             ],
@@ -821,7 +909,7 @@ class UnifiedFYNDRAnalyzer:
             writer = csv.writer(f)
             
             # Write header
-            header = ['overall_score', 'growth_score', 'retention_score', 'organic_purchase_score']
+            header = ['days', 'overall_score', 'growth_score', 'retention_score', 'organic_purchase_score']
             if self.optimization_results:
                 header.extend(self.optimization_results[0].config.keys())
             writer.writerow(header)
@@ -829,6 +917,7 @@ class UnifiedFYNDRAnalyzer:
             # Write data
             for result in self.optimization_results:
                 row = [
+                    result.days,
                     result.overall_score,
                     result.growth_score,
                     result.retention_score,
@@ -842,7 +931,7 @@ class UnifiedFYNDRAnalyzer:
 def main():
     """Main function to run the unified analyzer"""
     parser = argparse.ArgumentParser(description='Unified FYNDR Economy Analyzer')
-    parser.add_argument('--mode', choices=['focused', 'optimize', 'both', 'quick'], 
+    parser.add_argument('--mode', choices=['focused', 'optimize', 'both', 'quick', 'check'], 
                        default='both', help='Analysis mode to run')
     parser.add_argument('--combinations', type=int, default=500, 
                        help='Number of parameter combinations for optimization')
@@ -852,6 +941,17 @@ def main():
                        help='Number of parallel processes to use')
     parser.add_argument('--prefix', type=str, default='unified_analysis', 
                        help='Prefix for output files')
+    parser.add_argument('--halving-days', type=int, nargs='*', default=[60],
+                       help='Shorter horizons for successive halving in optimization (none = every combination runs all days)')
+    parser.add_argument('--keep-fraction', type=float, default=1 / 3,
+                       help='Fraction of combinations kept at each successive halving horizon')
+    parser.add_argument('--cache-dir', type=str, default=os.path.join('.cache', 'unified'),
+                       help="Directory caching simulation summaries between runs ('' = memory only)")
+    parser.add_argument('--sim-cache-size', type=int, default=5000,
+                       help='Simulation summaries kept in memory (least recently used are dropped first)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Seed for the sampled parameter combinations (default: fresh draws each run; '
+                            'fix it, e.g. 0, to replay the same combinations from the cache)')
     
     args = parser.parse_args()
     
@@ -864,19 +964,24 @@ def main():
     print()
     
     # Create analyzer
-    analyzer = UnifiedFYNDRAnalyzer()
+    analyzer = UnifiedFYNDRAnalyzer(cache_dir=args.cache_dir or None, sim_cache_size=args.sim_cache_size)
     
     # Run analysis based on mode
-    if args.mode == 'focused':
-        analyzer.run_focused_analysis()
+    if args.mode == 'check':
+        sys.exit(0 if analyzer.check_halving(num_processes=args.processes or 1) else 1)
+    elif args.mode == 'focused':
+        analyzer.run_focused_analysis(args.processes)
     elif args.mode == 'optimize':
-        analyzer.run_optimization_analysis(args.combinations, args.days, args.processes)
+        analyzer.run_optimization_analysis(args.combinations, args.days, args.processes,
+                                           args.halving_days, args.keep_fraction, args.seed)
     elif args.mode == 'both':
-        analyzer.run_focused_analysis()
-        analyzer.run_optimization_analysis(args.combinations, args.days, args.processes)
+        analyzer.run_focused_analysis(args.processes)
+        analyzer.run_optimization_analysis(args.combinations, args.days, args.processes,
+                                           args.halving_days, args.keep_fraction, args.seed)
     elif args.mode == 'quick':
-        analyzer.run_focused_analysis()
-        analyzer.run_optimization_analysis(100, args.days, args.processes)  # Quick with fewer combinations
+        analyzer.run_focused_analysis(args.processes)
+        analyzer.run_optimization_analysis(100, args.days, args.processes,
+                                           args.halving_days, args.keep_fraction, args.seed)  # Quick with fewer combinations
     
     # Print comprehensive report
     analyzer.print_comprehensive_report()
@@ -15,6 +15,20 @@ from typing import List, Dict, Any, Tuple
 import os
 from dataclasses import asdict
 
+# Per-simulation result fields plotted by the progression charts
+PROGRESSION_SCORE_KEYS = ('whale_score', 'grinder_score', 'casual_score', 'overall_score', 'revenue', 'userbase')
+
+def simulation_frame(all_simulation_results: List[Dict]) -> pd.DataFrame:
+    """One row per simulation: its focus, score fields and numeric config parameters as 'config.<name>' columns"""
+    frame = pd.DataFrame({
+        'player_type_focus': [result.get('player_type_focus') or 'unknown' for result in all_simulation_results],
+        **{key: [result.get(key, 0) for result in all_simulation_results] for key in PROGRESSION_SCORE_KEYS}
+    })
+    configs = pd.DataFrame([result.get('config', {}) for result in all_simulation_results])
+    configs = configs[[name for name in configs.columns
+                       if pd.api.types.is_numeric_dtype(configs[name]) and not pd.api.types.is_bool_dtype(configs[name])]]
+    return pd.concat([frame, configs.fillna(0).add_prefix('config.')], axis=1)
+
 class FYNDRVisualizationEngine:
     """Comprehensive visualization engine for FYNDR economy analysis"""
     
@@ -324,28 +338,15 @@ class FYNDRVisualizationEngine:
         
         return filename
     
-    def create_parameter_progression_plot(self, results_data: List[Dict], player_type: str) -> str:
+    def create_parameter_progression_plot(self, results_data: pd.DataFrame, player_type: str) -> str:
         """Create parameter progression plot showing how parameters change across test variations"""
-        if not results_data:
+        if results_data.empty:
             return None
             
-        # Extract all parameter values across tests
-        param_names = []
-        param_values = []
-        
-        # Get all unique parameter names from the first result
-        if results_data:
-            first_config = results_data[0].get('config', {})
-            param_names = [key for key, value in first_config.items() 
-                          if isinstance(value, (int, float)) and not isinstance(value, bool)]
-        
-        # Extract values for each parameter across all tests
-        for param_name in param_names:
-            values = []
-            for result in results_data:
-                config = result.get('config', {})
-                values.append(config.get(param_name, 0))
-            param_values.append(values)
+        # Each numeric config parameter is one column of values across all tests
+        param_columns = [column for column in results_data.columns if column.startswith('config.')]
+        param_names = [column[len('config.'):] for column in param_columns]
+        param_values = [results_data[column].to_numpy() for column in param_columns]
         
         # Create subplots for each parameter
         n_params = len(param_names)
@@ -395,20 +396,20 @@ class FYNDRVisualizationEngine:
         
         return filename
     
-    def create_score_progression_plot(self, results_data: List[Dict], player_type: str) -> str:
+    def create_score_progression_plot(self, results_data: pd.DataFrame, player_type: str) -> str:
         """Create score progression plot showing how scores change across test variations"""
-        if not results_data:
+        if results_data.empty:
             return None
             
         test_indices = list(range(1, len(results_data) + 1))
         
         # Extract scores
-        whale_scores = [r.get('whale_score', 0) for r in results_data]
-        grinder_scores = [r.get('grinder_score', 0) for r in results_data]
-        casual_scores = [r.get('casual_score', 0) for r in results_data]
-        overall_scores = [r.get('overall_score', 0) for r in results_data]
-        revenues = [r.get('revenue', 0) for r in results_data]
-        userbases = [r.get('userbase', 0) for r in results_data]
+        whale_scores = results_data['whale_score'].to_numpy()
+        grinder_scores = results_data['grinder_score'].to_numpy()
+        casual_scores = results_data['casual_score'].to_numpy()
+        overall_scores = results_data['overall_score'].to_numpy()
+        revenues = results_data['revenue'].to_numpy()
+        userbases = results_data['userbase'].to_numpy()
         
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
         axes = axes.flatten()
@@ -459,13 +460,13 @@ class FYNDRVisualizationEngine:
         axes[4].grid(True, alpha=0.3)
         
         # Plot 6: Best performing configuration
-        best_idx = overall_scores.index(max(overall_scores))
-        best_config = results_data[best_idx].get('config', {})
+        best_idx = int(np.argmax(overall_scores))
+        best_config = results_data.iloc[best_idx]
         
         # Show key parameters of best configuration
         key_params = ['owner_base_points', 'pack_price_dollars', 'geo_diversity_bonus', 
                      'social_sneeze_bonus', 'churn_probability_whale']
-        param_values = [best_config.get(param, 0) for param in key_params]
+        param_values = [best_config.get(f'config.{param}', 0) for param in key_params]
         param_labels = [param.replace('_', ' ').title() for param in key_params]
         
         bars = axes[5].bar(range(len(param_values)), param_values, alpha=0.7)
@@ -620,16 +621,11 @@ class FYNDRVisualizationEngine:
         all_simulation_results = results_data.get('all_simulation_results', [])
         
         if all_simulation_results:
-            # Group results by player type focus
-            player_results = {}
-            for result in all_simulation_results:
-                player_focus = result.get('player_type_focus', 'unknown')
-                if player_focus not in player_results:
-                    player_results[player_focus] = []
-                player_results[player_focus].append(result)
+            # Build the results table once, then group its rows by player type focus
+            player_results = simulation_frame(all_simulation_results).groupby('player_type_focus', sort=False)
             
             # Create progression plots for each player type
-            for player_type, results in player_results.items():
+            for player_type, results in player_results:
                 if len(results) > 1:  # Need multiple results to show progression
                     # Parameter progression plot
                     param_prog_file = self.create_parameter_progression_plot(results, player_type)